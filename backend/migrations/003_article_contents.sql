@@ -0,0 +1,25 @@
+-- Content-addressed storage for article text
+-- Articles built from the same grounding response share one content row
+
+CREATE TABLE IF NOT EXISTS press_monitor.article_contents (
+    content_hash CHAR(64) PRIMARY KEY,
+    content TEXT NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+ALTER TABLE press_monitor.press_articles
+    ADD COLUMN IF NOT EXISTS content_hash CHAR(64);
+
+CREATE INDEX IF NOT EXISTS idx_pm_articles_content_hash ON press_monitor.press_articles(content_hash);
+
+-- Move existing inline content into the content store
+INSERT INTO press_monitor.article_contents (content_hash, content)
+SELECT DISTINCT encode(sha256(convert_to(original_content, 'UTF8')), 'hex'), original_content
+FROM press_monitor.press_articles
+WHERE original_content IS NOT NULL
+ON CONFLICT (content_hash) DO NOTHING;
+
+UPDATE press_monitor.press_articles
+SET content_hash = encode(sha256(convert_to(original_content, 'UTF8')), 'hex'),
+    original_content = NULL
+WHERE original_content IS NOT NULL;
@@ -0,0 +1,13 @@
+-- Cache of grounding search results keyed by (language, normalized query, date window)
+
+CREATE TABLE IF NOT EXISTS press_monitor.search_cache (
+    cache_key CHAR(64) PRIMARY KEY,
+    language_code VARCHAR(10) NOT NULL,
+    query TEXT NOT NULL,
+    date_filter TEXT,
+    result JSONB NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    expires_at TIMESTAMP WITH TIME ZONE NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_pm_search_cache_expires ON press_monitor.search_cache(expires_at);
@@ -0,0 +1,14 @@
+-- Durable sentiment results keyed by (url, content key, model, prompt version)
+
+CREATE TABLE IF NOT EXISTS press_monitor.sentiment_cache (
+    url TEXT NOT NULL,
+    content_key CHAR(64) NOT NULL,
+    model VARCHAR(100) NOT NULL,
+    prompt_version VARCHAR(20) NOT NULL,
+    sentiment VARCHAR(20) NOT NULL,
+    sentiment_score FLOAT NOT NULL,
+    sentiment_explanation TEXT,
+    key_phrases JSONB DEFAULT '[]',
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    PRIMARY KEY (url, content_key, model, prompt_version)
+);
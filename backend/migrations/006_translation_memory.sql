@@ -0,0 +1,10 @@
+-- Translation memory keyed by (source language, content hash)
+
+CREATE TABLE IF NOT EXISTS press_monitor.translation_memory (
+    source_language VARCHAR(10) NOT NULL,
+    content_hash CHAR(64) NOT NULL,
+    translated_text TEXT NOT NULL,
+    model VARCHAR(100),
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    PRIMARY KEY (source_language, content_hash)
+);
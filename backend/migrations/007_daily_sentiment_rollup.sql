@@ -0,0 +1,35 @@
+-- Daily sentiment counts per country, region and language
+-- Kept in step with press_articles by the article writer, analytics read this instead of raw rows
+-- Missing countries and regions are stored as '' so they can be part of the key
+
+CREATE TABLE IF NOT EXISTS press_monitor.daily_sentiment_rollup (
+    day DATE NOT NULL,
+    source_country TEXT NOT NULL DEFAULT '',
+    region TEXT NOT NULL DEFAULT '',
+    source_language VARCHAR(10) NOT NULL,
+    sentiment VARCHAR(20) NOT NULL,
+    article_count INTEGER NOT NULL DEFAULT 0,
+    score_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, source_country, region, source_language, sentiment)
+);
+
+CREATE INDEX IF NOT EXISTS idx_pm_rollup_country_day ON press_monitor.daily_sentiment_rollup(source_country, day);
+CREATE INDEX IF NOT EXISTS idx_pm_rollup_region_day ON press_monitor.daily_sentiment_rollup(region, day);
+
+-- Backfill from existing articles, recomputing so reruns of this migration are safe
+DELETE FROM press_monitor.daily_sentiment_rollup;
+
+INSERT INTO press_monitor.daily_sentiment_rollup (
+    day, source_country, region, source_language, sentiment, article_count, score_sum
+)
+SELECT
+    (published_date AT TIME ZONE 'UTC')::date,
+    COALESCE(source_country, ''),
+    COALESCE(region, ''),
+    source_language,
+    sentiment,
+    COUNT(*),
+    COALESCE(SUM(sentiment_score), 0)
+FROM press_monitor.press_articles
+WHERE published_date IS NOT NULL AND sentiment IS NOT NULL
+GROUP BY 1, 2, 3, 4, 5;
@@ -0,0 +1,11 @@
+-- Indexes matching the keyset order of streamed historical reads
+-- (published_date DESC, url DESC), filtered by country or region
+
+CREATE INDEX IF NOT EXISTS idx_pm_articles_country_published_url
+    ON press_monitor.press_articles(source_country, published_date DESC, url DESC);
+
+CREATE INDEX IF NOT EXISTS idx_pm_articles_region_published_url
+    ON press_monitor.press_articles(region, published_date DESC, url DESC);
+
+CREATE INDEX IF NOT EXISTS idx_pm_articles_published_url
+    ON press_monitor.press_articles(published_date DESC, url DESC);
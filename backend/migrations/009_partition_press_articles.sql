@@ -0,0 +1,116 @@
+-- Monthly range partitions of press_articles on published_date
+-- Articles without a known publication date are dated by when they were first saved,
+-- so the partition key is never null.
+--
+-- Two guarantees are lost here:
+-- * URL uniqueness. A unique index on a partitioned table must include the partition key,
+--   so the table is only unique on (url, published_date) and could hold one URL under two
+--   dates. Migration 011 restores global uniqueness with the article_urls lookup table.
+-- * The article_digest_mapping foreign key. It referenced press_articles(id), which is no
+--   longer unique on its own, so it is dropped below. Nothing checks article_id now.
+
+-- Create monthly partitions covering from_month through to_month, returning how many were added.
+-- A month whose rows already sit in the default partition is skipped with a notice.
+CREATE OR REPLACE FUNCTION press_monitor.ensure_article_partitions(from_month DATE, to_month DATE)
+RETURNS INTEGER AS $$
+DECLARE
+    month_start DATE := date_trunc('month', from_month)::date;
+    partition_name TEXT;
+    created INTEGER := 0;
+BEGIN
+    WHILE month_start <= to_month LOOP
+        partition_name := 'press_articles_p' || to_char(month_start, 'YYYY_MM');
+        IF to_regclass('press_monitor.' || partition_name) IS NULL THEN
+            BEGIN
+                EXECUTE format(
+                    'CREATE TABLE press_monitor.%I PARTITION OF press_monitor.press_articles FOR VALUES FROM (%L) TO (%L)',
+                    partition_name, month_start, (month_start + INTERVAL '1 month')::date
+                );
+                created := created + 1;
+            EXCEPTION WHEN check_violation THEN
+                RAISE NOTICE 'Skipping partition %: its rows are in the default partition', partition_name;
+            END;
+        END IF;
+        month_start := (month_start + INTERVAL '1 month')::date;
+    END LOOP;
+    RETURN created;
+END
+$$ LANGUAGE plpgsql;
+
+-- Convert the plain table, unless it is already partitioned
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = 'press_monitor' AND c.relname = 'press_articles' AND c.relkind = 'p'
+    ) THEN
+        RETURN;
+    END IF;
+
+    ALTER TABLE press_monitor.press_articles RENAME TO press_articles_unpartitioned;
+
+    CREATE TABLE press_monitor.press_articles (
+        LIKE press_monitor.press_articles_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS
+    ) PARTITION BY RANGE (published_date);
+
+    ALTER TABLE press_monitor.press_articles
+        ALTER COLUMN published_date SET DEFAULT NOW(),
+        ALTER COLUMN published_date SET NOT NULL;
+
+    CREATE TABLE press_monitor.press_articles_default
+        PARTITION OF press_monitor.press_articles DEFAULT;
+
+    -- Undated rows were left out of the sentiment rollup, count them under their new date
+    INSERT INTO press_monitor.daily_sentiment_rollup (
+        day, source_country, region, source_language, sentiment, article_count, score_sum
+    )
+    SELECT
+        (COALESCE(fetched_date, created_at, NOW()) AT TIME ZONE 'UTC')::date,
+        COALESCE(source_country, ''),
+        COALESCE(region, ''),
+        source_language,
+        sentiment,
+        COUNT(*),
+        COALESCE(SUM(sentiment_score), 0)
+    FROM press_monitor.press_articles_unpartitioned
+    WHERE published_date IS NULL AND sentiment IS NOT NULL
+    GROUP BY 1, 2, 3, 4, 5
+    ON CONFLICT (day, source_country, region, source_language, sentiment) DO UPDATE SET
+        article_count = daily_sentiment_rollup.article_count + EXCLUDED.article_count,
+        score_sum = daily_sentiment_rollup.score_sum + EXCLUDED.score_sum;
+
+    UPDATE press_monitor.press_articles_unpartitioned
+    SET published_date = COALESCE(fetched_date, created_at, NOW())
+    WHERE published_date IS NULL;
+
+    PERFORM press_monitor.ensure_article_partitions(
+        COALESCE((SELECT MIN(published_date) FROM press_monitor.press_articles_unpartitioned)::date, CURRENT_DATE),
+        (CURRENT_DATE + INTERVAL '3 months')::date
+    );
+
+    INSERT INTO press_monitor.press_articles
+    SELECT * FROM press_monitor.press_articles_unpartitioned;
+
+    -- Also drops the digest mapping foreign key, which cannot reference id alone any more
+    DROP TABLE press_monitor.press_articles_unpartitioned CASCADE;
+
+    ALTER TABLE press_monitor.press_articles
+        ADD CONSTRAINT press_articles_pkey PRIMARY KEY (id, published_date),
+        ADD CONSTRAINT press_articles_url_key UNIQUE (url, published_date);
+END
+$$;
+
+-- Indexes are created on every partition through the parent
+CREATE INDEX IF NOT EXISTS idx_pm_articles_sentiment ON press_monitor.press_articles(sentiment);
+CREATE INDEX IF NOT EXISTS idx_pm_articles_published ON press_monitor.press_articles(published_date DESC);
+CREATE INDEX IF NOT EXISTS idx_pm_articles_language ON press_monitor.press_articles(source_language);
+CREATE INDEX IF NOT EXISTS idx_pm_articles_country ON press_monitor.press_articles(source_country);
+CREATE INDEX IF NOT EXISTS idx_pm_articles_url ON press_monitor.press_articles(url);
+CREATE INDEX IF NOT EXISTS idx_pm_articles_content_hash ON press_monitor.press_articles(content_hash);
+CREATE INDEX IF NOT EXISTS idx_pm_articles_country_published_url
+    ON press_monitor.press_articles(source_country, published_date DESC, url DESC);
+CREATE INDEX IF NOT EXISTS idx_pm_articles_region_published_url
+    ON press_monitor.press_articles(region, published_date DESC, url DESC);
+CREATE INDEX IF NOT EXISTS idx_pm_articles_published_url
+    ON press_monitor.press_articles(published_date DESC, url DESC);
@@ -0,0 +1,13 @@
+-- Full-text search over articles
+-- Titles stay in their source language, so they are indexed without stemming ('simple').
+-- Summaries and translations are English and get English stemming.
+-- Queries match either form: websearch_to_tsquery('simple', q) || websearch_to_tsquery('english', q)
+
+ALTER TABLE press_monitor.press_articles
+    ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple'::regconfig, COALESCE(title, '')), 'A') ||
+        setweight(to_tsvector('english'::regconfig, COALESCE(summary, '')), 'B') ||
+        setweight(to_tsvector('english'::regconfig, left(COALESCE(translated_content, ''), 20000)), 'C')
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_pm_articles_search ON press_monitor.press_articles USING GIN (search_vector);
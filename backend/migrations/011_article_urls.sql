@@ -0,0 +1,71 @@
+-- One row per article URL, pinning the published_date its press_articles row is stored under.
+-- Since partitioning, press_articles can only be unique on (url, published_date): a unique
+-- index on a partitioned table must include the partition key. The foreign key below makes
+-- URLs globally unique again, because every row must match the single date of its URL here.
+
+CREATE TABLE IF NOT EXISTS press_monitor.article_urls (
+    url TEXT PRIMARY KEY,
+    published_date TIMESTAMP WITH TIME ZONE NOT NULL,
+    UNIQUE (url, published_date)
+);
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM pg_constraint
+        WHERE conname = 'press_articles_url_fkey'
+          AND conrelid = 'press_monitor.press_articles'::regclass
+    ) THEN
+        RETURN;
+    END IF;
+
+    -- Pin each URL to the earliest date it was stored under
+    INSERT INTO press_monitor.article_urls (url, published_date)
+    SELECT DISTINCT ON (url) url, published_date
+    FROM press_monitor.press_articles
+    ORDER BY url, published_date
+    ON CONFLICT (url) DO NOTHING;
+
+    -- Drop copies of a URL saved under another date, and take them out of the rollup
+    WITH removed AS (
+        DELETE FROM press_monitor.press_articles a
+        USING press_monitor.article_urls u
+        WHERE a.url = u.url AND a.published_date <> u.published_date
+        RETURNING a.published_date, a.source_country, a.region, a.source_language,
+                  a.sentiment, a.sentiment_score
+    ),
+    delta AS (
+        SELECT
+            (published_date AT TIME ZONE 'UTC')::date AS day,
+            COALESCE(source_country, '') AS source_country,
+            COALESCE(region, '') AS region,
+            source_language,
+            sentiment,
+            COUNT(*) AS article_count,
+            COALESCE(SUM(sentiment_score), 0) AS score_sum
+        FROM removed
+        WHERE sentiment IS NOT NULL
+        GROUP BY 1, 2, 3, 4, 5
+    )
+    UPDATE press_monitor.daily_sentiment_rollup r
+    SET article_count = r.article_count - delta.article_count,
+        score_sum = r.score_sum - delta.score_sum
+    FROM delta
+    WHERE r.day = delta.day
+      AND r.source_country = delta.source_country
+      AND r.region = delta.region
+      AND r.source_language = delta.source_language
+      AND r.sentiment = delta.sentiment;
+
+    DELETE FROM press_monitor.daily_sentiment_rollup WHERE article_count <= 0;
+
+    ALTER TABLE press_monitor.press_articles
+        ADD CONSTRAINT press_articles_url_fkey FOREIGN KEY (url, published_date)
+        REFERENCES press_monitor.article_urls (url, published_date) ON DELETE CASCADE;
+END
+$$;
+
+-- article_digest_mapping.article_id lost its foreign key in 009 and nothing checks it now.
+-- Clear mappings to articles that no longer exist, such as the copies removed above.
+DELETE FROM press_monitor.article_digest_mapping m
+WHERE NOT EXISTS (SELECT 1 FROM press_monitor.press_articles a WHERE a.id = m.article_id);
@@ -4,11 +4,38 @@
 import asyncio
 import asyncpg
 import os
+import re
 from pathlib import Path
 from dotenv import load_dotenv
 
 load_dotenv()
 
+
+def split_statements(sql):
+    """Split a migration on semicolons, keeping dollar-quoted function bodies whole"""
+    statements = []
+    current = ""
+    quote = None
+    for part in re.split(r"(\$[A-Za-z_]*\$)", sql):
+        if re.fullmatch(r"\$[A-Za-z_]*\$", part):
+            # Opening or closing tag of a dollar-quoted body
+            if quote is None:
+                quote = part
+            elif part == quote:
+                quote = None
+            current += part
+        elif quote is not None:
+            current += part
+        else:
+            chunks = part.split(';')
+            current += chunks[0]
+            for chunk in chunks[1:]:
+                statements.append(current)
+                current = chunk
+    statements.append(current)
+    return statements
+
+
 async def run_migrations():
     """Run all migration files"""
     
@@ -37,7 +64,7 @@ async def run_migrations():
             # Execute migration
             try:
                 # Split migration into individual statements if needed
-                statements = migration_sql.split(';')
+                statements = split_statements(migration_sql)
                 for statement in statements:
                     statement = statement.strip()
                     if statement:
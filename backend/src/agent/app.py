@@ -6,9 +6,25 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 import fastapi.exceptions
 import json
+from contextlib import asynccontextmanager
+
+from typing import Optional
+
+from .database import db_manager, search_articles
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the database pool once for the application's lifetime"""
+    await db_manager.initialize()
+    try:
+        yield
+    finally:
+        await db_manager.close()
+
 
 # Define the FastAPI app
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 # Add CORS middleware
 app.add_middleware(
@@ -58,7 +74,9 @@ async def run_press_monitor(request: Request):
         # Run through press monitoring
         state = State(
             messages=[HumanMessage(content=query)],
-            integrated_mode=False  # Standalone mode
+            integrated_mode=False,  # Standalone mode
+            # Per-request pipeline choice; omitted uses PRESS_MONITOR_STREAMING
+            press_monitor_streaming=options.get("streaming")
         )
         
         result = await press_monitor_node(state)
@@ -75,6 +93,33 @@ async def run_press_monitor(request: Request):
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/api/press-monitor/articles")
+async def search_press_articles(
+    q: Optional[str] = None,
+    country: Optional[str] = None,
+    language: Optional[str] = None,
+    sentiment: Optional[str] = None,
+    days_back: Optional[int] = None,
+    cursor: Optional[str] = None,
+    limit: int = 50
+):
+    """Search monitored articles by text, country, language and sentiment"""
+    try:
+        return await search_articles(
+            query=q,
+            country=country,
+            language=language,
+            sentiment=sentiment,
+            days_back=days_back,
+            cursor=cursor,
+            limit=limit
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        print(f"❌ Error searching articles: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.post("/api/research/stream")
 async def run_research_stream(request: Request):
     """Run research query with streaming updates"""
@@ -311,6 +356,12 @@ async def run_research(request: Request):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/api/health")
+async def health():
+    """Report database pool health"""
+    return {"database": await db_manager.health_check()}
+
+
 def create_frontend_router(build_dir="../frontend/dist"):
     """Creates a router to serve the React frontend.
 
@@ -0,0 +1,113 @@
+"""Content-level analysis run once per unique content blob"""
+
+import asyncio
+import os
+from typing import Any, Dict, List, Optional
+
+from langchain_google_genai import ChatGoogleGenerativeAI
+
+from .content_store import content_hash, get_article_content
+from .press_prompts import CONTENT_ANALYSIS_PROMPT
+from .tools_and_schemas import ContentAnalysis
+from .llm_clients import bind_structured_output
+from .lru import LRUCache
+from .rate_limiter import gemini_governor
+
+
+# Summaries, mentions and topics per unique content; off by default as it adds a call per content
+CONTENT_ANALYSIS_ENABLED = os.getenv("CONTENT_ANALYSIS_ENABLED", "false").lower() in ("1", "true", "yes")
+
+# Characters of content sent for analysis
+CONTENT_ANALYSIS_EXCERPT_CHARS = 3000
+
+# Content-level fields shared by every article built from the same text
+SHARED_CONTENT_FIELDS = ("summary", "mentions_context", "topics")
+
+
+# In-process memo of content analysis results keyed by content hash
+content_analysis_memo: LRUCache[str, Dict[str, Any]] = LRUCache(max_entries=5000)
+
+
+def group_by_content(articles: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Group articles by the content they were built from"""
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+    for article in articles:
+        key = article.get("content_hash")
+        if not key:
+            content = get_article_content(article)
+            if not content:
+                continue
+            key = content_hash(content)
+        groups.setdefault(key, []).append(article)
+    return groups
+
+
+async def analyze_content(
+    content: str,
+    language_name: str,
+    model: ChatGoogleGenerativeAI
+) -> Optional[Dict[str, Any]]:
+    """Extract summary, Azerbaijan mentions and topics from one text"""
+    prompt = CONTENT_ANALYSIS_PROMPT.format(
+        language_name=language_name,
+        content=content[:CONTENT_ANALYSIS_EXCERPT_CHARS]
+    )
+    try:
+        async with gemini_governor.slot():
+            response = await bind_structured_output(model, ContentAnalysis).ainvoke(prompt)
+    except Exception as e:
+        print(f"Error analyzing content: {e}")
+        return None
+
+    return {
+        "summary": response.summary,
+        "mentions_context": [
+            {"text": mention, "context": response.mention_context} for mention in response.mentions
+        ],
+        "topics": response.topics[:5]
+    }
+
+
+async def analyze_content_groups(
+    articles: List[Dict[str, Any]],
+    model: ChatGoogleGenerativeAI
+) -> List[Dict[str, Any]]:
+    """Run content-level analysis once per unique content and fan it out to every article
+
+    Headline- and URL-level attributes (sentiment, key phrases) stay per article.
+    """
+    groups = group_by_content([article for article in articles if not article.get("summary")])
+    if not groups:
+        return articles
+
+    results: Dict[str, Dict[str, Any]] = {}
+    missing = []
+    for key, members in groups.items():
+        cached = content_analysis_memo.get(key)
+        if cached is not None:
+            results[key] = cached
+        elif get_article_content(members[0]):
+            missing.append(key)
+
+    reused = len(results)
+    analyses = await asyncio.gather(*(
+        analyze_content(get_article_content(groups[key][0]), groups[key][0]["language_name"], model)
+        for key in missing
+    ))
+    for key, analysis in zip(missing, analyses):
+        if analysis is not None:
+            content_analysis_memo.set(key, analysis)
+            results[key] = analysis
+
+    for key, analysis in results.items():
+        for article in groups[key]:
+            for field in SHARED_CONTENT_FIELDS:
+                # Copy lists so per-article edits never leak across the group
+                value = analysis[field]
+                article[field] = list(value) if isinstance(value, list) else value
+
+    print(
+        f"🧩 Analyzed {len(missing)} unique contents for {sum(len(m) for m in groups.values())} articles "
+        f"({reused} reused)"
+    )
+    return articles
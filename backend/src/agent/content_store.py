@@ -0,0 +1,55 @@
+"""Content-addressed storage for grounding response text"""
+
+import hashlib
+from typing import Any, Dict, Optional
+
+from .lru import LRUCache
+
+
+def content_hash(text: str) -> str:
+    """Get the content address (SHA-256 hex digest) of a text"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ContentStore:
+    """In-process store of text blobs keyed by their content hash
+
+    Articles built from the same grounding response keep only the hash,
+    so each unique response text is held in memory exactly once.
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        self._blobs: LRUCache[str, str] = LRUCache(max_entries)
+
+    def put(self, text: str) -> str:
+        """Store a text blob and return its content hash"""
+        key = content_hash(text)
+        self._blobs.set(key, text)
+        return key
+
+    def get(self, key: Optional[str]) -> Optional[str]:
+        """Get a text blob by its content hash"""
+        if not key:
+            return None
+        return self._blobs.get(key)
+
+    def get_many(self, keys) -> Dict[str, str]:
+        """Get all known blobs for a collection of content hashes"""
+        return self._blobs.get_many(set(keys))
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._blobs
+
+    def __len__(self) -> int:
+        return len(self._blobs)
+
+
+# Global content store instance
+content_store = ContentStore()
+
+
+def get_article_content(article: Dict[str, Any]) -> str:
+    """Resolve the original content of an article from its content hash"""
+    if article.get("original_content"):
+        return article["original_content"]
+    return content_store.get(article.get("content_hash")) or ""
@@ -2,41 +2,194 @@
 
 import os
 import asyncio
+import base64
 import asyncpg
-from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
-import json
+from typing import List, Dict, Any, Optional, Tuple, AsyncIterator
+from datetime import datetime, timedelta, timezone
 from contextlib import asynccontextmanager
 
+from .content_store import content_store
+from .json_codecs import LazyRow, dumps, loads, register_json_codecs
+from .write_behind import WriteBehindQueue
+
 # Get database URL from environment
 DATABASE_URL = os.getenv("DATABASE_URL", "postgresql://localhost/pressmonitor")
 
+# Rows per keyset page of streamed reads
+DB_STREAM_PAGE_SIZE = int(os.getenv("DB_STREAM_PAGE_SIZE", "1000"))
+
+# Connection pool sizing and statement cache
+DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", "2"))
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", "10"))
+DB_COMMAND_TIMEOUT = float(os.getenv("DB_COMMAND_TIMEOUT", "10"))
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "256"))
+DB_MAX_INACTIVE_CONNECTION_LIFETIME = float(os.getenv("DB_MAX_INACTIVE_CONNECTION_LIFETIME", "300"))
+
+# Monthly press_articles partitions kept ready ahead of the current month
+DB_PARTITION_MONTHS_AHEAD = int(os.getenv("DB_PARTITION_MONTHS_AHEAD", "3"))
+
+# Hours an unreferenced content blob is kept before it is pruned. Blobs are
+# saved when a search returns, before dedup and filtering decide which of
+# their articles are kept.
+CONTENT_ORPHAN_GRACE_HOURS = float(os.getenv("CONTENT_ORPHAN_GRACE_HOURS", "24"))
+
+PRUNE_ORPHAN_CONTENTS_SQL = """
+    DELETE FROM press_monitor.article_contents c
+    WHERE c.created_at < NOW() - make_interval(secs => $1)
+      AND NOT EXISTS (
+          SELECT 1 FROM press_monitor.press_articles a
+          WHERE a.content_hash = c.content_hash
+      )
+"""
+
 
 class DatabaseManager:
-    """Manages database connections and operations"""
+    """Manages database connections and operations
+    
+    The pool is meant to live as long as the application (see the FastAPI
+    lifespan in app.py). Hot queries are module-level constants with only
+    bind parameters, so asyncpg's per-connection statement cache prepares
+    each of them once per connection.
+    """
     
     def __init__(self):
         self.pool = None
+        self._init_lock: Optional[asyncio.Lock] = None
+        self._init_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Month the article partitions were last rolled forward in
+        self._partitions_month: Optional[str] = None
+        # Day unreferenced content blobs were last pruned on
+        self._contents_pruned_day: Optional[str] = None
+        # Background writer for inserts that graph nodes should not wait on
+        self.writer = WriteBehindQueue()
     
-    async def initialize(self):
-        """Initialize connection pool"""
+    def _get_init_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._init_loop is not loop:
+            self._init_loop = loop
+            self._init_lock = asyncio.Lock()
+        return self._init_lock
+    
+    async def initialize(self) -> bool:
+        """Initialize connection pool, returning True if this call created it"""
+        async with self._get_init_lock():
+            if self.pool:
+                return False
+            try:
+                self.pool = await asyncpg.create_pool(
+                    DATABASE_URL,
+                    min_size=DB_POOL_MIN_SIZE,
+                    max_size=DB_POOL_MAX_SIZE,
+                    command_timeout=DB_COMMAND_TIMEOUT,
+                    timeout=10,
+                    statement_cache_size=DB_STATEMENT_CACHE_SIZE,
+                    max_inactive_connection_lifetime=DB_MAX_INACTIVE_CONNECTION_LIFETIME,
+                    init=register_json_codecs
+                )
+            except Exception as e:
+                print(f"⚠️ Database connection failed: {e}")
+                print("⚠️ Running without database - results won't be persisted")
+                self.pool = None
+                return False
+        await self.ensure_article_partitions()
+        return True
+    
+    async def ensure_article_partitions(
+        self,
+        months_ahead: int = DB_PARTITION_MONTHS_AHEAD,
+        from_month: Optional[datetime] = None
+    ) -> int:
+        """Create missing monthly press_articles partitions up to months ahead, returning how many"""
+        if not self.pool:
+            return 0
+        now = datetime.now(timezone.utc)
         try:
-            self.pool = await asyncpg.create_pool(
-                DATABASE_URL,
-                min_size=2,
-                max_size=5,
-                command_timeout=10,
-                timeout=10
+            created = await self.pool.fetchval(
+                """
+                SELECT press_monitor.ensure_article_partitions(
+                    $1::date, ($2::date + make_interval(months => $3))::date
+                )
+                """,
+                (from_month or now).date(), now.date(), months_ahead
             )
         except Exception as e:
-            print(f"⚠️ Database connection failed: {e}")
-            print("⚠️ Running without database - results won't be persisted")
-            self.pool = None
+            print(f"⚠️ Could not create article partitions: {e}")
+            return 0
+        self._partitions_month = now.strftime("%Y-%m")
+        if created:
+            print(f"🗂️ Created {created} press_articles partitions")
+        return created
+    
+    async def ensure_current_partitions(self) -> None:
+        """Roll partitions forward once a month in long-running processes"""
+        if self._partitions_month != datetime.now(timezone.utc).strftime("%Y-%m"):
+            await self.ensure_article_partitions()
+    
+    async def prune_orphan_contents(self, grace_hours: float = CONTENT_ORPHAN_GRACE_HOURS) -> int:
+        """Delete content blobs no article references once they are older than the grace period"""
+        if not self.pool:
+            return 0
+        try:
+            status = await self.pool.execute(PRUNE_ORPHAN_CONTENTS_SQL, grace_hours * 3600)
+        except Exception as e:
+            print(f"⚠️ Could not prune article contents: {e}")
+            return 0
+        self._contents_pruned_day = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        pruned = int(status.split()[-1])
+        if pruned:
+            print(f"🧹 Pruned {pruned} unreferenced article contents")
+        return pruned
+    
+    async def prune_contents_daily(self) -> None:
+        """Prune unreferenced content blobs once a day in long-running processes"""
+        if self._contents_pruned_day != datetime.now(timezone.utc).strftime("%Y-%m-%d"):
+            await self.prune_orphan_contents()
+    
+    async def get_article_partitions(self) -> List[Dict[str, Any]]:
+        """List press_articles partitions with their bounds and estimated row counts"""
+        if not self.pool:
+            return []
+        rows = await self.pool.fetch("""
+            SELECT c.relname AS name,
+                   pg_get_expr(c.relpartbound, c.oid) AS bounds,
+                   GREATEST(c.reltuples, 0)::bigint AS estimated_rows
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = 'press_monitor.press_articles'::regclass
+            ORDER BY c.relname
+        """)
+        return [dict(row) for row in rows]
+    
+    async def health_check(self) -> Dict[str, Any]:
+        """Check that the pool can run a query and report its usage"""
+        if not self.pool:
+            return {"status": "unavailable"}
+        try:
+            async with self.pool.acquire(timeout=5) as connection:
+                await connection.fetchval("SELECT 1")
+        except Exception as e:
+            return {"status": "error", "error": str(e)}
+        return {
+            "status": "ok",
+            "pool_size": self.pool.get_size(),
+            "pool_idle": self.pool.get_idle_size(),
+            "pool_max_size": self.pool.get_max_size(),
+            "write_queue": self.writer.snapshot()
+        }
     
     async def close(self):
-        """Close connection pool"""
+        """Drain pending writes, then close connection pool"""
         if self.pool:
+            await self.writer.drain()
             await self.pool.close()
+            self.pool = None
+    
+    async def enqueue_write(self, kind: str, item: Any, key: Optional[Any] = None) -> bool:
+        """Queue a write for the background writer, returning False without a database"""
+        if not self.pool:
+            return False
+        await self.writer.enqueue(kind, item, key)
+        return True
     
     @asynccontextmanager
     async def acquire(self):
@@ -52,54 +205,313 @@ class DatabaseManager:
 db_manager = DatabaseManager()
 
 
+# Columns copied into the per-transaction staging table for article saves
+ARTICLE_STAGING_COLUMNS = [
+    'ord', 'url', 'title', 'source_name', 'source_country', 'source_language',
+    'language_name', 'region', 'published_date', 'content_hash',
+    'translated_content', 'summary', 'sentiment', 'sentiment_score',
+    'sentiment_explanation', 'key_phrases', 'mentions_context', 'topics',
+    'sentiment_content_key', 'sentiment_model', 'sentiment_prompt_version'
+]
+
+CREATE_ARTICLE_STAGING_SQL = """
+    CREATE TEMP TABLE article_contents_staging (
+        content_hash TEXT,
+        content TEXT
+    ) ON COMMIT DROP;
+    CREATE TEMP TABLE press_articles_staging (
+        ord INTEGER,
+        url TEXT,
+        title TEXT,
+        source_name TEXT,
+        source_country TEXT,
+        source_language TEXT,
+        language_name TEXT,
+        region TEXT,
+        published_date TIMESTAMP WITH TIME ZONE,
+        content_hash TEXT,
+        translated_content TEXT,
+        summary TEXT,
+        sentiment TEXT,
+        sentiment_score FLOAT,
+        sentiment_explanation TEXT,
+        key_phrases TEXT,
+        mentions_context TEXT,
+        topics TEXT,
+        sentiment_content_key TEXT,
+        sentiment_model TEXT,
+        sentiment_prompt_version TEXT
+    ) ON COMMIT DROP
+"""
+
+# Merge the staged rows with one multi-statement execute. DISTINCT ON keeps the last copy of a
+# URL saved twice in one batch, since ON CONFLICT cannot touch a row twice. A re-saved article
+# refreshes its content columns, but empty values never overwrite stored ones.
+MERGE_ARTICLE_STAGING_SQL = """
+    INSERT INTO press_monitor.article_contents (content_hash, content)
+    SELECT DISTINCT ON (content_hash) content_hash, content
+    FROM article_contents_staging
+    ON CONFLICT (content_hash) DO NOTHING;
+
+    INSERT INTO press_monitor.article_urls (url, published_date)
+    SELECT DISTINCT ON (url) url, published_date
+    FROM press_articles_staging
+    ORDER BY url, ord DESC
+    ON CONFLICT (url) DO NOTHING;
+
+    INSERT INTO press_monitor.press_articles (
+        url, title, source_name, source_country, source_language,
+        language_name, region, published_date, content_hash,
+        translated_content, summary, sentiment, sentiment_score,
+        sentiment_explanation, key_phrases, mentions_context, topics
+    )
+    SELECT DISTINCT ON (url)
+        url, title, source_name, source_country, source_language,
+        language_name, region, published_date, content_hash,
+        translated_content, summary, sentiment, sentiment_score,
+        sentiment_explanation, key_phrases::jsonb, mentions_context::jsonb, topics::jsonb
+    FROM press_articles_staging
+    ORDER BY url, ord DESC
+    ON CONFLICT (url, published_date) DO UPDATE SET
+        content_hash = COALESCE(EXCLUDED.content_hash, press_articles.content_hash),
+        translated_content = COALESCE(EXCLUDED.translated_content, press_articles.translated_content),
+        summary = COALESCE(NULLIF(EXCLUDED.summary, ''), press_articles.summary),
+        sentiment = EXCLUDED.sentiment,
+        sentiment_score = EXCLUDED.sentiment_score,
+        sentiment_explanation = EXCLUDED.sentiment_explanation,
+        key_phrases = COALESCE(NULLIF(EXCLUDED.key_phrases, '[]'::jsonb), press_articles.key_phrases),
+        mentions_context = COALESCE(NULLIF(EXCLUDED.mentions_context, '[]'::jsonb), press_articles.mentions_context),
+        topics = COALESCE(NULLIF(EXCLUDED.topics, '[]'::jsonb), press_articles.topics),
+        fetched_date = NOW();
+
+    INSERT INTO press_monitor.sentiment_cache (
+        url, content_key, model, prompt_version, sentiment,
+        sentiment_score, sentiment_explanation, key_phrases
+    )
+    SELECT DISTINCT ON (url, sentiment_content_key, sentiment_model, sentiment_prompt_version)
+        url, sentiment_content_key, sentiment_model, sentiment_prompt_version, sentiment,
+        sentiment_score, sentiment_explanation, key_phrases::jsonb
+    FROM press_articles_staging
+    WHERE sentiment_prompt_version IS NOT NULL AND sentiment_content_key IS NOT NULL
+    ORDER BY url, sentiment_content_key, sentiment_model, sentiment_prompt_version, ord DESC
+    ON CONFLICT (url, content_key, model, prompt_version) DO UPDATE SET
+        sentiment = EXCLUDED.sentiment,
+        sentiment_score = EXCLUDED.sentiment_score,
+        sentiment_explanation = EXCLUDED.sentiment_explanation,
+        key_phrases = EXCLUDED.key_phrases,
+        created_at = NOW()
+"""
+
+# Serialize saves of the same URL. Without it, two transactions inserting the same new URL
+# both subtract nothing, and the second adds the row again after its merge turns into an update.
+# Locks are taken in key order so concurrent batches cannot deadlock on each other.
+LOCK_STAGED_URLS_SQL = """
+    SELECT pg_advisory_xact_lock(hashtext('press_monitor.press_articles'), key)
+    FROM (SELECT DISTINCT hashtext(url) AS key FROM press_articles_staging ORDER BY 1) keys
+"""
+
+# press_articles is partitioned on published_date and unique on (url, published_date).
+# article_urls pins each URL to one date, so a URL seen before keeps its stored date and
+# lands on the same row. Undated articles are dated by when they were first saved.
+RESOLVE_STAGED_PUBLISHED_DATE_SQL = """
+    UPDATE press_articles_staging s
+    SET published_date = u.published_date
+    FROM press_monitor.article_urls u
+    WHERE u.url = s.url;
+
+    UPDATE press_articles_staging
+    SET published_date = NOW()
+    WHERE published_date IS NULL
+"""
+
+# Staged URLs' rows in press_articles, grouped by the rollup key
+STAGED_ARTICLE_ROWS_SQL = """
+    SELECT published_date, source_country, region, source_language, sentiment, sentiment_score
+    FROM press_monitor.press_articles
+    WHERE (url, published_date) IN (SELECT url, published_date FROM press_articles_staging)
+"""
+
+ARTICLE_ROLLUP_DELTA_SQL = """
+    SELECT
+        (published_date AT TIME ZONE 'UTC')::date AS day,
+        COALESCE(source_country, '') AS source_country,
+        COALESCE(region, '') AS region,
+        source_language,
+        sentiment,
+        COUNT(*) AS article_count,
+        COALESCE(SUM(sentiment_score), 0) AS score_sum
+    FROM staged_rows
+    WHERE published_date IS NOT NULL AND sentiment IS NOT NULL
+    GROUP BY 1, 2, 3, 4, 5
+"""
+
+# Before the merge: lock the rows about to change and take their old values out of the rollup
+SUBTRACT_ARTICLE_ROLLUP_SQL = f"""
+    WITH staged_rows AS ({STAGED_ARTICLE_ROWS_SQL} FOR UPDATE),
+    removed AS ({ARTICLE_ROLLUP_DELTA_SQL})
+    UPDATE press_monitor.daily_sentiment_rollup r
+    SET article_count = r.article_count - removed.article_count,
+        score_sum = r.score_sum - removed.score_sum
+    FROM removed
+    WHERE r.day = removed.day
+      AND r.source_country = removed.source_country
+      AND r.region = removed.region
+      AND r.source_language = removed.source_language
+      AND r.sentiment = removed.sentiment
+"""
+
+# After the merge: add the rows' current values back, in the same transaction
+ADD_ARTICLE_ROLLUP_SQL = f"""
+    WITH staged_rows AS ({STAGED_ARTICLE_ROWS_SQL})
+    INSERT INTO press_monitor.daily_sentiment_rollup (
+        day, source_country, region, source_language, sentiment, article_count, score_sum
+    )
+    {ARTICLE_ROLLUP_DELTA_SQL}
+    ON CONFLICT (day, source_country, region, source_language, sentiment) DO UPDATE SET
+        article_count = daily_sentiment_rollup.article_count + EXCLUDED.article_count,
+        score_sum = daily_sentiment_rollup.score_sum + EXCLUDED.score_sum;
+
+    DELETE FROM press_monitor.daily_sentiment_rollup WHERE article_count <= 0
+"""
+
+
 async def save_articles_to_db(articles: List[Dict[str, Any]]) -> None:
-    """Save articles to the database"""
+    """Queue articles for saving; the latest version of each URL wins"""
+    if not articles:
+        return
+    
+    for article in articles:
+        # Snapshot the article so later in-place edits do not race the flush
+        queued = await db_manager.enqueue_write(
+            "articles", dict(article), key=article['url']
+        )
+        if not queued:
+            print("⚠️ No database connection - skipping article save")
+            return
+
+
+async def save_article_content(content_hash: str, content: str) -> None:
+    """Queue a content blob for saving as soon as an article references it"""
+    # Queued writes of the same blob coalesce into one
+    await db_manager.enqueue_write("contents", (content_hash, content), key=content_hash)
+
+
+async def _write_contents(items: List[Tuple[str, str]]) -> None:
+    """Write queued content blobs
+    
+    Blobs no surviving article references are pruned after
+    CONTENT_ORPHAN_GRACE_HOURS. Saving a blob again restarts its grace
+    period, so a blob found again is not pruned before its articles land.
+    """
+    async with db_manager.acquire() as conn:
+        if not conn:
+            return  # Skip if no database
+        await conn.executemany("""
+            INSERT INTO press_monitor.article_contents (content_hash, content)
+            VALUES ($1, $2)
+            ON CONFLICT (content_hash) DO UPDATE SET created_at = NOW()
+        """, items)
+    await db_manager.prune_contents_daily()
+
+
+def article_staging_records(
+    articles: List[Dict[str, Any]]
+) -> Tuple[Dict[str, str], List[Tuple[Any, ...]]]:
+    """Build the content blobs and staging rows for a batch of articles"""
+    # Store each unique content blob once, articles only reference it
+    contents = content_store.get_many(
+        a['content_hash'] for a in articles if a.get('content_hash')
+    )
+    for article in articles:
+        if not article.get('content_hash') and article.get('original_content'):
+            article['content_hash'] = content_store.put(article['original_content'])
+            contents[article['content_hash']] = article['original_content']
+    
+    records = []
+    for ord_, article in enumerate(articles):
+        records.append((
+            ord_,
+            article['url'],
+            article['title'],
+            article['source_name'],
+            article.get('source_country'),
+            article['source_language'],
+            article['language_name'],
+            article.get('region'),
+            article.get('published_date'),
+            article.get('content_hash'),
+            article.get('translated_content'),
+            article['summary'],
+            article['sentiment'],
+            article['sentiment_score'],
+            article.get('sentiment_explanation', ''),
+            dumps(article.get('key_phrases', [])),
+            dumps(article.get('mentions_context', [])),
+            dumps(article.get('topics', [])),
+            # Remember scored sentiment alongside the upsert so reruns can skip it
+            article.get('sentiment_content_key'),
+            article.get('sentiment_model'),
+            article.get('sentiment_prompt_version')
+        ))
+    
+    return contents, records
+
+
+async def merge_article_records(
+    conn: asyncpg.Connection,
+    contents: Dict[str, str],
+    records: List[Tuple[Any, ...]]
+) -> None:
+    """Stage and merge article rows inside the caller's transaction"""
+    await conn.execute(CREATE_ARTICLE_STAGING_SQL)
+    if contents:
+        await conn.copy_records_to_table(
+            'article_contents_staging',
+            records=list(contents.items()),
+            columns=['content_hash', 'content']
+        )
+    await conn.copy_records_to_table(
+        'press_articles_staging',
+        records=records,
+        columns=ARTICLE_STAGING_COLUMNS
+    )
+    # Lock before resolving dates, so a URL another save just inserted resolves to its row
+    await conn.execute(LOCK_STAGED_URLS_SQL)
+    await conn.execute(RESOLVE_STAGED_PUBLISHED_DATE_SQL)
+    await conn.execute(SUBTRACT_ARTICLE_ROLLUP_SQL)
+    await conn.execute(MERGE_ARTICLE_STAGING_SQL)
+    await conn.execute(ADD_ARTICLE_ROLLUP_SQL)
+
+
+async def write_articles_to_db(articles: List[Dict[str, Any]]) -> None:
+    """Write articles to the database now
+    
+    Rows are COPYed into temporary staging tables and merged into
+    press_articles, article_contents and sentiment_cache by a multi-statement
+    merge. The daily sentiment rollup is adjusted in the same transaction.
+    """
+    if not articles:
+        return
+    
+    await db_manager.ensure_current_partitions()
+    
     async with db_manager.acquire() as conn:
         if not conn:
             print("⚠️ No database connection - skipping article save")
             return
-        # Prepare the insert statement
-        insert_query = """
-            INSERT INTO press_monitor.press_articles (
-                url, title, source_name, source_country, source_language,
-                language_name, region, published_date, original_content,
-                translated_content, summary, sentiment, sentiment_score,
-                sentiment_explanation, key_phrases, mentions_context, topics
-            ) VALUES (
-                $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17
-            )
-            ON CONFLICT (url) DO UPDATE SET
-                sentiment = EXCLUDED.sentiment,
-                sentiment_score = EXCLUDED.sentiment_score,
-                sentiment_explanation = EXCLUDED.sentiment_explanation,
-                fetched_date = NOW()
-        """
-        
-        # Convert articles to tuples for batch insert
-        values = []
-        for article in articles:
-            values.append((
-                article['url'],
-                article['title'],
-                article['source_name'],
-                article.get('source_country'),
-                article['source_language'],
-                article['language_name'],
-                article.get('region'),
-                article.get('published_date'),
-                article['original_content'],
-                article.get('translated_content'),
-                article['summary'],
-                article['sentiment'],
-                article['sentiment_score'],
-                article.get('sentiment_explanation', ''),
-                json.dumps(article.get('key_phrases', [])),
-                json.dumps(article.get('mentions_context', [])),
-                json.dumps(article.get('topics', []))
-            ))
         
-        # Execute batch insert
-        await conn.executemany(insert_query, values)
+        contents, records = article_staging_records(articles)
+        async with conn.transaction():
+            await merge_article_records(conn, contents, records)
+
+
+UNCOVERED_LANGUAGES_SQL = """
+    SELECT language_code 
+    FROM press_monitor.language_coverage 
+    WHERE last_checked IS NULL 
+       OR last_checked < NOW() - make_interval(hours => $1)
+    ORDER BY last_checked ASC NULLS FIRST
+"""
 
 
 async def get_uncovered_languages(hours_threshold: int = 24) -> List[str]:
@@ -107,14 +519,7 @@ async def get_uncovered_languages(hours_threshold: int = 24) -> List[str]:
     async with db_manager.acquire() as conn:
         if not conn:
             return []  # Return empty list if no database
-        query = f"""
-            SELECT language_code 
-            FROM press_monitor.language_coverage 
-            WHERE last_checked IS NULL 
-               OR last_checked < NOW() - INTERVAL '{hours_threshold} hours'
-            ORDER BY last_checked ASC NULLS FIRST
-        """
-        rows = await conn.fetch(query)
+        rows = await conn.fetch(UNCOVERED_LANGUAGES_SQL, float(hours_threshold))
         return [row['language_code'] for row in rows]
 
 
@@ -133,7 +538,15 @@ async def get_languages_by_regions(regions: List[str]) -> List[str]:
 
 
 async def update_language_checked(language_code: str, articles_found: int) -> None:
-    """Update when a language was last checked"""
+    """Queue an update of when a language was last checked"""
+    # Checks of the same language coalesce into one update with the summed count
+    await db_manager.enqueue_write(
+        "language_checks", (language_code, int(articles_found)), key=language_code
+    )
+
+
+async def _write_language_checks(items: List[Tuple[str, int]]) -> None:
+    """Write queued language checks"""
     async with db_manager.acquire() as conn:
         if not conn:
             return  # Skip if no database
@@ -143,7 +556,7 @@ async def update_language_checked(language_code: str, articles_found: int) -> No
                 articles_found = articles_found + $2
             WHERE language_code = $1
         """
-        await conn.execute(query, language_code, articles_found)
+        await conn.executemany(query, items)
 
 
 async def save_digest_to_db(
@@ -151,107 +564,313 @@ async def save_digest_to_db(
     digest_type: str, 
     articles: List[Dict[str, Any]]
 ) -> None:
-    """Save a digest to the database"""
+    """Queue a digest for saving"""
+    queued = await db_manager.enqueue_write(
+        "digests", (digest_content, digest_type, [dict(a) for a in articles])
+    )
+    if not queued:
+        print("⚠️ No database connection - skipping digest save")
+
+
+async def _write_digests(items: List[Tuple[str, str, List[Dict[str, Any]]]]) -> None:
+    """Write queued digests in one transaction, so a failed batch can be retried safely"""
+    async with db_manager.acquire() as conn:
+        if not conn:
+            return  # Skip if no database
+        async with conn.transaction():
+            for digest_content, digest_type, articles in items:
+                await _insert_digest(conn, digest_content, digest_type, articles)
+
+
+async def write_digest_to_db(
+    digest_content: str, 
+    digest_type: str, 
+    articles: List[Dict[str, Any]]
+) -> None:
+    """Save a digest to the database now"""
     async with db_manager.acquire() as conn:
         if not conn:
             print("⚠️ No database connection - skipping digest save")
             return
-        # Calculate statistics
-        languages = list(set(a['source_language'] for a in articles))
-        countries = list(set(a['source_country'] for a in articles if a.get('source_country')))
-        regions = {}
-        for article in articles:
-            region = article.get('region', 'Unknown')
-            regions[region] = regions.get(region, 0) + 1
+        async with conn.transaction():
+            await _insert_digest(conn, digest_content, digest_type, articles)
+
+
+async def _insert_digest(
+    conn,
+    digest_content: str,
+    digest_type: str,
+    articles: List[Dict[str, Any]]
+) -> None:
+    """Insert a digest and link its articles on an open connection"""
+    # Calculate statistics
+    languages = list(set(a['source_language'] for a in articles))
+    countries = list(set(a['source_country'] for a in articles if a.get('source_country')))
+    regions = {}
+    for article in articles:
+        region = article.get('region', 'Unknown')
+        regions[region] = regions.get(region, 0) + 1
+    
+    # Insert digest
+    digest_id = await conn.fetchval("""
+        INSERT INTO press_monitor.press_digests (
+            digest_type, content, articles_count,
+            languages_covered, countries_covered, regions_breakdown
+        ) VALUES ($1, $2, $3, $4, $5, $6)
+        RETURNING id
+    """, digest_type, digest_content, len(articles),
+        {lang: sum(1 for a in articles if a['source_language'] == lang) for lang in languages},
+        countries,
+        regions
+    )
+    
+    # Link articles to digest
+    if articles and digest_id:
+        article_urls = [a['url'] for a in articles]
+        await conn.execute("""
+            INSERT INTO press_monitor.article_digest_mapping (article_id, digest_id)
+            SELECT a.id, $2
+            FROM press_monitor.press_articles a
+            WHERE a.url = ANY($1::text[])
+        """, article_urls, digest_id)
+
+
+# Flush order matters: articles reference contents and digests link to
+# articles written in the same flush
+db_manager.writer.register("contents", _write_contents)
+db_manager.writer.register("articles", write_articles_to_db)
+db_manager.writer.register(
+    "language_checks", _write_language_checks,
+    merge=lambda older, newer: (older[0], older[1] + newer[1])
+)
+db_manager.writer.register("digests", _write_digests)
+
+
+async def get_cached_search_result(cache_key: str) -> Optional[Tuple[Dict[str, Any], float]]:
+    """Get an unexpired cached search result and its expiry timestamp"""
+    async with db_manager.acquire() as conn:
+        if not conn:
+            return None
+        row = await conn.fetchrow("""
+            SELECT result, expires_at
+            FROM press_monitor.search_cache
+            WHERE cache_key = $1 AND expires_at > NOW()
+        """, cache_key)
         
-        # Insert digest
-        digest_id = await conn.fetchval("""
-            INSERT INTO press_monitor.press_digests (
-                digest_type, content, articles_count,
-                languages_covered, countries_covered, regions_breakdown
-            ) VALUES ($1, $2, $3, $4, $5, $6)
-            RETURNING id
-        """, digest_type, digest_content, len(articles),
-            json.dumps({lang: sum(1 for a in articles if a['source_language'] == lang) for lang in languages}),
-            json.dumps(countries),
-            json.dumps(regions)
-        )
+        if row:
+            return loads(row['result']), row['expires_at'].timestamp()
         
-        # Link articles to digest
-        if articles and digest_id:
-            article_urls = [a['url'] for a in articles]
-            await conn.execute("""
-                INSERT INTO press_monitor.article_digest_mapping (article_id, digest_id)
-                SELECT a.id, $2
-                FROM press_monitor.press_articles a
-                WHERE a.url = ANY($1::text[])
-            """, article_urls, digest_id)
-
-
-async def get_historical_articles(
-    country: Optional[str] = None,
-    region: Optional[str] = None,
-    days_back: int = 90
-) -> List[Dict[str, Any]]:
-    """Get historical articles for analysis"""
+        return None
+
+
+async def save_search_result(
+    cache_key: str,
+    language_code: str,
+    query: str,
+    date_filter: Optional[str],
+    result: Dict[str, Any],
+    ttl_seconds: int
+) -> None:
+    """Save a search result to the cache"""
     async with db_manager.acquire() as conn:
-        query = f"""
-            SELECT 
-                url, title, source_name, source_country, source_language,
-                language_name, region, published_date, summary,
-                sentiment, sentiment_score, sentiment_explanation,
-                key_phrases, mentions_context, topics
-            FROM press_monitor.press_articles
-            WHERE published_date >= NOW() - INTERVAL '{days_back} days'
-        """
-        params = []
+        if not conn:
+            return  # Skip if no database
+        await conn.execute("""
+            INSERT INTO press_monitor.search_cache (
+                cache_key, language_code, query, date_filter, result, expires_at
+            ) VALUES ($1, $2, $3, $4, $5, NOW() + make_interval(secs => $6))
+            ON CONFLICT (cache_key) DO UPDATE SET
+                result = EXCLUDED.result,
+                created_at = NOW(),
+                expires_at = EXCLUDED.expires_at
+        """, cache_key, language_code, query, date_filter, result, float(ttl_seconds))
+
+
+async def get_cached_sentiments(
+    keys: List[Tuple[str, str]],
+    model: str,
+    prompt_version: str
+) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    """Bulk-load cached sentiment for (url, content_key) pairs scored by a model and prompt version"""
+    if not keys:
+        return {}
+    async with db_manager.acquire() as conn:
+        if not conn:
+            return {}
+        rows = await conn.fetch("""
+            SELECT c.url, c.content_key, c.sentiment, c.sentiment_score,
+                   c.sentiment_explanation, c.key_phrases
+            FROM unnest($1::text[], $2::text[]) AS k(url, content_key)
+            JOIN press_monitor.sentiment_cache c
+              ON c.url = k.url AND c.content_key = k.content_key
+            WHERE c.model = $3 AND c.prompt_version = $4
+        """, [url for url, _ in keys], [key for _, key in keys], model, prompt_version)
         
-        if country:
-            query += " AND source_country = $1"
-            params.append(country)
-        elif region:
-            query += " AND region = $1"
-            params.append(region)
+        return {
+            (row['url'], row['content_key'].strip()): {
+                "sentiment": row['sentiment'],
+                "sentiment_score": row['sentiment_score'],
+                "sentiment_explanation": row['sentiment_explanation'] or "",
+                "key_phrases": loads(row['key_phrases']) if row['key_phrases'] else []
+            }
+            for row in rows
+        }
+
+
+async def get_translations(keys: List[Tuple[str, str]]) -> Dict[Tuple[str, str], str]:
+    """Bulk-load remembered translations for (source_language, content_hash) pairs"""
+    if not keys:
+        return {}
+    async with db_manager.acquire() as conn:
+        if not conn:
+            return {}
+        rows = await conn.fetch("""
+            SELECT t.source_language, t.content_hash, t.translated_text
+            FROM unnest($1::text[], $2::text[]) AS k(source_language, content_hash)
+            JOIN press_monitor.translation_memory t
+              ON t.source_language = k.source_language AND t.content_hash = k.content_hash
+        """, [lang for lang, _ in keys], [key for _, key in keys])
         
-        query += " ORDER BY published_date DESC"
+        return {
+            (row['source_language'], row['content_hash'].strip()): row['translated_text']
+            for row in rows
+        }
+
+
+async def save_translations(translations: Dict[Tuple[str, str], str], model: str) -> None:
+    """Save translations to the translation memory"""
+    if not translations:
+        return
+    async with db_manager.acquire() as conn:
+        if not conn:
+            return  # Skip if no database
+        await conn.executemany("""
+            INSERT INTO press_monitor.translation_memory (
+                source_language, content_hash, translated_text, model
+            ) VALUES ($1, $2, $3, $4)
+            ON CONFLICT (source_language, content_hash) DO NOTHING
+        """, [(lang, key, text, model) for (lang, key), text in translations.items()])
+
+
+def window_cutoff(days_back: int) -> datetime:
+    """Get the start of a window of recent days
+    
+    Passing the cutoff as a bound timestamp, rather than computing it from
+    NOW() in SQL, lets the planner prune press_articles partitions up front.
+    """
+    return datetime.now(timezone.utc) - timedelta(days=days_back)
+
+
+# Rollup days are UTC dates; a window of N days is today and the N days before it
+ROLLUP_WINDOW_SQL = "day >= (NOW() AT TIME ZONE 'UTC')::date - $1::int"
+
+# Only the columns temporal analytics reads
+HISTORICAL_STREAM_COLUMNS = """
+    url, title, source_name, source_country, source_language, region,
+    published_date, summary, sentiment, sentiment_score, topics
+"""
+
+
+def build_historical_stream_sql(filter_column: Optional[str], after_key: bool) -> str:
+    """Build one keyset page query; each variant has stable text for the statement cache"""
+    conditions = ["published_date >= $1"]
+    params = 1
+    if filter_column:
+        params += 1
+        conditions.append(f"{filter_column} = ${params}")
+    if after_key:
+        conditions.append(f"(published_date, url) < (${params + 1}, ${params + 2})")
+        params += 2
+    return f"""
+        SELECT {HISTORICAL_STREAM_COLUMNS}
+        FROM press_monitor.press_articles
+        WHERE {' AND '.join(conditions)}
+        ORDER BY published_date DESC, url DESC
+        LIMIT ${params + 1}
+    """
+
+
+HISTORICAL_STREAM_SQL = {
+    (filter_column, after_key): build_historical_stream_sql(filter_column, after_key)
+    for filter_column in (None, "source_country", "region")
+    for after_key in (False, True)
+}
+
+
+async def iter_historical_articles(
+    country: Optional[str] = None,
+    region: Optional[str] = None,
+    days_back: int = 90,
+    page_size: int = DB_STREAM_PAGE_SIZE
+) -> AsyncIterator[Dict[str, Any]]:
+    """Stream recent articles newest first, projecting only the analytics columns
+    
+    Each page is fetched whole and its connection returned to the pool before
+    any row is yielded; the next page resumes after the last (published_date,
+    url) seen. Memory stays at one page, and a slow or abandoned consumer
+    never holds a pool slot.
+    """
+    if country:
+        filter_column, filter_args = "source_country", [country]
+    elif region:
+        filter_column, filter_args = "region", [region]
+    else:
+        filter_column, filter_args = None, []
+    
+    cutoff = window_cutoff(days_back)
+    last_key: Optional[Tuple[datetime, str]] = None
+    while True:
+        args = [cutoff, *filter_args, *(last_key or ()), page_size]
+        query = HISTORICAL_STREAM_SQL[(filter_column, last_key is not None)]
         
-        rows = await conn.fetch(query, *params)
+        async with db_manager.acquire() as conn:
+            if not conn:
+                return  # Nothing to stream without a database
+            rows = await conn.fetch(query, *args)
         
-        # Convert to list of dicts
-        articles = []
+        if rows:
+            last_key = (rows[-1]['published_date'], rows[-1]['url'])
         for row in rows:
-            article = dict(row)
-            # Parse JSON fields
-            article['key_phrases'] = json.loads(article['key_phrases'])
-            article['mentions_context'] = json.loads(article['mentions_context'])
-            article['topics'] = json.loads(article['topics'])
-            articles.append(article)
+            yield LazyRow(row)
         
-        return articles
+        if len(rows) < page_size:
+            return
+
+
+DAILY_SENTIMENT_SQL = f"""
+    SELECT day, sentiment,
+           SUM(article_count)::int AS article_count,
+           SUM(score_sum) AS score_sum
+    FROM press_monitor.daily_sentiment_rollup
+    WHERE {ROLLUP_WINDOW_SQL}
+      AND ($2::text IS NULL OR source_country = $2)
+      AND ($3::text IS NULL OR region = $3)
+    GROUP BY day, sentiment
+    ORDER BY day
+"""
 
 
-async def get_countries_with_sufficient_data(
-    min_articles: int = 50,
+async def get_daily_sentiment(
+    country: Optional[str] = None,
+    region: Optional[str] = None,
     days_back: int = 90
-) -> List[str]:
-    """Get countries with enough articles for temporal analysis"""
+) -> List[Dict[str, Any]]:
+    """Get per-day sentiment counts and score sums from the rollup"""
     async with db_manager.acquire() as conn:
-        query = f"""
-            SELECT source_country, COUNT(*) as article_count
-            FROM press_monitor.press_articles
-            WHERE published_date >= NOW() - INTERVAL '{days_back} days'
-              AND source_country IS NOT NULL
-            GROUP BY source_country
-            HAVING COUNT(*) >= $1
-            ORDER BY COUNT(*) DESC
-        """
-        rows = await conn.fetch(query, min_articles)
-        return [row['source_country'] for row in rows]
+        if not conn:
+            return []  # Return empty list if no database
+        # A country filter takes precedence over a region, as in iter_historical_articles
+        rows = await conn.fetch(
+            DAILY_SENTIMENT_SQL, int(days_back), country, None if country else region
+        )
+        return [dict(row) for row in rows]
 
 
 async def get_latest_digest_from_db(digest_type: str) -> Optional[Dict[str, Any]]:
     """Get the latest digest of a specific type"""
     async with db_manager.acquire() as conn:
+        if not conn:
+            return None  # No digest without a database
         query = """
             SELECT id, content, articles_count, languages_covered,
                    countries_covered, regions_breakdown, generated_at
@@ -263,51 +882,79 @@ async def get_latest_digest_from_db(digest_type: str) -> Optional[Dict[str, Any]
         row = await conn.fetchrow(query, digest_type)
         
         if row:
-            digest = dict(row)
-            digest['languages_covered'] = json.loads(digest['languages_covered'])
-            digest['countries_covered'] = json.loads(digest['countries_covered'])
-            digest['regions_breakdown'] = json.loads(digest['regions_breakdown'])
-            return digest
+            # JSON breakdowns are decoded when first read
+            return LazyRow(row)
         
         return None
 
 
-async def get_monitoring_statistics() -> Dict[str, Any]:
-    """Get overall monitoring statistics"""
+DAILY_SENTIMENT_BY_TARGET_SQL = f"""
+    SELECT day, source_country, region, sentiment,
+           SUM(article_count)::int AS article_count,
+           SUM(score_sum) AS score_sum
+    FROM press_monitor.daily_sentiment_rollup
+    WHERE {ROLLUP_WINDOW_SQL}
+    GROUP BY day, source_country, region, sentiment
+"""
+
+
+async def get_daily_sentiment_by_target(days_back: int = 90) -> List[Dict[str, Any]]:
+    """Get per-day sentiment counts for every country and region in one rollup read"""
+    async with db_manager.acquire() as conn:
+        if not conn:
+            return []  # Return empty list if no database
+        rows = await conn.fetch(DAILY_SENTIMENT_BY_TARGET_SQL, int(days_back))
+        return [dict(row) for row in rows]
+
+
+MONITORING_TOTALS_SQL = f"""
+    SELECT 
+        COALESCE(SUM(article_count), 0) as total_articles,
+        COUNT(DISTINCT source_language) as languages_count,
+        COUNT(DISTINCT NULLIF(source_country, '')) as countries_count,
+        COALESCE(SUM(article_count) FILTER (WHERE sentiment = 'positive'), 0) as positive_count,
+        COALESCE(SUM(article_count) FILTER (WHERE sentiment = 'negative'), 0) as negative_count,
+        COALESCE(SUM(article_count) FILTER (WHERE sentiment = 'neutral'), 0) as neutral_count
+    FROM press_monitor.daily_sentiment_rollup
+    WHERE {ROLLUP_WINDOW_SQL}
+"""
+
+MONITORING_LANGUAGES_SQL = f"""
+    SELECT source_language, SUM(article_count) as count
+    FROM press_monitor.daily_sentiment_rollup
+    WHERE {ROLLUP_WINDOW_SQL}
+    GROUP BY source_language
+    ORDER BY SUM(article_count) DESC
+    LIMIT 10
+"""
+
+MONITORING_COUNTRIES_SQL = f"""
+    SELECT source_country, SUM(article_count) as count
+    FROM press_monitor.daily_sentiment_rollup
+    WHERE {ROLLUP_WINDOW_SQL}
+      AND source_country <> ''
+    GROUP BY source_country
+    ORDER BY SUM(article_count) DESC
+    LIMIT 10
+"""
+
+
+async def get_monitoring_statistics(days_back: int = 7) -> Dict[str, Any]:
+    """Get overall monitoring statistics for articles published in the last days
+    
+    Counts come from the daily sentiment rollup, so the window is by UTC
+    publication day. Before the rollup it was by fetched_date: an old article
+    fetched again today counted as recent, and now it does not.
+    """
     async with db_manager.acquire() as conn:
         # Get total counts
-        total_stats = await conn.fetchrow("""
-            SELECT 
-                COUNT(*) as total_articles,
-                COUNT(DISTINCT source_language) as languages_count,
-                COUNT(DISTINCT source_country) as countries_count,
-                COUNT(CASE WHEN sentiment = 'positive' THEN 1 END) as positive_count,
-                COUNT(CASE WHEN sentiment = 'negative' THEN 1 END) as negative_count,
-                COUNT(CASE WHEN sentiment = 'neutral' THEN 1 END) as neutral_count
-            FROM press_monitor.press_articles
-            WHERE fetched_date >= NOW() - INTERVAL '7 days'
-        """)
+        total_stats = await conn.fetchrow(MONITORING_TOTALS_SQL, days_back)
         
         # Get language breakdown
-        language_stats = await conn.fetch("""
-            SELECT source_language, language_name, COUNT(*) as count
-            FROM press_monitor.press_articles
-            WHERE fetched_date >= NOW() - INTERVAL '7 days'
-            GROUP BY source_language, language_name
-            ORDER BY COUNT(*) DESC
-            LIMIT 10
-        """)
+        language_stats = await conn.fetch(MONITORING_LANGUAGES_SQL, days_back)
         
         # Get country breakdown
-        country_stats = await conn.fetch("""
-            SELECT source_country, COUNT(*) as count
-            FROM press_monitor.press_articles
-            WHERE fetched_date >= NOW() - INTERVAL '7 days'
-              AND source_country IS NOT NULL
-            GROUP BY source_country
-            ORDER BY COUNT(*) DESC
-            LIMIT 10
-        """)
+        country_stats = await conn.fetch(MONITORING_COUNTRIES_SQL, days_back)
         
         return {
             'total_articles': total_stats['total_articles'],
@@ -316,7 +963,14 @@ async def get_monitoring_statistics() -> Dict[str, Any]:
             'positive_count': total_stats['positive_count'],
             'negative_count': total_stats['negative_count'],
             'neutral_count': total_stats['neutral_count'],
-            'top_languages': [dict(row) for row in language_stats],
+            'top_languages': [
+                {
+                    'source_language': row['source_language'],
+                    'language_name': LANGUAGE_NAMES.get(row['source_language'], row['source_language']),
+                    'count': row['count']
+                }
+                for row in language_stats
+            ],
             'top_countries': [dict(row) for row in country_stats]
         }
 
@@ -329,12 +983,16 @@ async def get_articles_from_db(
 ) -> List[Dict[str, Any]]:
     """Search articles with filters"""
     async with db_manager.acquire() as conn:
-        query = f"""
-            SELECT * FROM press_monitor.press_articles
-            WHERE published_date >= NOW() - INTERVAL '{days_back} days'
+        if not conn:
+            return []  # Return empty list if no database
+        query = """
+            SELECT a.*, COALESCE(a.original_content, c.content) AS original_content
+            FROM press_monitor.press_articles a
+            LEFT JOIN press_monitor.article_contents c ON c.content_hash = a.content_hash
+            WHERE published_date >= $1
         """
-        params = []
-        param_count = 0
+        params = [window_cutoff(days_back)]
+        param_count = 1
         
         if country:
             param_count += 1
@@ -355,19 +1013,121 @@ async def get_articles_from_db(
         
         rows = await conn.fetch(query, *params)
         
-        articles = []
-        for row in rows:
-            article = dict(row)
-            # Parse JSON fields
-            if article.get('key_phrases'):
-                article['key_phrases'] = json.loads(article['key_phrases'])
-            if article.get('mentions_context'):
-                article['mentions_context'] = json.loads(article['mentions_context'])
-            if article.get('topics'):
-                article['topics'] = json.loads(article['topics'])
-            articles.append(article)
-        
-        return articles
+        # JSON fields are decoded when first read
+        return [LazyRow(row) for row in rows]
+
+
+# Columns returned by article search; content stays out of listings
+ARTICLE_SEARCH_COLUMNS = """
+    id, url, title, source_name, source_country, source_language, language_name,
+    region, published_date, summary, sentiment, sentiment_score,
+    sentiment_explanation, key_phrases, mentions_context, topics
+"""
+
+ARTICLE_SEARCH_SENTIMENTS = ("positive", "negative", "neutral")
+ARTICLE_SEARCH_MAX_LIMIT = 100
+
+
+def encode_search_cursor(row: Dict[str, Any], ranked: bool) -> str:
+    """Encode the sort key of the last row of a page as an opaque cursor"""
+    key = [row['published_date'].isoformat(), row['url']]
+    if ranked:
+        key.insert(0, row['rank'])
+    return base64.urlsafe_b64encode(dumps(key).encode()).decode()
+
+
+def decode_search_cursor(cursor: str, ranked: bool) -> List[Any]:
+    """Decode a cursor into the sort key to resume after"""
+    try:
+        key = loads(base64.urlsafe_b64decode(cursor.encode()))
+        if len(key) != (3 if ranked else 2):
+            raise ValueError("cursor does not match the query")
+        key[-2] = datetime.fromisoformat(key[-2])
+        if ranked:
+            key[0] = float(key[0])
+        return key
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {e}") from e
+
+
+async def search_articles(
+    query: Optional[str] = None,
+    country: Optional[str] = None,
+    language: Optional[str] = None,
+    sentiment: Optional[str] = None,
+    days_back: Optional[int] = None,
+    cursor: Optional[str] = None,
+    limit: int = 50
+) -> Dict[str, Any]:
+    """Search articles by text and filters, one page at a time
+    
+    With a query, matches on title, summary and translation are ranked
+    best first through the search_vector GIN index; without one, articles
+    are listed newest first. Pass next_cursor back to get the next page.
+    """
+    if sentiment and sentiment not in ARTICLE_SEARCH_SENTIMENTS:
+        raise ValueError(f"Unknown sentiment: {sentiment}")
+    limit = max(1, min(int(limit), ARTICLE_SEARCH_MAX_LIMIT))
+    ranked = bool(query and query.strip())
+    after = decode_search_cursor(cursor, ranked) if cursor else None
+    
+    params: List[Any] = []
+    
+    def bind(value: Any) -> str:
+        params.append(value)
+        return f"${len(params)}"
+    
+    conditions = []
+    if ranked:
+        query_param = bind(query.strip())
+        conditions.append("search_vector @@ search.q")
+    if days_back:
+        # A bound cutoff keeps partition pruning at plan time
+        conditions.append(f"published_date >= {bind(window_cutoff(days_back))}")
+    if country:
+        conditions.append(f"source_country = {bind(country)}")
+    if language:
+        conditions.append(f"source_language = {bind(language)}")
+    if sentiment:
+        conditions.append(f"sentiment = {bind(sentiment)}")
+    where = " AND ".join(conditions) or "TRUE"
+    
+    if ranked:
+        sql = f"""
+            SELECT * FROM (
+                SELECT {ARTICLE_SEARCH_COLUMNS}, ts_rank_cd(search_vector, search.q) AS rank
+                FROM press_monitor.press_articles,
+                     (SELECT websearch_to_tsquery('simple', {query_param})
+                          || websearch_to_tsquery('english', {query_param}) AS q) AS search
+                WHERE {where}
+            ) ranked
+        """
+        if after:
+            sql += f" WHERE (rank, published_date, url) < ({bind(after[0])}::real, {bind(after[1])}, {bind(after[2])})"
+        sql += " ORDER BY rank DESC, published_date DESC, url DESC"
+    else:
+        sql = f"""
+            SELECT {ARTICLE_SEARCH_COLUMNS}
+            FROM press_monitor.press_articles
+            WHERE {where}
+        """
+        if after:
+            sql += f" AND (published_date, url) < ({bind(after[0])}, {bind(after[1])})"
+        sql += " ORDER BY published_date DESC, url DESC"
+    # One extra row tells whether another page exists
+    sql += f" LIMIT {bind(limit + 1)}"
+    
+    async with db_manager.acquire() as conn:
+        if not conn:
+            return {"articles": [], "next_cursor": None}
+        rows = await conn.fetch(sql, *params)
+    
+    page = rows[:limit]
+    return {
+        # JSON fields are decoded when first read
+        "articles": [LazyRow(row) for row in page],
+        "next_cursor": encode_search_cursor(page[-1], ranked) if len(rows) > limit else None
+    }
 
 
 # Language name mapping
@@ -0,0 +1,210 @@
+"""Cross-language duplicate detection for press articles"""
+
+import hashlib
+import re
+import unicodedata
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Set
+from urllib.parse import urlparse
+
+from .utils import clean_url
+
+
+# SimHash parameters: 64-bit fingerprints split into 11 bands of 5-6 bits.
+# Two titles within MAX_HAMMING_DISTANCE (< number of bands) bits of each
+# other are guaranteed to share at least one identical band. Copies of one
+# headline with a changed prefix or suffix land within a few bits, reworded
+# headlines 8-14 bits apart, unrelated headlines 20+ bits apart. Trigrams
+# ignore word order, so a headline with subject and object swapped can be
+# as close as 2 bits; check_title_order rejects those.
+SIMHASH_BITS = 64
+SIMHASH_BANDS = 11
+MAX_HAMMING_DISTANCE = 6
+
+# Titles sharing fewer words than this cannot be checked for word order and
+# only match within the same source
+MIN_SHARED_TOKENS = 3
+
+# Titles shorter than this carry too little signal for near-duplicate matching
+MIN_TITLE_LENGTH = 20
+
+PLACEHOLDER_TITLES = {"no title", "untitled"}
+
+
+def normalize_title(title: str) -> str:
+    """Normalize a title for comparison across sources"""
+    title = unicodedata.normalize("NFKC", title or "").casefold()
+    title = re.sub(r"[^\w\s]", " ", title)
+    return " ".join(title.split())
+
+
+def is_matchable_title(title: str) -> bool:
+    """Check whether a title is specific enough to match other titles on"""
+    raw = (title or "").strip()
+    # Grounding chunks often use the bare domain as title
+    if " " not in raw and "." in raw:
+        return False
+    normalized = normalize_title(raw)
+    return len(normalized) >= MIN_TITLE_LENGTH and normalized not in PLACEHOLDER_TITLES
+
+
+def simhash(text: str, bits: int = SIMHASH_BITS) -> int:
+    """Compute a SimHash fingerprint over character trigrams
+
+    Character shingles work for scripts without word separators (CJK, Thai)
+    as well as for space-separated languages.
+    """
+    weights = [0] * bits
+    shingles = [text[i:i + 3] for i in range(max(len(text) - 2, 1))]
+    for shingle in shingles:
+        digest = int.from_bytes(
+            hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big"
+        )
+        for bit in range(bits):
+            weights[bit] += 1 if digest >> bit & 1 else -1
+
+    fingerprint = 0
+    for bit in range(bits):
+        if weights[bit] > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Count differing bits between two fingerprints"""
+    return bin(a ^ b).count("1")
+
+
+def article_source(article: Dict[str, Any]) -> str:
+    """Get the host an article was published on"""
+    host = urlparse(clean_url(article.get("url", ""))).netloc.casefold()
+    return host[4:] if host.startswith("www.") else host
+
+
+def check_title_order(title: str, other: str) -> bool:
+    """Check that the words two titles share appear in the same order
+
+    "Armenia accuses Azerbaijan" and "Azerbaijan accuses Armenia" share every
+    word, but not their order.
+    """
+    tokens = normalize_title(title).split()
+    other_tokens = normalize_title(other).split()
+    shared = set(tokens) & set(other_tokens)
+    if len(shared) < MIN_SHARED_TOKENS:
+        return False
+    ordered = [token for token in dict.fromkeys(tokens) if token in shared]
+    other_ordered = [token for token in dict.fromkeys(other_tokens) if token in shared]
+    return ordered == other_ordered
+
+
+def is_same_story(article: Dict[str, Any], canonical: Dict[str, Any]) -> bool:
+    """Confirm a SimHash title match before merging two articles
+
+    Titles must agree on word order. Titles too short or unsegmented to
+    compare word by word (CJK, Thai) only match within the same source.
+    """
+    title = article.get("title", "")
+    canonical_title = canonical.get("title", "")
+    if check_title_order(title, canonical_title):
+        return True
+    shared = set(normalize_title(title).split()) & set(normalize_title(canonical_title).split())
+    return len(shared) < MIN_SHARED_TOKENS and article_source(article) == article_source(canonical)
+
+
+class ArticleIndex:
+    """In-memory index of canonical URLs and near-duplicate titles
+
+    The first article seen for a story becomes canonical. Later duplicates are
+    folded into it, recording every language, query and URL that found it.
+    """
+
+    def __init__(self, max_distance: int = MAX_HAMMING_DISTANCE):
+        self.max_distance = max_distance
+        self._by_url: Dict[str, Dict[str, Any]] = {}
+        self._bands: List[Dict[int, List[int]]] = [defaultdict(list) for _ in range(SIMHASH_BANDS)]
+        self._fingerprints: List[int] = []
+        self._canonical: List[Dict[str, Any]] = []
+        self.duplicates_merged = 0
+
+    def _band_keys(self, fingerprint: int) -> List[int]:
+        keys = []
+        for band in range(SIMHASH_BANDS):
+            start = band * SIMHASH_BITS // SIMHASH_BANDS
+            end = (band + 1) * SIMHASH_BITS // SIMHASH_BANDS
+            keys.append((fingerprint >> start) & ((1 << (end - start)) - 1))
+        return keys
+
+    def find(self, article: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Find the canonical article for a story, if already indexed"""
+        url = clean_url(article.get("url", ""))
+        if url and url in self._by_url:
+            return self._by_url[url]
+
+        title = article.get("title", "")
+        if not is_matchable_title(title):
+            return None
+
+        fingerprint = simhash(normalize_title(title))
+        candidates: Set[int] = set()
+        for band, key in enumerate(self._band_keys(fingerprint)):
+            candidates.update(self._bands[band].get(key, []))
+
+        for position in sorted(candidates):
+            if hamming_distance(fingerprint, self._fingerprints[position]) > self.max_distance:
+                continue
+            if is_same_story(article, self._canonical[position]):
+                return self._canonical[position]
+        return None
+
+    def add(self, article: Dict[str, Any]) -> bool:
+        """Index an article, returning False if it duplicates a known story"""
+        canonical = self.find(article)
+        if canonical is not None:
+            self._merge(canonical, article)
+            self.duplicates_merged += 1
+            return False
+
+        article.setdefault("found_in_languages", [article["source_language"]])
+        article.setdefault(
+            "search_queries", [article["search_query"]] if article.get("search_query") else []
+        )
+        article.setdefault("duplicate_urls", [])
+
+        url = clean_url(article.get("url", ""))
+        if url:
+            self._by_url[url] = article
+
+        title = article.get("title", "")
+        if is_matchable_title(title):
+            fingerprint = simhash(normalize_title(title))
+            position = len(self._canonical)
+            self._canonical.append(article)
+            self._fingerprints.append(fingerprint)
+            for band, key in enumerate(self._band_keys(fingerprint)):
+                self._bands[band][key].append(position)
+
+        return True
+
+    def _merge(self, canonical: Dict[str, Any], duplicate: Dict[str, Any]) -> None:
+        """Record where a duplicate was found on its canonical article"""
+        language = duplicate.get("source_language")
+        if language and language not in canonical["found_in_languages"]:
+            canonical["found_in_languages"].append(language)
+
+        query = duplicate.get("search_query")
+        if query and query not in canonical["search_queries"]:
+            canonical["search_queries"].append(query)
+
+        url = clean_url(duplicate.get("url", ""))
+        if url and url != clean_url(canonical["url"]) and url not in canonical["duplicate_urls"]:
+            canonical["duplicate_urls"].append(url)
+            self._by_url[url] = canonical
+
+
+def deduplicate_articles(
+    articles: List[Dict[str, Any]],
+    index: Optional[ArticleIndex] = None
+) -> List[Dict[str, Any]]:
+    """Collapse duplicate articles, keeping the first occurrence of each story"""
+    index = index or ArticleIndex()
+    return [article for article in articles if index.add(article)]
@@ -1,6 +1,5 @@
 """Digest generator for creating comprehensive press reports"""
 
-import os
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 from collections import defaultdict
@@ -11,6 +10,9 @@ from .state import OrchestratorState
 from .press_prompts import DIGEST_GENERATION_PROMPT
 from .database import save_digest_to_db
 from .temporal_analytics import summarize_temporal_insights
+from .llm_clients import get_chat_model
+from .rate_limiter import gemini_governor
+from .sentiment_analyzer import analyze_articles
 
 
 async def generate_digest_node(state: OrchestratorState) -> Dict[str, Any]:
@@ -50,12 +52,8 @@ async def generate_digest(
     if not articles:
         return f"No {digest_type} articles found in the monitoring period."
     
-    # Initialize model
-    model = ChatGoogleGenerativeAI(
-        model="gemini-2.0-flash",
-        temperature=0.4,
-        google_api_key=os.getenv("GEMINI_API_KEY")
-    )
+    # Get the shared model
+    model = get_chat_model("gemini-2.0-flash", temperature=0.4)
     
     # Group articles by region and language
     articles_by_region = defaultdict(list)
@@ -157,7 +155,8 @@ async def generate_digest(
         prompt += f"\n\nTemporal Analysis Insights:{temporal_insights}"
     
     # Generate the digest
-    response = await model.ainvoke(prompt)
+    async with gemini_governor.slot():
+        response = await model.ainvoke(prompt)
     
     # Add metadata footer
     footer = f"\n\n---\n\n"
@@ -348,14 +347,10 @@ async def generate_comprehensive_digest(state: OrchestratorState) -> str:
     if not all_articles:
         return "No articles found for analysis."
     
-    # Initialize Gemini model
-    model = ChatGoogleGenerativeAI(
-        model="gemini-2.0-flash",
-        temperature=0.3,
-        google_api_key=os.getenv("GEMINI_API_KEY")
-    )
+    # Get the shared Gemini model
+    model = get_chat_model("gemini-2.0-flash", temperature=0.3)
     
-    # Analyze sentiment for all articles
+    # Reuse existing sentiment; only articles without a score reach the model
     analyzed_articles = await analyze_article_sentiments(all_articles, model)
     
     # Calculate statistics
@@ -399,7 +394,8 @@ TASK: Create a comprehensive, executive-level digest that:
 Format with clear sections, bullet points, and executive summary.
 """
 
-    response = await model.ainvoke(analysis_prompt)
+    async with gemini_governor.slot():
+        response = await model.ainvoke(analysis_prompt)
     
     # Add detailed statistics footer
     footer = f"""
@@ -439,77 +435,14 @@ Neutral:  {'█' * min(20, int(stats['neutral_percentage'] / 5))} {stats['neutra
 
 
 async def analyze_article_sentiments(articles: List[Dict], model: ChatGoogleGenerativeAI) -> List[Dict]:
-    """Analyze sentiment for all articles using Gemini"""
+    """Get sentiment for all articles, scoring only those that have none yet
     
-    analyzed_articles = []
+    Scores from sentiment_analysis_node (or the sentiment cache) are reused
+    as-is, so the digest never re-classifies an article.
+    """
     
-    # Process in batches to avoid token limits
-    batch_size = 10
-    for i in range(0, len(articles), batch_size):
-        batch = articles[i:i + batch_size]
-        
-        # Prepare batch for sentiment analysis
-        batch_text = []
-        for j, article in enumerate(batch):
-            batch_text.append(f"{j+1}. Title: {article['title']}")
-            if article.get('summary'):
-                batch_text.append(f"   Summary: {article['summary'][:200]}...")
-        
-        sentiment_prompt = f"""Analyze sentiment of these {len(batch)} articles about Azerbaijan:
-
-{chr(10).join(batch_text)}
-
-For each article (1-{len(batch)}), classify sentiment as:
-- POSITIVE: Favorable view of Azerbaijan, positive developments
-- NEGATIVE: Critical view, concerns, conflicts  
-- NEUTRAL: Factual reporting without clear positive/negative tone
-
-Return ONLY the format:
-1: POSITIVE|NEGATIVE|NEUTRAL
-2: POSITIVE|NEGATIVE|NEUTRAL
-etc.
-"""
-        
-        try:
-            response = await model.ainvoke(sentiment_prompt)
-            sentiment_results = response.content.strip().split('\n')
-            
-            # Apply sentiment to articles
-            for j, article in enumerate(batch):
-                article_copy = article.copy()
-                
-                if j < len(sentiment_results):
-                    sentiment_line = sentiment_results[j]
-                    if ':' in sentiment_line:
-                        sentiment = sentiment_line.split(':')[1].strip().upper()
-                        article_copy['sentiment'] = sentiment.lower()
-                        
-                        # Assign numeric sentiment score
-                        if sentiment == 'POSITIVE':
-                            article_copy['sentiment_score'] = 0.7
-                        elif sentiment == 'NEGATIVE':
-                            article_copy['sentiment_score'] = -0.7
-                        else:
-                            article_copy['sentiment_score'] = 0.0
-                    else:
-                        article_copy['sentiment'] = 'neutral'
-                        article_copy['sentiment_score'] = 0.0
-                else:
-                    article_copy['sentiment'] = 'neutral'
-                    article_copy['sentiment_score'] = 0.0
-                
-                analyzed_articles.append(article_copy)
-        
-        except Exception as e:
-            print(f"Error analyzing sentiment for batch: {e}")
-            # Default to neutral if analysis fails
-            for article in batch:
-                article_copy = article.copy()
-                article_copy['sentiment'] = 'neutral'
-                article_copy['sentiment_score'] = 0.0
-                analyzed_articles.append(article_copy)
-    
-    return analyzed_articles
+    analyzed_articles = [article.copy() for article in articles]
+    return await analyze_articles(analyzed_articles, model, translation_enabled=False)
 
 
 def calculate_detailed_statistics(articles: List[Dict]) -> Dict:
@@ -0,0 +1,87 @@
+"""JSON codecs for database connections, with lazy decoding of JSON columns"""
+
+import json
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, Mapping
+
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library encoder
+    orjson = None
+
+
+def dumps(value: Any) -> str:
+    """Encode a value as JSON text"""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value)
+
+
+class RawJSON(str):
+    """JSON column text as it came off the wire, decoded only when read"""
+    __slots__ = ()
+
+
+def loads(text: Any) -> Any:
+    """Decode JSON text"""
+    if orjson is not None:
+        # orjson only accepts exact str, not subclasses
+        return orjson.loads(str(text) if isinstance(text, RawJSON) else text)
+    return json.loads(text)
+
+
+def encode_json(value: Any) -> str:
+    """Encode a query parameter for a json or jsonb column"""
+    if isinstance(value, RawJSON):
+        return value
+    return dumps(value)
+
+
+async def register_json_codecs(connection) -> None:
+    """Register json and jsonb codecs on a new pool connection
+
+    Parameters are encoded from Python values; results stay as RawJSON
+    text until a LazyRow hands them to a caller, so columns nobody reads
+    are never parsed.
+    """
+    for type_name in ("json", "jsonb"):
+        await connection.set_type_codec(
+            type_name,
+            encoder=encode_json,
+            decoder=RawJSON,
+            schema="pg_catalog",
+            format="text"
+        )
+
+
+class LazyRow(MutableMapping):
+    """Mutable row mapping that decodes each JSON column the first time it is read"""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, record: Mapping[str, Any]):
+        self._data: Dict[str, Any] = dict(record.items())
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._data[key]
+        if isinstance(value, RawJSON):
+            value = self._data[key] = loads(value)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._data[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def copy(self) -> "LazyRow":
+        return LazyRow(self._data)
+
+    def __repr__(self) -> str:
+        return f"LazyRow({self._data!r})"
@@ -2,18 +2,22 @@
 
 import asyncio
 import os
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from langchain_google_genai import ChatGoogleGenerativeAI
-from google import genai
 from langchain_core.messages import HumanMessage, AIMessage
 
 from .state import OrchestratorState, LanguageSearchState, ArticleInfo
 from .press_prompts import ARTICLE_EXTRACTION_PROMPT
-from .database import update_language_checked
+from .database import save_article_content, update_language_checked
+from .azerbaijan_prompts import AZERBAIJAN_KEYWORDS
 from .utils import clean_url
-
-
+from .llm_clients import get_chat_model, get_genai_client
+from .content_store import content_store, get_article_content
+from .dedup import ArticleIndex, deduplicate_articles
+from .search_cache import search_cache, normalize_query
+from .lru import LRUCache
+from .rate_limiter import gemini_governor
 # Dictionary of "Azerbaijan" translations in different languages
 AZERBAIJAN_TRANSLATIONS = {
     "en": ["Azerbaijan", "Azerbaijani", "Azeri", "Baku"],
@@ -86,17 +90,178 @@ AZERBAIJAN_TRANSLATIONS = {
 }
 
 
+# Maximum number of search queries per language
+MAX_QUERIES_PER_LANGUAGE = 5
+
+# Topics each language's country-name query is paired with: relations, economy, politics
+AZERBAIJAN_QUERY_TOPICS = {
+    "en": ["relations", "economy", "politics"],
+    "ru": ["отношения", "экономика", "политика"],
+    "uk": ["відносини", "економіка", "політика"],
+    "tr": ["ilişkiler", "ekonomi", "siyaset"],
+    "de": ["Beziehungen", "Wirtschaft", "Politik"],
+    "fr": ["relations", "économie", "politique"],
+    "es": ["relaciones", "economía", "política"],
+    "it": ["relazioni", "economia", "politica"],
+    "pl": ["stosunki", "gospodarka", "polityka"],
+    "ar": ["علاقات", "اقتصاد", "سياسة"],
+    "fa": ["روابط", "اقتصاد", "سیاست"],
+    "az": ["əlaqələr", "iqtisadiyyat", "siyasət"],
+    "ka": ["ურთიერთობები", "ეკონომიკა", "პოლიტიკა"],
+    "hy": ["հարաբերություններ", "տնտեսություն", "քաղաքականություն"],
+    "zh": ["关系", "经济", "政治"],
+    "ja": ["関係", "経済", "政治"]
+}
+
+# LLM-generated queries memoized per (language_code, date_filter)
+_generated_queries: LRUCache[tuple, List[str]] = LRUCache(max_entries=512)
+
+# Filter-passing articles a query is assumed to yield before it has any history
+DEFAULT_QUERY_YIELD = 2.0
+
+# Query yield history per (language_code, normalized query): (runs, articles kept)
+_query_yields: LRUCache[tuple, Tuple[int, int]] = LRUCache(max_entries=5000)
+
+# Token budget for one batched headline filter prompt
+HEADLINE_BATCH_TOKEN_BUDGET = int(os.getenv("HEADLINE_BATCH_TOKEN_BUDGET", "6000"))
+
+# How long the streaming pipeline holds a language's headlines for other languages
+# finishing the same wave, so they share filter prompts; 0 filters each language alone
+HEADLINE_BATCH_LINGER_SECONDS = float(os.getenv("HEADLINE_BATCH_LINGER_SECONDS", "0.5"))
+
+# Estimated tokens for the static filter instructions and for each language section header
+HEADLINE_FILTER_PROMPT_TOKENS = 400
+HEADLINE_SECTION_TOKENS = 20
+
+# Country whose perspective each language's headlines represent
+HEADLINE_COUNTRY_NAMES = {
+    "uk": "Ukraine", "ru": "Russia", "tr": "Turkey", "de": "Germany", 
+    "fr": "France", "es": "Spain", "it": "Italy", "pl": "Poland",
+    "en": "International English-speaking media", "ar": "Arab countries",
+    "fa": "Iran", "az": "Azerbaijan itself", "ka": "Georgia", "hy": "Armenia"
+}
+
+
+def get_azerbaijan_terms(language_code: str) -> List[str]:
+    """Get the known local terms for Azerbaijan in a language, without duplicates"""
+    terms = []
+    seen = set()
+    for term in AZERBAIJAN_TRANSLATIONS.get(language_code, []) + AZERBAIJAN_KEYWORDS.get(language_code, []):
+        if term.casefold() not in seen:
+            seen.add(term.casefold())
+            terms.append(term)
+    return terms
+
+
+def build_template_queries(language_code: str) -> List[str]:
+    """Build distinct search queries from the known local terms, without calling the LLM
+    
+    The country name runs on its own and paired with each topic, alternating
+    with the other terms. Inflections of the name (Azerbaijani, азербайджанский)
+    are dropped since search already matches them through the name.
+    """
+    terms = get_azerbaijan_terms(language_code)
+    if not terms:
+        return []
+    
+    name = terms[0]
+    topical = [f"{name} {topic}" for topic in AZERBAIJAN_QUERY_TOPICS.get(language_code, [])]
+    others = [term for term in terms[1:] if not term.casefold().startswith(name.casefold())]
+    
+    candidates = [name]
+    for index in range(max(len(topical), len(others))):
+        candidates.extend(topical[index:index + 1] + others[index:index + 1])
+    
+    queries = []
+    seen = set()
+    for query in candidates:
+        if normalize_query(query) not in seen:
+            seen.add(normalize_query(query))
+            queries.append(query)
+    return queries[:MAX_QUERIES_PER_LANGUAGE]
+
+
+def expected_query_yield(language_code: str, query: str) -> float:
+    """Average number of filter-passing articles a query has produced for a language"""
+    runs, kept = _query_yields.get((language_code, normalize_query(query))) or (0, 0)
+    if not runs:
+        return DEFAULT_QUERY_YIELD
+    return kept / runs
+
+
+def record_query_yields(language_code: str, queries_run: List[str], kept_articles: List[dict]) -> None:
+    """Credit each query that ran with the filter-passing articles it surfaced"""
+    kept_by_query: Dict[str, int] = {}
+    for article in kept_articles:
+        query = normalize_query(article.get("search_query", ""))
+        kept_by_query[query] = kept_by_query.get(query, 0) + 1
+    
+    for query in queries_run:
+        key = (language_code, normalize_query(query))
+        runs, kept = _query_yields.get(key) or (0, 0)
+        _query_yields.set(key, (runs + 1, kept + kept_by_query.get(normalize_query(query), 0)))
+
+
+def plan_query_wave(
+    language_code: str,
+    pending_queries: List[str],
+    remaining_quota: Optional[int]
+) -> Tuple[List[str], List[str]]:
+    """Pick the next queries to run for a language, best historical yield first
+    
+    Without a quota every pending query runs at once. With a quota, only as
+    many queries run as are expected to fill it; the rest wait until the
+    filtered results show whether they are needed.
+    """
+    ordered = sorted(pending_queries, key=lambda q: -expected_query_yield(language_code, q))
+    if not remaining_quota or remaining_quota <= 0:
+        return ordered, []
+    
+    wave = []
+    expected = 0.0
+    for query in ordered:
+        wave.append(query)
+        expected += expected_query_yield(language_code, query)
+        if expected >= remaining_quota:
+            break
+    return wave, ordered[len(wave):]
+
+
+def is_language_search_done(
+    language_state: Dict[str, Any],
+    max_articles: Optional[int]
+) -> bool:
+    """Check whether a language has met its quota or run out of queries"""
+    if max_articles and len(language_state.get("articles_found", [])) >= max_articles:
+        return True
+    pending = language_state.get("pending_queries")
+    return pending is not None and not pending
+
+
 async def create_language_search_queries(
     language_code: str, 
     language_name: str,
     model: ChatGoogleGenerativeAI,
     date_filter: Optional[str] = None
 ) -> List[str]:
-    """Create search queries using local language terms"""
+    """Create search queries using local language terms
+    
+    Languages covered by the term tables get deterministic queries. Others ask
+    the LLM once per (language, date filter). The date filter is applied when
+    the search runs, so it is not part of the returned queries.
+    """
+    
+    queries = build_template_queries(language_code)
+    if queries:
+        return queries
+    
+    memo_key = (language_code, date_filter)
+    memoized = _generated_queries.get(memo_key)
+    if memoized:
+        return list(memoized)
     
     # Let AI determine the translation itself!
     from .press_prompts import MULTI_LANGUAGE_SEARCH_PROMPT
-    from datetime import datetime
     
     prompt = MULTI_LANGUAGE_SEARCH_PROMPT.format(
         language_name=language_name,
@@ -106,21 +271,21 @@ async def create_language_search_queries(
     )
     
     try:
-        response = await model.ainvoke(prompt)
+        async with gemini_governor.slot():
+            response = await model.ainvoke(prompt)
         queries = response.content.strip().split('\n')
         # Clean up queries
-        queries = [q.strip() for q in queries if q.strip()]
-        # Add date filter if provided
-        if date_filter:
-            queries = [f"{q} {date_filter}" for q in queries]
-        return queries[:5]  # Max 5 queries
-    except:
-        # Fallback to simple queries
-        main_term = azerbaijan_terms[0] if azerbaijan_terms else "Azerbaijan"
-        queries = [main_term]
-        if date_filter:
-            queries = [f"{q} {date_filter}" for q in queries]
-        return queries
+        queries = [q.strip() for q in queries if q.strip()][:MAX_QUERIES_PER_LANGUAGE]
+    except Exception as e:
+        print(f"Error generating search queries for {language_name}: {e}")
+        queries = []
+    
+    if not queries:
+        # Fallback to the English term, without memoizing the failure
+        return ["Azerbaijan"]
+    
+    _generated_queries.set(memo_key, queries)
+    return list(queries)
 
 
 async def language_search_node(state: OrchestratorState) -> Dict[str, Any]:
@@ -141,12 +306,9 @@ async def language_search_node(state: OrchestratorState) -> Dict[str, Any]:
     if not language_states:
         return {"language_search_complete": True}
     
-    # Create Gemini model
-    model = ChatGoogleGenerativeAI(
-        model="gemini-2.0-flash",
-        temperature=0.7,
-        google_api_key=os.getenv("GEMINI_API_KEY")
-    )
+    # Get the shared Gemini model
+    model = get_chat_model("gemini-2.0-flash", temperature=0.7)
+    max_articles = state.get("max_articles_per_language")
     
     # Run searches in parallel
     search_tasks = []
@@ -155,13 +317,43 @@ async def language_search_node(state: OrchestratorState) -> Dict[str, Any]:
             language_code=lang_data["language_code"],
             language_state=lang_data["language_state"],
             model=model,
-            date_filter=lang_data["date_filter"]
+            date_filter=lang_data["date_filter"],
+            max_articles=max_articles
         )
         search_tasks.append(task)
     
     # Execute all searches in parallel
     results = await asyncio.gather(*search_tasks)
     
+    # Collapse stories found under several queries and languages before any
+    # LLM work, seeding the index with articles kept by earlier passes
+    index = ArticleIndex()
+    for lang_state in active_languages.values():
+        for article in lang_state.get("articles_found", []):
+            index.add(article)
+    
+    candidates_found = sum(len(r["articles_found"]) for r in results)
+    for search_result in results:
+        search_result["articles_found"] = deduplicate_articles(search_result["articles_found"], index)
+    if index.duplicates_merged:
+        print(f"🧹 Merged {index.duplicates_merged} duplicate articles out of {candidates_found} found")
+    
+    # AI filtering based on headlines ONLY - does this reflect country's opinion about Azerbaijan?
+    # Headlines from all languages share as few LLM calls as the token budget allows
+    articles_by_language = {
+        lang_data["language_code"]: search_result["articles_found"]
+        for lang_data, search_result in zip(language_states, results)
+    }
+    for lang_code, articles in articles_by_language.items():
+        if articles:
+            print(f"🔍 Found {len(articles)} articles before filtering for {lang_code}")
+    filtered = await ai_filter_headlines_batched(articles_by_language, model)
+    for lang_data, search_result in zip(language_states, results):
+        lang_code = lang_data["language_code"]
+        search_result["articles_found"] = filtered.get(lang_code, [])
+        if lang_code in filtered:
+            print(f"✅ Kept {len(filtered[lang_code])} articles after headline filtering for {lang_code}")
+    
     # Update state with results
     updated_active_searches = state.get("active_searches", {}).copy()
     all_articles = state.get("all_articles", [])
@@ -169,15 +361,24 @@ async def language_search_node(state: OrchestratorState) -> Dict[str, Any]:
     for i, lang_data in enumerate(language_states):
         lang_code = lang_data["language_code"]
         search_result = results[i]
+        record_query_yields(lang_code, search_result["queries_run"], search_result["articles_found"])
+        
+        # Keep earlier waves' articles and stop at the language's quota
+        kept_before = updated_active_searches[lang_code].get("articles_found", [])
+        new_articles = search_result["articles_found"]
+        if max_articles:
+            new_articles = new_articles[:max(max_articles - len(kept_before), 0)]
+        search_result["articles_found"] = kept_before + new_articles
         
         # Update language state
         updated_active_searches[lang_code].update(search_result)
-        # Set the correct field for orchestrator
-        updated_active_searches[lang_code]["search_completed"] = True
+        # Languages short of their quota go around again with their remaining queries
+        updated_active_searches[lang_code]["search_completed"] = is_language_search_done(
+            updated_active_searches[lang_code], max_articles
+        )
         
         # Add articles to global list
-        if search_result.get("articles_found"):
-            all_articles.extend(search_result["articles_found"])
+        all_articles.extend(new_articles)
     
     return {
         "active_searches": updated_active_searches,
@@ -190,15 +391,21 @@ async def search_news_in_language(
     language_code: str,
     language_state: Dict[str, Any],
     model: ChatGoogleGenerativeAI,
-    date_filter: str = None
+    date_filter: str = None,
+    max_articles: Optional[int] = None
 ) -> Dict[str, Any]:
     """Search for news in a specific language
     
+    Runs the next wave of pending queries. With max_articles set, the wave is
+    only as large as needed to fill what is left of the quota; the caller
+    filters the results and calls again while the quota is not met.
+    
     Args:
         language_code: Language code (e.g. 'tg', 'uz')
         language_state: Current state for this language search
         model: LLM model for queries
         date_filter: Date filter (e.g. 'after:2025-02-09 before:2025-02-10')
+        max_articles: Quota of filter-passing articles for this language
     """
     
     language_name = language_state["language_name"]
@@ -219,84 +426,151 @@ async def search_news_in_language(
         )
         language_state["search_queries"] = queries
     
-    articles_found = []
+    pending_queries = language_state.get("pending_queries")
+    if pending_queries is None:
+        pending_queries = language_state["search_queries"]
     
-    # Execute each search query
-    for query in language_state["search_queries"]:
-        try:
-            # Use Google genai client directly for grounding search
-            from google.genai import Client
-            client = Client(api_key=os.getenv("GEMINI_API_KEY"))
-            
+    remaining_quota = None
+    if max_articles:
+        remaining_quota = max_articles - len(language_state.get("articles_found", []))
+    wave, pending_queries = plan_query_wave(language_code, pending_queries, remaining_quota)
+    
+    # Run all queries for this language concurrently on the async client,
+    # paced by the global Gemini governor
+    client = get_genai_client()
+    
+    async def run_query(query: str) -> List[dict]:
+        # Repeated and overlapping runs reuse earlier grounding results
+        result = await search_cache.get(language_code, query, date_filter)
+        
+        if result is None:
             # Create search query with date filter
             search_prompt = f"{query} {date_filter}"
             
-            response = client.models.generate_content(
-                model="gemini-2.0-flash",
-                contents=search_prompt,
-                config={
-                    "tools": [{"google_search": {}}],
-                    "temperature": 0.7,
-                }
-            )
+            try:
+                async with gemini_governor.slot():
+                    response = await client.aio.models.generate_content(
+                        model="gemini-2.0-flash",
+                        contents=search_prompt,
+                        config={
+                            "tools": [{"google_search": {}}],
+                            "temperature": 0.7,
+                        }
+                    )
+            except Exception as e:
+                print(f"Error searching '{query}' in {language_name}: {e}")
+                return []
             
-            # Extract articles from grounding metadata
-            if response.candidates and len(response.candidates) > 0:
-                candidate = response.candidates[0]
-                if hasattr(candidate, 'grounding_metadata') and candidate.grounding_metadata:
-                    grounding = candidate.grounding_metadata
-                    
-                    # Process grounding chunks
-                    for chunk in grounding.grounding_chunks:
-                        if hasattr(chunk, 'web') and chunk.web:
-                            web_data = chunk.web
-                            
-                            # Create article entry for AI filtering
-                            article = {
-                                "url": clean_url(web_data.uri),
-                                "title": web_data.title or "No title",
-                                "source_name": extract_source_name(web_data.uri),
-                                "source_country": "unknown",  # Will be determined later
-                                "source_language": language_code,
-                                "language_name": language_name,
-                                "published_date": None,  # Not available from grounding
-                                "original_content": response.text,  # Full response text
-                                "translated_content": None,
-                                "summary": "",
-                                "sentiment": "neutral",
-                                "sentiment_score": 0.0,
-                                "sentiment_explanation": "",
-                                "key_phrases": [],
-                                "mentions_context": [],
-                                "topics": [],
-                                "search_query": query,
-                                "found_date": datetime.now()
-                            }
-                            
-                            # Add to list for AI filtering later
-                            articles_found.append(article)
+            result = grounding_result_from_response(response)
+            await search_cache.set(language_code, query, date_filter, result)
         
-        except Exception as e:
-            print(f"Error searching '{query}' in {language_name}: {e}")
-            continue
+        articles = extract_articles_from_grounding(result, query, language_code, language_name)
+        if articles:
+            # Persist the response text now, the in-process store may evict it
+            # before its articles are saved. Blobs whose articles are all
+            # dropped by dedup or filtering are pruned later.
+            await save_article_content(articles[0]["content_hash"], result["text"])
+        return articles
+    
+    results = await asyncio.gather(
+        *(run_query(query) for query in wave)
+    )
+    articles_found = [article for query_articles in results for article in query_articles]
     
     # AI filtering based on headlines ONLY - does this reflect country's opinion about Azerbaijan?
-    if articles_found:
-        print(f"🔍 Found {len(articles_found)} articles before filtering for {language_code}")
-        articles_found = await ai_filter_articles_by_headlines(articles_found, model, language_code)
-        print(f"✅ Kept {len(articles_found)} articles after headline filtering for {language_code}")
-    
     # Update database
-    await update_language_checked(language_code, True)
+    await update_language_checked(language_code, len(articles_found))
     
     return {
         "status": "completed",
         "articles_found": articles_found,
         "search_queries": language_state["search_queries"],
+        "queries_run": wave,
+        "pending_queries": pending_queries,
         "completed_at": datetime.now()
     }
 
 
+async def filter_language_articles(
+    articles: List[dict],
+    model: ChatGoogleGenerativeAI,
+    language_code: str
+) -> List[dict]:
+    """Run headline filtering for the deduplicated articles of one language"""
+    
+    if not articles:
+        return []
+    
+    print(f"🔍 Found {len(articles)} articles before filtering for {language_code}")
+    articles = await ai_filter_articles_by_headlines(articles, model, language_code)
+    print(f"✅ Kept {len(articles)} articles after headline filtering for {language_code}")
+    return articles
+
+
+def grounding_result_from_response(response: Any) -> Dict[str, Any]:
+    """Reduce a grounding search response to a cacheable dict of text and web chunks"""
+    
+    result = {"text": "", "chunks": []}
+    
+    if not response.candidates:
+        return result
+    
+    candidate = response.candidates[0]
+    grounding = getattr(candidate, "grounding_metadata", None)
+    if not grounding or not grounding.grounding_chunks:
+        return result
+    
+    result["text"] = response.text or ""
+    for chunk in grounding.grounding_chunks:
+        if hasattr(chunk, 'web') and chunk.web:
+            result["chunks"].append({"uri": chunk.web.uri, "title": chunk.web.title})
+    
+    return result
+
+
+def extract_articles_from_grounding(
+    result: Dict[str, Any],
+    query: str,
+    language_code: str,
+    language_name: str
+) -> List[dict]:
+    """Build article entries from the web chunks of a grounding search result"""
+    
+    articles = []
+    
+    if not result["chunks"]:
+        return articles
+    
+    # Every chunk of a response shares the same text, so store it once
+    response_hash = content_store.put(result["text"])
+    
+    # Process grounding chunks
+    for chunk in result["chunks"]:
+        # Create article entry for AI filtering
+        articles.append({
+            "url": clean_url(chunk["uri"]),
+            "title": chunk["title"] or "No title",
+            "source_name": extract_source_name(chunk["uri"]),
+            "source_country": "unknown",  # Will be determined later
+            "source_language": language_code,
+            "language_name": language_name,
+            "published_date": None,  # Not available from grounding
+            "content_hash": response_hash,  # Full response text lives in content_store
+            "translated_content": None,
+            "summary": "",
+            "sentiment": "neutral",
+            "sentiment_score": 0.0,
+            "sentiment_explanation": "",
+            "key_phrases": [],
+            "mentions_context": [],
+            "topics": [],
+            "search_query": query,
+            "found_date": datetime.now()
+        })
+    
+    return articles
+
+
 def extract_source_name(url: str) -> str:
     """Extract source name from URL"""
     try:
@@ -329,13 +603,14 @@ async def extract_article_info(
     
     prompt = ARTICLE_EXTRACTION_PROMPT.format(
         title=article["title"],
-        content=article["original_content"][:3000],  # Limit content length
+        content=get_article_content(article)[:3000],  # Limit content length
         language_name=article["language_name"],
         azerbaijan_terms=", ".join(azerbaijan_terms)
     )
     
     try:
-        response = await model.ainvoke(prompt)
+        async with gemini_governor.slot():
+            response = await model.ainvoke(prompt)
         
         # Parse response
         lines = response.content.split('\n')
@@ -367,74 +642,235 @@ async def ai_filter_articles_by_headlines(
 ) -> List[dict]:
     """AI looks at HEADLINES ONLY and decides: does this reflect country's opinion about Azerbaijan?"""
     
-    if not articles:
-        return []
-    
-    # Prepare article headlines for AI analysis
-    headlines_data = []
-    for i, article in enumerate(articles):
-        headlines_data.append(f"{i+1}. [{article['source_name']}] {article['title']}")
-    
-    headlines_text = "\n".join(headlines_data)
-    
-    # Map language codes to country names
-    country_names = {
-        "uk": "Ukraine", "ru": "Russia", "tr": "Turkey", "de": "Germany", 
-        "fr": "France", "es": "Spain", "it": "Italy", "pl": "Poland",
-        "en": "International English-speaking media", "ar": "Arab countries",
-        "fa": "Iran", "az": "Azerbaijan itself", "ka": "Georgia", "hy": "Armenia"
-    }
-    
-    country_name = country_names.get(language_code, f"country using {language_code} language")
-    
-    prompt = f"""HEADLINE ANALYSIS: Look at these headlines and decide - do they show {country_name}'s OPINION/PERSPECTIVE about Azerbaijan?
+    filtered = await ai_filter_headlines_batched({language_code: articles}, model)
+    return filtered.get(language_code, [])
+
+
+def get_headline_country_name(language_code: str) -> str:
+    """Get the country or region whose perspective a language's headlines represent"""
+    return HEADLINE_COUNTRY_NAMES.get(language_code, f"country using {language_code} language")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for budgeting prompts (about 4 characters per token)"""
+    return len(text) // 4 + 1
 
-Language: {language_code} 
-Country/Region: {country_name}
+
+def format_headline(number: int, article: dict) -> str:
+    """Format one numbered headline line for the filter prompt"""
+    return f"{number}. [{article.get('source_name', '')}] {article.get('title', '')}"
+
+
+def plan_headline_batches(
+    articles_by_language: Dict[str, List[dict]],
+    token_budget: int = HEADLINE_BATCH_TOKEN_BUDGET
+) -> List[List[Tuple[str, List[dict]]]]:
+    """Pack headlines from many languages into as few prompts as the token budget allows
+    
+    A language's headlines stay together when they fit; a language that alone
+    exceeds the budget is split across batches.
+    """
+    available = max(token_budget - HEADLINE_FILTER_PROMPT_TOKENS, HEADLINE_SECTION_TOKENS * 2)
+    
+    batches: List[List[Tuple[str, List[dict]]]] = []
+    current: List[Tuple[str, List[dict]]] = []
+    used = 0
+    
+    for language_code, articles in articles_by_language.items():
+        chunk: List[dict] = []
+        chunk_tokens = HEADLINE_SECTION_TOKENS
+        for article in articles:
+            tokens = estimate_tokens(format_headline(999, article))
+            if (current or chunk) and used + chunk_tokens + tokens > available:
+                # Close the batch; the rest of this language continues in the next one
+                if chunk:
+                    current.append((language_code, chunk))
+                batches.append(current)
+                current, used = [], 0
+                chunk, chunk_tokens = [], HEADLINE_SECTION_TOKENS
+            chunk.append(article)
+            chunk_tokens += tokens
+        if chunk:
+            current.append((language_code, chunk))
+            used += chunk_tokens
+    
+    if current:
+        batches.append(current)
+    return batches
+
+
+def build_headline_filter_prompt(batch: List[Tuple[str, List[dict]]]) -> str:
+    """Build the headline filter prompt for a batch, numbering headlines across sections"""
+    
+    sections = []
+    number = 0
+    for language_code, articles in batch:
+        lines = [
+            f"### Language: {language_code} | Country/Region: {get_headline_country_name(language_code)}"
+        ]
+        for article in articles:
+            number += 1
+            lines.append(format_headline(number, article))
+        sections.append("\n".join(lines))
+    
+    headlines_text = "\n\n".join(sections)
+    
+    return f"""HEADLINE ANALYSIS: Look at these headlines and decide - do they show the OPINION/PERSPECTIVE of their section's country about Azerbaijan?
+
+Headlines are grouped by language. Each section names the country/region whose media it represents.
 
 Headlines found:
 {headlines_text}
 
-QUESTION: Which headlines show how {country_name} VIEWS or DISCUSSES Azerbaijan?
+QUESTION: Which headlines show how the section's country VIEWS or DISCUSSES Azerbaijan?
 
 INCLUDE headlines that show:
-✅ {country_name}'s diplomatic position on Azerbaijan
-✅ {country_name}'s economic relations with Azerbaijan  
-✅ {country_name}'s political commentary about Azerbaijan
-✅ How {country_name} media analyzes Azerbaijan's actions
-✅ {country_name}'s stance on Azerbaijan conflicts/policies
+✅ The country's diplomatic position on Azerbaijan
+✅ The country's economic relations with Azerbaijan  
+✅ The country's political commentary about Azerbaijan
+✅ How the country's media analyzes Azerbaijan's actions
+✅ The country's stance on Azerbaijan conflicts/policies
 
 EXCLUDE headlines about:
 ❌ Sports matches/results (football, UEFA, etc.)
 ❌ Weather/tourism
-❌ Internal Azerbaijan news (we want EXTERNAL view)
+❌ Internal Azerbaijan news (we want EXTERNAL view) - unless the section is Azerbaijan itself
 ❌ Headlines that don't actually mention Azerbaijan
 ❌ Entertainment/celebrity news
 ❌ Technical/economic data without political context
 
-Focus: Does this headline reflect {country_name}'s PERSPECTIVE on Azerbaijan?
+Focus: Does this headline reflect its country's PERSPECTIVE on Azerbaijan?
 
 Return only the numbers separated by commas (e.g. "1,3,7")
 If NO headlines show country's opinion about Azerbaijan, return "NONE"
 """
 
-    try:
-        response = await model.ainvoke(prompt)
-        result = response.content.strip()
+
+async def ai_filter_headlines_batched(
+    articles_by_language: Dict[str, List[dict]],
+    model: ChatGoogleGenerativeAI,
+    token_budget: int = HEADLINE_BATCH_TOKEN_BUDGET
+) -> Dict[str, List[dict]]:
+    """Filter headlines for many languages in as few LLM calls as the token budget allows"""
+    
+    articles_by_language = {lang: arts for lang, arts in articles_by_language.items() if arts}
+    filtered: Dict[str, List[dict]] = {lang: [] for lang in articles_by_language}
+    if not articles_by_language:
+        return filtered
+    
+    batches = plan_headline_batches(articles_by_language, token_budget)
+    
+    async def run_batch(batch: List[Tuple[str, List[dict]]]) -> List[Tuple[str, dict]]:
+        # Flatten so the model's numbers map straight back to (language, article)
+        numbered = [(lang, article) for lang, articles in batch for article in articles]
+        prompt = build_headline_filter_prompt(batch)
+        
+        try:
+            async with gemini_governor.slot():
+                response = await model.ainvoke(prompt)
+            result = response.content.strip()
+        except Exception as e:
+            print(f"Error in headline filtering: {e}")
+            return numbered
         
         if result == "NONE":
             return []
         
-        # Parse the numbers
         try:
-            selected_indices = [int(x.strip()) - 1 for x in result.split(",") if x.strip().isdigit()]
-            filtered_articles = [articles[i] for i in selected_indices if 0 <= i < len(articles)]
-            return filtered_articles
-            
-        except Exception as e:
-            # If parsing fails, return all articles
-            return articles
+            selected = sorted({int(x.strip()) - 1 for x in result.split(",") if x.strip().isdigit()})
+            return [numbered[i] for i in selected if 0 <= i < len(numbered)]
+        except Exception:
+            # If parsing fails, keep every headline in the batch
+            return numbered
+    
+    results = await asyncio.gather(*(run_batch(batch) for batch in batches))
+    for kept in results:
+        for language_code, article in kept:
+            filtered[language_code].append(article)
+    
+    if len(articles_by_language) > 1:
+        print(f"🗂️ Filtered headlines for {len(articles_by_language)} languages in {len(batches)} LLM calls")
+    return filtered
+
+
+class HeadlineFilterBatcher:
+    """Pool the headline filtering of concurrently searching languages into shared prompts
+    
+    Each language submits its wave's headlines and waits. The pooled headlines
+    are filtered together once every language still searching has submitted, or
+    once linger_seconds pass after the first submission, whichever is sooner.
+    The linger trades up to that much latency per wave for fewer LLM calls.
+    Each language must have at most one submission waiting at a time.
+    """
     
-    except Exception as e:
-        print(f"Error in headline filtering: {e}")
-        return articles
\ No newline at end of file
+    def __init__(
+        self,
+        model: ChatGoogleGenerativeAI,
+        active_languages: int,
+        linger_seconds: float = HEADLINE_BATCH_LINGER_SECONDS
+    ):
+        self.model = model
+        self.active_languages = active_languages
+        self.linger_seconds = linger_seconds
+        self.flushes = 0
+        self._pending: Dict[str, Tuple[List[dict], asyncio.Future]] = {}
+        self._timer: Optional[asyncio.Task] = None
+        self._flush_tasks: set = set()
+    
+    async def filter(self, articles: List[dict], language_code: str) -> List[dict]:
+        """Filter one language's headlines, pooled with other languages of the same wave"""
+        
+        if not articles:
+            return []
+        if self.linger_seconds <= 0:
+            self.flushes += 1
+            return await filter_language_articles(articles, self.model, language_code)
+        
+        print(f"🔍 Found {len(articles)} articles before filtering for {language_code}")
+        future = asyncio.get_running_loop().create_future()
+        self._pending[language_code] = (articles, future)
+        
+        if len(self._pending) >= self.active_languages:
+            self._start_flush()
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_after_linger())
+        
+        articles = await future
+        print(f"✅ Kept {len(articles)} articles after headline filtering for {language_code}")
+        return articles
+    
+    def finish(self, language_code: str) -> None:
+        """Stop waiting for a language that has no more waves to filter"""
+        self.active_languages -= 1
+        if self._pending and len(self._pending) >= self.active_languages:
+            self._start_flush()
+    
+    async def _flush_after_linger(self) -> None:
+        await asyncio.sleep(self.linger_seconds)
+        self._timer = None
+        self._start_flush()
+    
+    def _start_flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, {}
+        # Hold a reference so the flush task is not garbage collected mid-flight
+        task = asyncio.create_task(self._flush(pending))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+    
+    async def _flush(self, pending: Dict[str, Tuple[List[dict], asyncio.Future]]) -> None:
+        self.flushes += 1
+        try:
+            filtered = await ai_filter_headlines_batched(
+                {language_code: articles for language_code, (articles, _) in pending.items()},
+                self.model
+            )
+        except Exception as e:
+            print(f"Error in batched headline filtering: {e}")
+            filtered = {language_code: articles for language_code, (articles, _) in pending.items()}
+        
+        for language_code, (_, future) in pending.items():
+            if not future.done():
+                future.set_result(filtered.get(language_code, []))
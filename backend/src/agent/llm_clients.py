@@ -0,0 +1,99 @@
+"""Process-wide registry of pooled Gemini clients shared by all graph nodes"""
+
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple, Type
+
+import httpx
+from google import genai
+from langchain_google_genai import ChatGoogleGenerativeAI
+from pydantic import BaseModel
+
+
+# Keep-alive settings for the HTTP connections behind the genai client
+HTTP_CONNECTION_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=60.0
+)
+
+_lock = threading.Lock()
+_api_key: Optional[str] = None
+_genai_client: Optional[genai.Client] = None
+_chat_models: Dict[Tuple[str, float, int], ChatGoogleGenerativeAI] = {}
+_structured_models: Dict[Tuple[Tuple[str, float, int], Type[BaseModel]], Any] = {}
+
+
+def get_api_key() -> Optional[str]:
+    """Get the Gemini API key, reading the environment only once"""
+    global _api_key
+    if _api_key is None:
+        _api_key = os.getenv("GEMINI_API_KEY")
+    return _api_key
+
+
+def get_genai_client() -> genai.Client:
+    """Get the shared genai client used for grounding searches"""
+    global _genai_client
+    if _genai_client is None:
+        with _lock:
+            if _genai_client is None:
+                _genai_client = genai.Client(
+                    api_key=get_api_key(),
+                    http_options={
+                        "client_args": {"limits": HTTP_CONNECTION_LIMITS},
+                        "async_client_args": {"limits": HTTP_CONNECTION_LIMITS},
+                    }
+                )
+    return _genai_client
+
+
+def get_chat_model(
+    model: str = "gemini-2.0-flash",
+    temperature: float = 0.7,
+    max_retries: int = 2
+) -> ChatGoogleGenerativeAI:
+    """Get a pooled chat model for the given model name and temperature"""
+    key = chat_model_key(model, temperature, max_retries)
+    chat_model = _chat_models.get(key)
+    if chat_model is None:
+        with _lock:
+            chat_model = _chat_models.get(key)
+            if chat_model is None:
+                chat_model = ChatGoogleGenerativeAI(
+                    model=model,
+                    temperature=temperature,
+                    max_retries=max_retries,
+                    google_api_key=get_api_key()
+                )
+                _chat_models[key] = chat_model
+    return chat_model
+
+
+def chat_model_key(model: str, temperature: Optional[float], max_retries: int) -> Tuple[str, float, int]:
+    """Get the registry key of a chat model configuration"""
+    return (model, float(temperature or 0.0), int(max_retries))
+
+
+def get_structured_model(
+    schema: Type[BaseModel],
+    model: str = "gemini-2.0-flash",
+    temperature: float = 0.7,
+    max_retries: int = 2
+) -> Any:
+    """Get a pooled chat model bound to a structured output schema"""
+    return bind_structured_output(get_chat_model(model, temperature, max_retries), schema)
+
+
+def bind_structured_output(chat_model: ChatGoogleGenerativeAI, schema: Type[BaseModel]) -> Any:
+    """Get the structured output runnable for a chat model, building it only once"""
+    # Keyed by configuration, so equally configured models share one binding
+    key = (chat_model_key(chat_model.model, chat_model.temperature, chat_model.max_retries), schema)
+    structured = _structured_models.get(key)
+    if structured is None:
+        with _lock:
+            structured = _structured_models.get(key)
+            if structured is None:
+                structured = chat_model.with_structured_output(schema)
+                _structured_models[key] = structured
+    return structured
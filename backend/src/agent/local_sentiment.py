@@ -0,0 +1,206 @@
+"""Offline lexicon and linear pre-classifier for article sentiment
+
+Scores each article on CPU from its headline, summary and key phrases.
+Confident results are used as-is; the rest escalate to Gemini. The cue lists
+are hand-written rather than fitted to labelled articles, so the tier is off
+unless LOCAL_SENTIMENT_ENABLED is set, and only languages with cue lists are
+ever settled locally.
+"""
+
+import math
+import os
+import re
+import unicodedata
+from typing import Any, Dict, List, Tuple
+
+from .azerbaijan_prompts import AZERBAIJAN_KEYWORDS
+from .tools_and_schemas import SentimentAnalysis
+
+
+# Name local results are cached and stored under
+LOCAL_SENTIMENT_MODEL = "local-lexicon-v1"
+
+# Whether confident articles skip Gemini; off by default as the lexicon is uncalibrated
+LOCAL_SENTIMENT_ENABLED = os.getenv("LOCAL_SENTIMENT_ENABLED", "false").lower() in ("1", "true", "yes")
+
+# Articles below this confidence are sent to Gemini
+LOCAL_SENTIMENT_MIN_CONFIDENCE = float(os.getenv("LOCAL_SENTIMENT_MIN_CONFIDENCE", "0.8"))
+
+# Cue stems per language. Matching is on word prefixes, so stems cover inflections;
+# a trailing space makes a cue match the whole word only.
+POSITIVE_CUES = {
+    "en": ["agree", "partner", "cooperat", "strengthen", "welcome", "success",
+           "peace", "growth", "invest", "support", "praise", "boost", "friendship", "milestone"],
+    "ru": ["соглаш", "сотрудничеств", "партнер", "партнёр", "укреп", "успех", "мирн",
+           "рост", "инвестиц", "поддерж", "дружб", "развити"],
+    "tr": ["anlaşma", "işbirliği", "ortaklık", "güçlen", "başarı", "barış", "büyüme", "yatırım",
+           "destek", "kardeş", "dostluk", "memnuniyet"],
+    "de": ["abkommen", "partner", "zusammenarbeit", "stärk", "erfolg", "frieden", "wachstum",
+           "investition", "unterstütz", "freundschaft"],
+    "fr": ["accord", "partenari", "coopérat", "renforc", "succès", "paix", "croissance",
+           "investiss", "soutien", "amitié"],
+    "es": ["acuerdo", "cooperación", "fortalec", "éxito", "paz", "crecimiento",
+           "inversi", "apoyo", "amistad"],
+}
+
+NEGATIVE_CUES = {
+    "en": ["conflict", "war ", "attack", "accus", "condemn", "sanction", "crisis", "tension",
+           "violat", "arrest", "protest", "threat", "clash", "kill", "dispute", "crackdown",
+           "criticiz", "criticis", "repression", "corruption"],
+    "ru": ["конфликт", "войн", "атак", "обвин", "осужд", "санкц", "кризис", "напряж",
+           "нарушен", "арест", "протест", "угроз", "столкновен", "убит", "спор ", "критик",
+           "репресс", "коррупц"],
+    "tr": ["çatışma", "savaş", "saldırı", "suçla", "kına", "yaptırım", "kriz",
+           "gerginlik", "ihlal", "tutuklama", "protesto", "tehdit", "eleştir"],
+    "de": ["konflikt", "krieg", "angriff", "vorwurf", "verurteil", "sanktion", "krise",
+           "spannung", "verletz", "festnahme", "protest", "drohung", "kritik", "korruption"],
+    "fr": ["conflit", "guerre", "attaque", "accus", "condamn", "sanction", "crise", "tension",
+           "violation", "arrestation", "protest", "menace", "critiqu", "corruption"],
+    "es": ["conflicto", "guerra", "ataque", "acus", "conden", "sanci", "crisis", "tensi",
+           "violaci", "arresto", "protesta", "amenaza", "critic", "corrupci"],
+}
+
+# Routine wire-copy wording that signals factual, neutral reporting
+NEUTRAL_CUES = {
+    "en": ["said", "says", "meet", "visit", "talks", "held", "announc", "report", "discuss",
+           "minister", "president", "official", "according"],
+    "ru": ["заяв", "встреч", "визит", "переговор", "состоял", "сообщ", "обсуд", "министр",
+           "президент", "по данным"],
+    "tr": ["açıkla", "görüş", "ziyaret", "bakan", "cumhurbaşkanı", "bildir", "düzenlen"],
+    "de": ["sagte", "treffen", "besuch", "gespräch", "minister", "präsident", "bericht"],
+    "fr": ["déclar", "rencontr", "visite", "entretien", "ministre", "président", "selon"],
+    "es": ["dijo", "reuni", "visita", "conversaci", "ministro", "presidente", "según"],
+}
+
+# Words that flip the cue right after them ("end of war", "no agreement"), per language.
+# Turkish negates with suffixes and postpositions, which a leading window cannot see.
+NEGATORS = {
+    "en": ["no ", "not ", "without ", "against ", "anti ", "end ", "ends ", "ending ", "ended ",
+           "halt", "stop", "avert", "avoid", "prevent", "resolv", "lift"],
+    "ru": ["не ", "нет ", "без ", "против ", "конец ", "конца ", "окончан", "прекращ", "заверш",
+           "отмен", "урегулир", "предотвращ"],
+    "tr": [],
+    "de": ["kein", "nicht ", "ohne ", "gegen ", "ende ", "beend", "stopp", "aufheb", "verhinder"],
+    "fr": ["pas ", "sans ", "contre ", "fin ", "mettre fin", "levée ", "évit", "arrêt"],
+    "es": ["no ", "sin ", "contra ", "fin ", "poner fin", "levant", "evit", "deten"],
+}
+
+# Preceding words searched for a negator
+NEGATION_WINDOW = 3
+
+# Languages the local tier may settle; the rest always escalate to Gemini
+LOCAL_SENTIMENT_LANGUAGES = frozenset(POSITIVE_CUES)
+
+# Linear model weights over the extracted features
+WEIGHTS = {
+    "positive": 1.0,
+    "negative": -1.2,  # Critical wording is rarer and more telling than friendly wording
+}
+NEUTRAL_BASE_CONFIDENCE = 0.6
+NEUTRAL_CUE_CONFIDENCE = 0.1
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for cue matching"""
+    text = unicodedata.normalize("NFKC", text or "").casefold()
+    return " " + " ".join(re.sub(r"[^\w\s]", " ", text).split()) + " "
+
+
+def count_cues(text: str, cues: List[str]) -> int:
+    """Count cue stems that start a word in the normalized text"""
+    return sum(1 for cue in cues if f" {cue.casefold()}" in text)
+
+
+def count_polar_cues(text: str, cues: List[str], negators: List[str]) -> Tuple[int, int]:
+    """Count cue stems in the normalized text, split into (plain, negated)
+
+    A cue is negated when every occurrence follows a negator within
+    NEGATION_WINDOW words.
+    """
+    plain = negated = 0
+    for cue in cues:
+        needle = f" {cue.casefold()}"
+        position = text.find(needle)
+        if position < 0:
+            continue
+        is_plain = False
+        while position >= 0:
+            preceding = " " + " ".join(text[:position].split()[-NEGATION_WINDOW:]) + " "
+            if count_cues(preceding, negators) == 0:
+                is_plain = True
+                break
+            position = text.find(needle, position + 1)
+        if is_plain:
+            plain += 1
+        else:
+            negated += 1
+    return plain, negated
+
+
+def extract_features(article: Dict[str, Any]) -> Dict[str, int]:
+    """Extract lexicon features from the headline, summary and key phrases"""
+    text = normalize_text(" ".join([
+        article.get("title", ""),
+        article.get("summary") or "",
+        " ".join(article.get("key_phrases") or [])
+    ]))
+
+    # English cues apply too, since grounding titles are often in English
+    language = article.get("source_language", "en")
+    languages = {language, "en"} if language in LOCAL_SENTIMENT_LANGUAGES else {"en"}
+
+    terms = AZERBAIJAN_KEYWORDS.get(language, []) + AZERBAIJAN_KEYWORDS["en"]
+
+    features = {"positive": 0, "negative": 0, "neutral": 0}
+    for lang in languages:
+        # A negated cue counts toward the opposite polarity
+        positive, negated_positive = count_polar_cues(text, POSITIVE_CUES[lang], NEGATORS[lang])
+        negative, negated_negative = count_polar_cues(text, NEGATIVE_CUES[lang], NEGATORS[lang])
+        features["positive"] += positive + negated_negative
+        features["negative"] += negative + negated_positive
+        features["neutral"] += count_cues(text, NEUTRAL_CUES[lang])
+    features["mentions"] = count_cues(text, terms)
+    return features
+
+
+def classify_article_locally(article: Dict[str, Any]) -> Tuple[SentimentAnalysis, float]:
+    """Score an article with the offline lexicon model, returning the result and its confidence
+
+    Articles in languages without cue lists get zero confidence, so they always escalate.
+    """
+    if article.get("source_language", "en") not in LOCAL_SENTIMENT_LANGUAGES:
+        analysis = SentimentAnalysis(
+            sentiment="neutral",
+            score=0.0,
+            explanation="Local lexicon model: language not covered",
+            key_phrases=[]
+        )
+        return analysis, 0.0
+
+    features = extract_features(article)
+    positive, negative, neutral = features["positive"], features["negative"], features["neutral"]
+    margin = positive * WEIGHTS["positive"] + negative * WEIGHTS["negative"]
+
+    if positive and negative:
+        # Mixed signals are exactly what the LLM is for
+        confidence = 0.3
+    elif positive or negative:
+        confidence = 1 - math.exp(-abs(margin))
+    else:
+        confidence = min(0.95, NEUTRAL_BASE_CONFIDENCE + NEUTRAL_CUE_CONFIDENCE * neutral)
+        if not features["mentions"]:
+            # Passing mentions outside the headline are rarely opinionated
+            confidence = min(0.95, confidence + 0.05)
+
+    sentiment = "positive" if margin > 0 else "negative" if margin < 0 else "neutral"
+
+    analysis = SentimentAnalysis(
+        sentiment=sentiment,
+        score=round(math.tanh(margin / 2), 3),
+        explanation=(
+            f"Local lexicon model: {positive} positive, {negative} negative, "
+            f"{neutral} neutral cues (confidence {confidence:.2f})"
+        ),
+        key_phrases=[]
+    )
+    return analysis, round(confidence, 3)
@@ -0,0 +1,72 @@
+"""Bounded in-process LRU cache shared by the memory tiers of the agent caches"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Generic, Hashable, Iterable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """Thread-safe LRU mapping holding at most max_entries values
+
+    With ttl_seconds, or an explicit expires_at (a time.time() timestamp)
+    per entry, expired entries read as misses and are dropped when read.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: Optional[float] = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[K, Tuple[Optional[float], V]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: K) -> Optional[V]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def get(self, key: K) -> Optional[V]:
+        """Get a value, marking it most recently used"""
+        with self._lock:
+            return self._get(key)
+
+    def get_many(self, keys: Iterable[K]) -> Dict[K, V]:
+        """Get every cached value for a collection of keys"""
+        found: Dict[K, V] = {}
+        with self._lock:
+            for key in keys:
+                value = self._get(key)
+                if value is not None:
+                    found[key] = value
+        return found
+
+    def set(self, key: K, value: V, expires_at: Optional[float] = None) -> None:
+        """Store a value, evicting the least recently used entries over the bound"""
+        if expires_at is None and self.ttl_seconds is not None:
+            expires_at = time.time() + self.ttl_seconds
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, key: K) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and (entry[0] is None or entry[0] > time.time())
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -10,7 +10,6 @@ from .database import (
     db_manager, 
     get_uncovered_languages, 
     get_languages_by_regions,
-    save_articles_to_db,
     LANGUAGE_NAMES
 )
 
@@ -40,6 +39,7 @@ async def orchestrator_node(state: OrchestratorState) -> Dict[str, Any]:
             "language_code": lang_code,
             "language_name": LANGUAGE_NAMES.get(lang_code, lang_code),
             "search_queries": [],
+            "pending_queries": None,
             "articles_found": [],
             "search_completed": False
         }
@@ -83,9 +83,7 @@ async def aggregate_results(state: OrchestratorState) -> Dict[str, Any]:
         articles = search_state.get("articles_found", [])
         all_articles.extend(articles)
     
-    # Save to database if articles found
-    if all_articles:
-        await save_articles_to_db(all_articles)
+    # Articles are saved once, after sentiment analysis
     
     # Group by sentiment (this will be updated after sentiment analysis)
     positive = [a for a in all_articles if a.get("sentiment") == "positive"]
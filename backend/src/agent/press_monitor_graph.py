@@ -1,5 +1,8 @@
 """Main graph for the press monitoring system"""
 
+import os
+from typing import Optional
+
 from langgraph.graph import StateGraph, END
 from langchain_core.messages import HumanMessage
 
@@ -11,14 +14,28 @@ from .orchestrator import (
     route_to_language_agents
 )
 from .language_agents import language_search_node
+from .streaming_pipeline import streaming_pipeline_node
 from .sentiment_analyzer import sentiment_analysis_node
 from .temporal_analytics import temporal_analysis_node
 from .digest_generator import generate_digest_node, generate_executive_summary
 from .database import db_manager
 
 
-def create_press_monitor_graph():
-    """Create the main press monitoring graph"""
+# Default pipeline for runs that do not choose one; "true" streams each language through
+PRESS_MONITOR_STREAMING = os.getenv("PRESS_MONITOR_STREAMING", "false").lower() in ("1", "true", "yes")
+
+
+def create_press_monitor_graph(streaming: bool = False):
+    """Create the main press monitoring graph
+    
+    Args:
+        streaming: Process each language's articles through filtering,
+            sentiment and persistence as soon as its search finishes,
+            instead of waiting for every language at each stage
+    """
+    
+    if streaming:
+        return create_streaming_press_monitor_graph()
     
     # Create the graph with OrchestratorState
     graph = StateGraph(OrchestratorState)
@@ -68,6 +85,30 @@ def create_press_monitor_graph():
     return graph.compile()
 
 
+def create_streaming_press_monitor_graph():
+    """Create the press monitoring graph with the per-language streaming pipeline"""
+    
+    graph = StateGraph(OrchestratorState)
+    
+    graph.add_node("start_orchestrator", orchestrator_node)
+    graph.add_node("streaming_pipeline", streaming_pipeline_node)
+    graph.add_node("temporal_analysis", temporal_analysis_node)
+    graph.add_node("generate_digests", generate_digest_node)
+    graph.add_node("generate_executive_summary", generate_executive_summary_node)
+    
+    graph.set_entry_point("start_orchestrator")
+    
+    # Search, filtering, sentiment and saving all happen inside the pipeline;
+    # only the run-wide analyses wait for every language
+    graph.add_edge("start_orchestrator", "streaming_pipeline")
+    graph.add_edge("streaming_pipeline", "temporal_analysis")
+    graph.add_edge("temporal_analysis", "generate_digests")
+    graph.add_edge("generate_digests", "generate_executive_summary")
+    graph.add_edge("generate_executive_summary", END)
+    
+    return graph.compile()
+
+
 async def generate_executive_summary_node(state: OrchestratorState) -> dict:
     """Node to generate executive summary"""
     
@@ -89,16 +130,24 @@ async def run_press_monitor(
     target_regions: list = None,
     translation_enabled: bool = True,
     max_articles_per_language: int = 10,
-    date_filter: str = None
+    date_filter: str = None,
+    streaming: Optional[bool] = None
 ) -> dict:
-    """Run the press monitoring system"""
+    """Run the press monitoring system
+    
+    streaming selects the per-language streaming pipeline; None falls back
+    to PRESS_MONITOR_STREAMING.
+    """
+    
+    if streaming is None:
+        streaming = PRESS_MONITOR_STREAMING
     
-    # Initialize database connection
-    await db_manager.initialize()
+    # Reuse the application pool when there is one; otherwise own a pool for this run
+    owns_pool = await db_manager.initialize()
     
     try:
         # Create the graph
-        graph = create_press_monitor_graph()
+        graph = create_press_monitor_graph(streaming=streaming)
         
         # Set default date filter to today if not specified
         if not date_filter:
@@ -132,8 +181,9 @@ async def run_press_monitor(
         return result
         
     finally:
-        # Close database connection
-        await db_manager.close()
+        # Only close a pool this run opened; the app lifespan closes its own
+        if owns_pool:
+            await db_manager.close()
 
 
 # Configuration for different monitoring scenarios
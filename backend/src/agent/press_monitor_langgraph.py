@@ -179,9 +179,8 @@ async def press_monitor_node(state: Dict[str, Any]) -> Dict[str, Any]:
         params = extract_monitoring_params_from_content(user_query)
         print(f"📰 Extracted params: {params}")
     
-    # Initialize database if needed
-    if not db_manager.pool:
-        await db_manager.initialize()
+    # Initialize database if needed (no-op when the app pool is already open)
+    await db_manager.initialize()
     
     # Create orchestrator state
     orchestrator_state = OrchestratorState(
@@ -216,7 +215,8 @@ async def press_monitor_node(state: Dict[str, Any]) -> Dict[str, Any]:
             target_languages=params.get("target_languages"),
             target_regions=params.get("target_regions"),
             max_articles_per_language=state.get("max_articles_per_language", 10),
-            date_filter=params.get("date_filter")
+            date_filter=params.get("date_filter"),
+            streaming=state.get("press_monitor_streaming")
         )
         
         # Format results
@@ -25,7 +25,23 @@ EXPERT_OPINIONS: [Non-official views]
 SENTIMENT: [Critical/Balanced/Supportive]"""
 
 
-SENTIMENT_ANALYSIS_PROMPT = """Analyze sentiment for: {title}
+CONTENT_ANALYSIS_PROMPT = """Analyze how this {language_name} text covers Azerbaijan.
+
+Text:
+{content}
+
+Provide a brief summary, the passages mentioning Azerbaijan, their dominant
+context and up to five main topics."""
+
+
+# Bump whenever the sentiment prompts change so cached scores are not reused
+SENTIMENT_PROMPT_VERSION = "2"
+
+SENTIMENT_ANALYSIS_PROMPT = """Analyze sentiment towards Azerbaijan for: {title}
+
+Summary: {summary}
+Mentions: {mentions}
+Content: {content}
 
 Score from -1.0 (critical) to 1.0 (positive):
 - Critical: -1.0 to -0.3
@@ -38,6 +54,26 @@ SCORE: [-1.0 to 1.0]
 EVIDENCE: [Key phrases supporting score]"""
 
 
+SENTIMENT_BATCH_PROMPT = """Analyze sentiment towards Azerbaijan for each article below.
+
+Score from -1.0 (critical) to 1.0 (positive):
+- Critical: -1.0 to -0.3
+- Neutral: -0.2 to 0.2  
+- Positive: 0.3 to 1.0
+
+Sentiment must be one of: positive, negative, neutral.
+
+{language_instructions}
+
+Each article lists its title, summary, Azerbaijan mentions and a content excerpt.
+Judge the coverage of Azerbaijan, not just the headline.
+
+Articles:
+{articles}
+
+Return exactly one result per article, using the article's number as its index."""
+
+
 DIGEST_GENERATION_PROMPT = """Azerbaijan Press Digest - {date}
 
 Articles: {total_articles} | Opinion pieces: {opinion_count}
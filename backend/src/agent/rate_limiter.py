@@ -0,0 +1,149 @@
+"""Global rate limiter and adaptive concurrency governor for Gemini traffic"""
+
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+
+# Upper bounds; the governor adapts below these from observed latency and 429s
+GEMINI_MAX_REQUESTS_PER_SECOND = float(os.getenv("GEMINI_MAX_REQUESTS_PER_SECOND", "10"))
+GEMINI_MAX_CONCURRENCY = int(os.getenv("GEMINI_MAX_CONCURRENCY", "16"))
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Check whether an exception from any Gemini client means we were throttled"""
+    for attr in ("code", "status_code"):
+        if getattr(error, attr, None) == 429:
+            return True
+    message = str(error)
+    return "429" in message or "RESOURCE_EXHAUSTED" in message or "rate limit" in message.lower()
+
+
+class GeminiGovernor:
+    """Token bucket plus AIMD concurrency limit shared by every Gemini call
+
+    The token bucket caps request rate; the concurrency limit grows by one
+    slot per window of successful, fast calls (additive increase) and halves
+    on a 429 or shrinks when latency climbs well above its baseline
+    (multiplicative decrease). The request rate backs off and recovers the
+    same way.
+    """
+
+    def __init__(
+        self,
+        max_rate: float = GEMINI_MAX_REQUESTS_PER_SECOND,
+        max_concurrency: int = GEMINI_MAX_CONCURRENCY,
+        min_rate: float = 0.5,
+        min_concurrency: int = 1,
+        latency_tolerance: float = 2.0
+    ):
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.latency_tolerance = latency_tolerance
+
+        self.rate = max_rate
+        self.concurrency_limit = float(max(min_concurrency, max_concurrency // 2))
+        self.in_flight = 0
+
+        self._tokens = max_rate
+        self._last_refill = time.monotonic()
+        self._baseline_latency: Optional[float] = None
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._condition: Optional[asyncio.Condition] = None
+        self._token_lock: Optional[asyncio.Lock] = None
+
+        self.requests = 0
+        self.throttled = 0
+
+    def _bind_loop(self) -> None:
+        """Create the asyncio primitives for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._condition = asyncio.Condition()
+            self._token_lock = asyncio.Lock()
+            self.in_flight = 0
+
+    async def _acquire_token(self) -> None:
+        async with self._token_lock:
+            while True:
+                now = time.monotonic()
+                # The bucket must hold at least one whole token, or a rate below 1/s never admits a call
+                capacity = max(1.0, self.rate)
+                self._tokens = min(capacity, self._tokens + (now - self._last_refill) * self.rate)
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    async def _acquire_slot(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < int(self.concurrency_limit))
+            self.in_flight += 1
+
+    async def _release_slot(self) -> None:
+        async with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    def _on_success(self, latency: float) -> None:
+        if self._baseline_latency is None:
+            self._baseline_latency = latency
+        else:
+            # Slow-moving baseline so a congested period is still recognized
+            self._baseline_latency = 0.95 * self._baseline_latency + 0.05 * latency
+
+        if latency > self._baseline_latency * self.latency_tolerance:
+            self.concurrency_limit = max(self.min_concurrency, self.concurrency_limit * 0.9)
+        else:
+            self.concurrency_limit = min(
+                self.max_concurrency,
+                self.concurrency_limit + 1 / max(self.concurrency_limit, 1)
+            )
+            self.rate = min(self.max_rate, self.rate + 0.1)
+
+    def _on_throttled(self) -> None:
+        self.throttled += 1
+        self.concurrency_limit = max(self.min_concurrency, self.concurrency_limit / 2)
+        self.rate = max(self.min_rate, self.rate / 2)
+        self._tokens = 0
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Wait for rate and concurrency budget, then hold a slot for one Gemini call"""
+        self._bind_loop()
+        await self._acquire_token()
+        await self._acquire_slot()
+        self.requests += 1
+        started = time.monotonic()
+        try:
+            yield
+        except Exception as e:
+            if is_rate_limit_error(e):
+                self._on_throttled()
+            raise
+        else:
+            self._on_success(time.monotonic() - started)
+        finally:
+            await self._release_slot()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get the current limits and counters"""
+        return {
+            "rate": round(self.rate, 2),
+            "concurrency_limit": int(self.concurrency_limit),
+            "in_flight": self.in_flight,
+            "requests": self.requests,
+            "throttled": self.throttled,
+            "baseline_latency": self._baseline_latency
+        }
+
+
+# Global governor instance for all Gemini calls
+gemini_governor = GeminiGovernor()
@@ -0,0 +1,100 @@
+"""Two-tier cache for grounding search results"""
+
+import hashlib
+import os
+import time
+from typing import Any, Dict, Optional
+
+from .database import get_cached_search_result, save_search_result
+from .lru import LRUCache
+
+
+# Results older than this are searched again
+SEARCH_CACHE_TTL_SECONDS = int(os.getenv("SEARCH_CACHE_TTL_SECONDS", str(12 * 60 * 60)))
+
+# Searches that returned no grounding chunks are retried sooner; 0 never caches them
+SEARCH_CACHE_EMPTY_TTL_SECONDS = int(os.getenv("SEARCH_CACHE_EMPTY_TTL_SECONDS", str(15 * 60)))
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a search query so trivially different spellings share a cache entry"""
+    return " ".join(query.casefold().split())
+
+
+def make_cache_key(language_code: str, query: str, date_filter: Optional[str]) -> str:
+    """Build the cache key for a (language, query, date window) search"""
+    raw = "\x1f".join([language_code, normalize_query(query), normalize_query(date_filter or "")])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class SearchResultCache:
+    """TTL cache of grounding search results
+
+    An in-process LRU answers repeated searches within a process; Postgres
+    (via DatabaseManager) shares results across processes and restarts.
+    Database errors are treated as misses, so a cache outage never fails a search.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = SEARCH_CACHE_TTL_SECONDS,
+        empty_ttl_seconds: int = SEARCH_CACHE_EMPTY_TTL_SECONDS,
+        max_entries: int = 2048
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.empty_ttl_seconds = empty_ttl_seconds
+        # Entries expire with their database row, so each carries its own expiry
+        self._entries: LRUCache[str, Dict[str, Any]] = LRUCache(max_entries)
+        self.hits = 0
+        self.misses = 0
+
+    async def get(
+        self,
+        language_code: str,
+        query: str,
+        date_filter: Optional[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Get a cached search result, checking memory before the database"""
+        key = make_cache_key(language_code, query, date_filter)
+
+        result = self._entries.get(key)
+        if result is None:
+            try:
+                cached = await get_cached_search_result(key)
+            except Exception as e:
+                print(f"⚠️ Search cache lookup failed, searching anyway: {e}")
+                cached = None
+            if cached is not None:
+                result, expires_at = cached
+                self._entries.set(key, result, expires_at=expires_at)
+
+        if result is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return result
+
+    async def set(
+        self,
+        language_code: str,
+        query: str,
+        date_filter: Optional[str],
+        result: Dict[str, Any]
+    ) -> None:
+        """Store a search result in both tiers, empty results only briefly"""
+        ttl_seconds = self.ttl_seconds if result.get("chunks") else self.empty_ttl_seconds
+        if ttl_seconds <= 0:
+            return
+
+        key = make_cache_key(language_code, query, date_filter)
+        self._entries.set(key, result, expires_at=time.time() + ttl_seconds)
+        try:
+            await save_search_result(
+                key, language_code, normalize_query(query), date_filter, result, ttl_seconds
+            )
+        except Exception as e:
+            print(f"⚠️ Search cache save failed: {e}")
+
+
+# Global search cache instance
+search_cache = SearchResultCache()
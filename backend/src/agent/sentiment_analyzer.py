@@ -1,14 +1,117 @@
 """Sentiment analysis for press articles"""
 
+import asyncio
 import os
-from typing import Dict, List, Any
+from collections import Counter
+from typing import Dict, List, Any, Optional
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.messages import AIMessage
 
 from .state import OrchestratorState
-from .press_prompts import SENTIMENT_ANALYSIS_PROMPT, get_language_specific_instruction
-from .tools_and_schemas import SentimentAnalysis
+from .press_prompts import (
+    SENTIMENT_ANALYSIS_PROMPT,
+    SENTIMENT_BATCH_PROMPT,
+    SENTIMENT_PROMPT_VERSION,
+    get_language_specific_instruction
+)
+from .tools_and_schemas import SentimentAnalysis, SentimentBatch
 from .database import save_articles_to_db
+from .llm_clients import get_chat_model, bind_structured_output
+from .content_store import get_article_content
+from .rate_limiter import gemini_governor
+from .sentiment_cache import sentiment_cache, article_content_key
+from .translation_memory import translate_articles
+from .content_analysis import CONTENT_ANALYSIS_ENABLED, analyze_content_groups
+from .local_sentiment import (
+    LOCAL_SENTIMENT_ENABLED,
+    LOCAL_SENTIMENT_MODEL,
+    LOCAL_SENTIMENT_MIN_CONFIDENCE,
+    classify_article_locally
+)
+
+
+# Articles scored per structured-output call; 1 disables batching
+SENTIMENT_BATCH_SIZE = int(os.getenv("SENTIMENT_BATCH_SIZE", "10"))
+
+# Characters of article content shown to the model with each article
+SENTIMENT_EXCERPT_CHARS = int(os.getenv("SENTIMENT_EXCERPT_CHARS", "1500"))
+
+
+def get_model_name(model: ChatGoogleGenerativeAI) -> str:
+    """Get the model name sentiment results are cached under"""
+    return getattr(model, "model", None) or "unknown"
+
+
+def apply_sentiment(
+    article: Dict[str, Any],
+    analysis: SentimentAnalysis,
+    model_name: str
+) -> Dict[str, Any]:
+    """Copy a validated sentiment result onto an article and cache it"""
+    article["sentiment"] = analysis.sentiment
+    article["sentiment_score"] = analysis.score
+    article["sentiment_explanation"] = analysis.explanation
+    article.setdefault("key_phrases", []).extend(analysis.key_phrases)
+    mark_sentiment_scored(article, model_name, sentiment_cache.put(article, model_name))
+    return article
+
+
+def mark_sentiment_scored(article: Dict[str, Any], model_name: str, content_key: str) -> None:
+    """Record which model, prompt version and content produced an article's sentiment"""
+    article["sentiment_model"] = model_name
+    article["sentiment_prompt_version"] = SENTIMENT_PROMPT_VERSION
+    article["sentiment_content_key"] = content_key
+
+
+def is_sentiment_scored(article: Dict[str, Any]) -> bool:
+    """Check whether an article already carries a score from the current prompts"""
+    return article.get("sentiment_prompt_version") == SENTIMENT_PROMPT_VERSION
+
+
+async def apply_cached_sentiments(
+    articles: List[Dict[str, Any]],
+    model_names: List[str]
+) -> List[Dict[str, Any]]:
+    """Copy cached sentiment onto articles, returning the misses
+    
+    Each model name is tried in order with one bulk lookup for the articles
+    still missing, so a Gemini score wins over a local one for the same article.
+    """
+    misses = articles
+    for model_name in model_names:
+        if not misses:
+            break
+        cached = await sentiment_cache.get_many(misses, model_name)
+        
+        for position, result in cached.items():
+            article = misses[position]
+            article["sentiment"] = result["sentiment"]
+            article["sentiment_score"] = result["sentiment_score"]
+            article["sentiment_explanation"] = result["sentiment_explanation"]
+            key_phrases = article.setdefault("key_phrases", [])
+            key_phrases.extend(p for p in result["key_phrases"] if p not in key_phrases)
+            mark_sentiment_scored(article, model_name, article_content_key(article))
+        
+        misses = [article for position, article in enumerate(misses) if position not in cached]
+    
+    return misses
+
+
+def sentiment_excerpt(article: Dict[str, Any]) -> str:
+    """Get the content excerpt an article is scored on, preferring its English translation"""
+    content = article.get("translated_content") or get_article_content(article)
+    return content[:SENTIMENT_EXCERPT_CHARS].strip()
+
+
+def format_mentions(article: Dict[str, Any]) -> str:
+    """Format an article's Azerbaijan mentions for a prompt"""
+    mentions = []
+    for mention in article.get("mentions_context") or []:
+        text = mention.get("text", "").strip()
+        if text:
+            context = mention.get("context")
+            mentions.append(f"{text} ({context})" if context else text)
+    return "; ".join(mentions) or "none extracted"
 
 
 async def analyze_article_sentiment(
@@ -23,9 +126,9 @@ async def analyze_article_sentiment(
     # Prepare prompt
     prompt = SENTIMENT_ANALYSIS_PROMPT.format(
         title=article["title"],
-        content=article.get("translated_content") or article["original_content"],
-        summary=article["summary"],
-        mentions=article["mentions_context"]
+        content=sentiment_excerpt(article) or "not available",
+        summary=article.get("summary") or "not available",
+        mentions=format_mentions(article)
     )
     
     # Add language-specific instruction
@@ -33,15 +136,12 @@ async def analyze_article_sentiment(
     
     try:
         # Get sentiment analysis with structured output
-        response = await model.with_structured_output(SentimentAnalysis).ainvoke(prompt)
+        async with gemini_governor.slot():
+            response = await bind_structured_output(model, SentimentAnalysis).ainvoke(prompt)
         
         # Update article with sentiment data
-        article["sentiment"] = response.sentiment
-        article["sentiment_score"] = response.score
-        article["sentiment_explanation"] = response.explanation
-        article["key_phrases"].extend(response.key_phrases)
-        
-        return article
+        article["sentiment_confidence"] = None
+        return apply_sentiment(article, response, get_model_name(model))
         
     except Exception as e:
         print(f"Error analyzing sentiment for article {article['url']}: {e}")
@@ -52,47 +152,189 @@ async def analyze_article_sentiment(
         return article
 
 
+def build_sentiment_batch_prompt(articles: List[Dict[str, Any]]) -> str:
+    """Build one prompt scoring several articles, numbered from 1
+    
+    Articles built from the same grounding response share their excerpt,
+    so it is written out once and referenced by the others.
+    """
+    
+    entries = []
+    excerpt_numbers: Dict[str, int] = {}
+    for number, article in enumerate(articles, 1):
+        entry = f"{number}. [{article['source_language']}] {article['title']}"
+        if article.get("summary"):
+            entry += f"\n   Summary: {article['summary']}"
+        entry += f"\n   Mentions: {format_mentions(article)}"
+        excerpt = sentiment_excerpt(article)
+        if excerpt in excerpt_numbers:
+            entry += f"\n   Content: same as article {excerpt_numbers[excerpt]}"
+        elif excerpt:
+            excerpt_numbers[excerpt] = number
+            entry += f"\n   Content: {excerpt}"
+        entries.append(entry)
+    
+    languages = dict.fromkeys(article["source_language"] for article in articles)
+    language_instructions = "\n".join(
+        f"[{language}] {get_language_specific_instruction(language)}" for language in languages
+    )
+    
+    return SENTIMENT_BATCH_PROMPT.format(
+        language_instructions=language_instructions,
+        articles="\n".join(entries)
+    )
+
+
+def validate_batch_results(
+    response: SentimentBatch,
+    batch_size: int
+) -> Dict[int, SentimentAnalysis]:
+    """Validate each batch item on its own, keyed by 0-based article position
+    
+    Items with an unknown or repeated index or invalid fields are dropped so
+    only those articles need a retry.
+    """
+    answered = Counter(item.index - 1 for item in response.items)
+    
+    results: Dict[int, SentimentAnalysis] = {}
+    for item in response.items:
+        position = item.index - 1
+        # An index the model answered twice is ambiguous
+        if not 0 <= position < batch_size or answered[position] > 1:
+            continue
+        try:
+            results[position] = SentimentAnalysis(
+                sentiment=item.sentiment.strip().lower(),
+                score=item.score,
+                explanation=item.explanation,
+                key_phrases=item.key_phrases
+            )
+        except Exception:
+            continue
+    return results
+
+
+async def analyze_sentiment_batch(
+    articles: List[Dict[str, Any]],
+    model: ChatGoogleGenerativeAI
+) -> List[Dict[str, Any]]:
+    """Score a batch of articles in one structured call, retrying invalid items one by one"""
+    
+    if len(articles) == 1:
+        return [await analyze_article_sentiment(articles[0], model)]
+    
+    results: Dict[int, SentimentAnalysis] = {}
+    try:
+        async with gemini_governor.slot():
+            response = await bind_structured_output(model, SentimentBatch).ainvoke(
+                build_sentiment_batch_prompt(articles)
+            )
+        results = validate_batch_results(response, len(articles))
+    except Exception as e:
+        print(f"Error analyzing sentiment batch of {len(articles)} articles: {e}")
+    
+    retries = [article for position, article in enumerate(articles) if position not in results]
+    if retries:
+        print(f"🔁 Retrying {len(retries)} of {len(articles)} articles individually")
+    
+    for position, analysis in results.items():
+        apply_sentiment(articles[position], analysis, get_model_name(model))
+    await asyncio.gather(*(analyze_article_sentiment(article, model) for article in retries))
+    
+    return articles
+
+
 async def translate_content_if_needed(
     article: Dict[str, Any],
     model: ChatGoogleGenerativeAI = None
 ) -> Dict[str, Any]:
     """Translate article content to English if needed"""
     
-    # Skip if already in English or already translated
-    if article["source_language"] == "en" or article.get("translated_content"):
-        return article
+    await translate_articles([article], model)
+    return article
+
+
+def classify_articles_locally(
+    articles: List[Dict[str, Any]],
+    min_confidence: float = LOCAL_SENTIMENT_MIN_CONFIDENCE
+) -> List[Dict[str, Any]]:
+    """Settle confident articles with the local pre-classifier, returning those to escalate"""
     
-    # Skip translation for very long content
-    if len(article["original_content"]) > 5000:
-        return article
+    if not articles:
+        return []
     
-    try:
-        prompt = f"""Translate the following text from {article['language_name']} to English.
-        Preserve the meaning and tone as accurately as possible.
-        
-        Text:
-        {article['original_content'][:3000]}
-        
-        Translation:"""
-        
-        response = await model.ainvoke(prompt)
-        article["translated_content"] = response.content
-        
-    except Exception as e:
-        print(f"Error translating article {article['url']}: {e}")
+    escalated = []
+    confidences = []
+    for article in articles:
+        analysis, confidence = classify_article_locally(article)
+        article["sentiment_confidence"] = confidence
+        confidences.append(confidence)
+        if confidence >= min_confidence:
+            apply_sentiment(article, analysis, LOCAL_SENTIMENT_MODEL)
+        else:
+            escalated.append(article)
     
-    return article
+    print(
+        f"🧮 Local classifier settled {len(articles) - len(escalated)} of {len(articles)} articles "
+        f"(escalation rate {len(escalated) / len(articles):.0%}, "
+        f"mean confidence {sum(confidences) / len(confidences):.2f})"
+    )
+    return escalated
+
+
+async def analyze_articles(
+    articles: List[Dict[str, Any]],
+    model: ChatGoogleGenerativeAI,
+    translation_enabled: bool = True,
+    batch_size: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """Translate (if enabled) and score sentiment for a set of articles
+    
+    Content-level work (summary, mentions, topics, translation) runs once per
+    unique content and is shared by the articles built from it. Articles are
+    scored batch_size at a time (SENTIMENT_BATCH_SIZE by default) with all
+    batches running concurrently; the Gemini governor paces the calls.
+    """
+    
+    batch_size = batch_size or SENTIMENT_BATCH_SIZE
+    
+    # Articles scored earlier in the run, or on an earlier run, skip both
+    # translation and sentiment
+    # Local results are cached under their own model name
+    model_names = [get_model_name(model)]
+    if LOCAL_SENTIMENT_ENABLED:
+        model_names.append(LOCAL_SENTIMENT_MODEL)
+    unscored = await apply_cached_sentiments(
+        [article for article in articles if not is_sentiment_scored(article)],
+        model_names
+    )
+    if len(unscored) < len(articles):
+        print(f"♻️ Reused sentiment for {len(articles) - len(unscored)} of {len(articles)} articles")
+    
+    # Summary, mentions and topics once per unique content, shared by its articles
+    if CONTENT_ANALYSIS_ENABLED:
+        await analyze_content_groups(unscored, model)
+    
+    # Translate if needed and enabled, once per unique content; the sentiment
+    # prompts read the translation in place of the original excerpt
+    if translation_enabled:
+        await translate_articles(unscored, model)
+    
+    # Cheap local tier for the sentiment call only; low-confidence articles escalate to Gemini
+    if LOCAL_SENTIMENT_ENABLED:
+        unscored = classify_articles_locally(unscored)
+    
+    # Analyze sentiment
+    batches = [unscored[i:i + batch_size] for i in range(0, len(unscored), batch_size)]
+    await asyncio.gather(*(analyze_sentiment_batch(batch, model) for batch in batches))
+    return articles
 
 
 async def sentiment_analysis_node(state: OrchestratorState) -> Dict[str, Any]:
     """Node function for sentiment analysis in the graph"""
     
-    # Initialize model with higher capability for sentiment analysis
-    model = ChatGoogleGenerativeAI(
-        model="gemini-2.0-flash",
-        temperature=0.3,  # Lower temperature for more consistent analysis
-        google_api_key=os.getenv("GEMINI_API_KEY")
-    )
+    # Lower temperature for more consistent analysis
+    model = get_chat_model("gemini-2.0-flash", temperature=0.3)
     
     all_articles = state["all_articles"]
     
@@ -103,26 +345,11 @@ async def sentiment_analysis_node(state: OrchestratorState) -> Dict[str, Any]:
             ]
         }
     
-    # Process articles
-    analyzed_articles = []
-    
-    # Process in batches to avoid overwhelming the API
-    batch_size = 10
-    for i in range(0, len(all_articles), batch_size):
-        batch = all_articles[i:i + batch_size]
-        
-        for article in batch:
-            # Translate if needed and enabled
-            if state.get("translation_enabled", True):
-                article = await translate_content_if_needed(article, model)
-            
-            # Analyze sentiment
-            article = await analyze_article_sentiment(article, model)
-            analyzed_articles.append(article)
-        
-        # Small delay between batches
-        if i + batch_size < len(all_articles):
-            await asyncio.sleep(2)
+    analyzed_articles = await analyze_articles(
+        all_articles,
+        model,
+        translation_enabled=state.get("translation_enabled", True)
+    )
     
     # Save updated articles with sentiment to database
     await save_articles_to_db(analyzed_articles)
@@ -138,12 +365,20 @@ async def sentiment_analysis_node(state: OrchestratorState) -> Dict[str, Any]:
     neg_pct = (len(negative) / total * 100) if total > 0 else 0
     neu_pct = (len(neutral) / total * 100) if total > 0 else 0
     
+    # How much the local pre-classifier saved on this run
+    local_count = sum(1 for a in analyzed_articles if a.get("sentiment_model") == LOCAL_SENTIMENT_MODEL)
+    escalated_count = sum(
+        1 for a in analyzed_articles
+        if a.get("sentiment_model") not in (None, LOCAL_SENTIMENT_MODEL)
+    )
+    
     messages = state["messages"] + [
         AIMessage(
             content=f"Sentiment analysis completed for {total} articles:\n"
                    f"- Positive: {len(positive)} ({pos_pct:.1f}%)\n"
                    f"- Negative: {len(negative)} ({neg_pct:.1f}%)\n"
-                   f"- Neutral: {len(neutral)} ({neu_pct:.1f}%)"
+                   f"- Neutral: {len(neutral)} ({neu_pct:.1f}%)\n"
+                   f"- Scored locally: {local_count}, escalated to Gemini: {escalated_count}"
         )
     ]
     
@@ -203,7 +438,3 @@ def get_top_sentiment_drivers(
         })
     
     return top_drivers
-
-
-# Import asyncio here to avoid circular imports
-import asyncio
\ No newline at end of file
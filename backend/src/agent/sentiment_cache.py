@@ -0,0 +1,91 @@
+"""Two-tier cache of sentiment results keyed by article content, model and prompt version"""
+
+import hashlib
+from typing import Any, Dict, List, Tuple
+
+from .content_store import get_article_content
+from .database import get_cached_sentiments
+from .lru import LRUCache
+from .press_prompts import SENTIMENT_PROMPT_VERSION
+
+
+def article_content_key(article: Dict[str, Any]) -> str:
+    """Get the content hash of everything the sentiment prompts see for an article
+
+    Grounding articles from one search share the same response text, so the
+    title is hashed together with it. The summary is derived from that text,
+    so it is already covered by the content hash.
+    """
+    content_hash = article.get("content_hash") or hashlib.sha256(
+        get_article_content(article).encode("utf-8")
+    ).hexdigest()
+    raw = "\x1f".join([article.get("title", ""), content_hash])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class SentimentCache:
+    """Sentiment results keyed by (url, content key, model, prompt version)
+
+    An in-process LRU answers repeats within a run; the sentiment_cache
+    table, written together with the press_articles upsert, lets reruns
+    skip articles that were already scored. A prompt or model change never
+    serves scores produced by another version.
+    """
+
+    def __init__(self, max_entries: int = 20000):
+        self._entries: LRUCache[tuple, Dict[str, Any]] = LRUCache(max_entries)
+        self.hits = 0
+        self.misses = 0
+
+    async def get_many(
+        self,
+        articles: List[Dict[str, Any]],
+        model: str,
+        prompt_version: str = SENTIMENT_PROMPT_VERSION
+    ) -> Dict[int, Dict[str, Any]]:
+        """Get cached sentiment for a list of articles, keyed by list position
+
+        Memory is checked first; every remaining article is looked up in the
+        database with a single query.
+        """
+        found: Dict[int, Dict[str, Any]] = {}
+        missing: Dict[Tuple[str, str], List[int]] = {}
+
+        for position, article in enumerate(articles):
+            content_key = article_content_key(article)
+            result = self._entries.get((article.get("url", ""), content_key, model, prompt_version))
+            if result is not None:
+                found[position] = result
+            else:
+                missing.setdefault((article.get("url", ""), content_key), []).append(position)
+
+        if missing:
+            stored = await get_cached_sentiments(list(missing), model, prompt_version)
+            for (url, content_key), result in stored.items():
+                self._entries.set((url, content_key, model, prompt_version), result)
+                for position in missing.get((url, content_key), []):
+                    found[position] = result
+
+        self.hits += len(found)
+        self.misses += len(articles) - len(found)
+        return found
+
+    def put(
+        self,
+        article: Dict[str, Any],
+        model: str,
+        prompt_version: str = SENTIMENT_PROMPT_VERSION
+    ) -> str:
+        """Store the sentiment fields of a scored article, returning its content key"""
+        content_key = article_content_key(article)
+        self._entries.set((article.get("url", ""), content_key, model, prompt_version), {
+            "sentiment": article["sentiment"],
+            "sentiment_score": article["sentiment_score"],
+            "sentiment_explanation": article.get("sentiment_explanation", ""),
+            "key_phrases": list(article.get("key_phrases", []))
+        })
+        return content_key
+
+
+# Global sentiment cache instance
+sentiment_cache = SentimentCache()
@@ -25,6 +25,7 @@ class OverallState(TypedDict):
     press_monitor_params: Optional[Dict[str, Any]]  # Parameters for press monitoring
     press_monitoring_results: Optional[Dict[str, Any]]  # Results from press monitoring
     continue_to_research: Optional[bool]  # Whether to continue to deep research
+    press_monitor_streaming: Optional[bool]  # Use the streaming pipeline; None uses the server default
 
 
 class ReflectionState(TypedDict):
@@ -64,15 +65,22 @@ class ArticleInfo(TypedDict):
     source_language: str
     language_name: str
     published_date: Optional[datetime]
-    original_content: str
+    content_hash: str  # Key of the original content in content_store
     translated_content: Optional[str]
     summary: str
     sentiment: Literal["positive", "negative", "neutral"]
     sentiment_score: float
     sentiment_explanation: str
+    sentiment_prompt_version: Optional[str]  # Set once the article has been scored
+    sentiment_model: Optional[str]  # Model that produced the sentiment
+    sentiment_content_key: Optional[str]  # Hash of the content the sentiment was scored on
+    sentiment_confidence: Optional[float]  # Local pre-classifier confidence, None when scored by Gemini
     key_phrases: List[str]
     mentions_context: List[Dict[str, str]]  # {"text": "...", "context": "economic/political/cultural"}
     topics: List[str]
+    found_in_languages: List[str]  # Every language whose search surfaced this story
+    search_queries: List[str]  # Every query that surfaced this story
+    duplicate_urls: List[str]  # URLs collapsed into this article as duplicates
 
 
 class LanguageSearchState(TypedDict):
@@ -80,6 +88,7 @@ class LanguageSearchState(TypedDict):
     language_code: str
     language_name: str
     search_queries: List[str]
+    pending_queries: Optional[List[str]]  # Queries not yet run; None until queries are created
     articles_found: List[ArticleInfo]
     search_completed: bool
 
@@ -101,6 +110,7 @@ class OrchestratorState(TypedDict):
     temporal_analyses: Optional[Dict[str, Any]]
     translation_enabled: Optional[bool]
     max_articles_per_language: Optional[int]
+    date_filter: Optional[str]
     executive_summary: Optional[str]
 
 
@@ -0,0 +1,133 @@
+"""Streaming article pipeline for the press monitoring graph
+
+Instead of waiting for every language before moving to the next stage,
+each language's articles flow through dedup, headline filtering,
+translation, sentiment and persistence as soon as its search returns.
+"""
+
+import asyncio
+from typing import Any, Dict, Tuple
+
+from langchain_core.messages import AIMessage
+
+from .state import OrchestratorState
+from .language_agents import (
+    search_news_in_language,
+    HeadlineFilterBatcher,
+    record_query_yields,
+    is_language_search_done
+)
+from .sentiment_analyzer import analyze_articles
+from .dedup import ArticleIndex, deduplicate_articles
+from .database import save_articles_to_db
+from .llm_clients import get_chat_model
+
+
+async def streaming_pipeline_node(state: OrchestratorState) -> Dict[str, Any]:
+    """Node that searches, filters, analyzes and saves articles per language as they arrive"""
+
+    active_searches = state.get("active_searches", {}).copy()
+    date_filter = state.get("date_filter")
+    max_articles = state.get("max_articles_per_language")
+    translation_enabled = state.get("translation_enabled", True)
+
+    search_model = get_chat_model("gemini-2.0-flash", temperature=0.7)
+    sentiment_model = get_chat_model("gemini-2.0-flash", temperature=0.3)
+
+    # One index across languages; stories already kept by another language are dropped
+    index = ArticleIndex()
+    pending = {}
+    for lang_code, lang_state in active_searches.items():
+        if lang_state.get("search_completed", False):
+            for article in lang_state.get("articles_found", []):
+                index.add(article)
+        else:
+            pending[lang_code] = lang_state
+
+    # Languages finishing a wave together share headline filter prompts
+    headline_filter = HeadlineFilterBatcher(search_model, active_languages=len(pending))
+
+    async def process_language(lang_code: str, lang_state: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        lang_state = {**lang_state, "articles_found": list(lang_state.get("articles_found", []))}
+
+        try:
+            # Query waves continue only while the language is short of its quota
+            while not is_language_search_done(lang_state, max_articles):
+                search_result = await search_news_in_language(
+                    language_code=lang_code,
+                    language_state=lang_state,
+                    model=search_model,
+                    date_filter=date_filter,
+                    max_articles=max_articles
+                )
+
+                # Dedup is synchronous, so languages finishing together cannot race on the index
+                articles = deduplicate_articles(search_result["articles_found"], index)
+                articles = await headline_filter.filter(articles, lang_code)
+                record_query_yields(lang_code, search_result["queries_run"], articles)
+                if max_articles:
+                    articles = articles[:max(max_articles - len(lang_state["articles_found"]), 0)]
+
+                if articles:
+                    articles = await analyze_articles(articles, sentiment_model, translation_enabled)
+                    await save_articles_to_db(articles)
+
+                lang_state.update(search_result)
+                lang_state["articles_found"] = lang_state["articles_found"] + articles
+                print(f"📰 {lang_code}: {len(articles)} articles analyzed and queued for saving")
+        finally:
+            headline_filter.finish(lang_code)
+
+        return lang_code, lang_state
+
+    all_articles = list(state.get("all_articles", []))
+
+    for finished in asyncio.as_completed([
+        process_language(lang_code, lang_state) for lang_code, lang_state in pending.items()
+    ]):
+        try:
+            lang_code, search_result = await finished
+        except Exception as e:
+            print(f"❌ Streaming pipeline error: {e}")
+            continue
+
+        active_searches[lang_code] = {
+            **active_searches[lang_code],
+            **search_result,
+            "search_completed": True
+        }
+        all_articles.extend(search_result["articles_found"][len(pending[lang_code].get("articles_found", [])):])
+
+    # Languages that failed outright still count as searched
+    for lang_code in pending:
+        if not active_searches[lang_code].get("search_completed", False):
+            active_searches[lang_code] = {**active_searches[lang_code], "search_completed": True}
+
+    if pending:
+        print(f"🗂️ Headline filtering for {len(pending)} languages took {headline_filter.flushes} pooled rounds")
+    if index.duplicates_merged:
+        print(f"🧹 Merged {index.duplicates_merged} duplicate articles across languages")
+
+    positive = [a for a in all_articles if a.get("sentiment") == "positive"]
+    negative = [a for a in all_articles if a.get("sentiment") == "negative"]
+    neutral = [a for a in all_articles if a.get("sentiment") == "neutral"]
+
+    messages = state["messages"] + [
+        AIMessage(
+            content=f"Streaming search and sentiment analysis completed. "
+                   f"Found {len(all_articles)} articles across {len(active_searches)} languages:\n"
+                   f"- Positive: {len(positive)}\n"
+                   f"- Negative: {len(negative)}\n"
+                   f"- Neutral: {len(neutral)}"
+        )
+    ]
+
+    return {
+        "active_searches": active_searches,
+        "all_articles": all_articles,
+        "positive_articles": positive,
+        "negative_articles": negative,
+        "neutral_articles": neutral,
+        "language_search_complete": True,
+        "messages": messages
+    }
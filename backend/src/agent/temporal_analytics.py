@@ -1,32 +1,135 @@
 """Temporal analytics for tracking sentiment changes over time"""
 
+import asyncio
 from typing import Dict, List, Any, Optional, Tuple
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from collections import defaultdict
 import statistics
-from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.messages import AIMessage
 
 from .state import OrchestratorState, TemporalAnalyticsState
 from .database import (
-    get_historical_articles,
-    get_countries_with_sufficient_data,
+    db_manager,
+    iter_historical_articles,
+    get_daily_sentiment,
+    get_daily_sentiment_by_target,
     get_monitoring_statistics
 )
 from .press_prompts import TEMPORAL_ANALYSIS_PROMPT, TREND_COMPARISON_PROMPT
 from .tools_and_schemas import TemporalTrendAnalysis
+from .llm_clients import get_chat_model
+from .rate_limiter import gemini_governor
+
+
+def article_day(article: Dict[str, Any]) -> str:
+    """Get the UTC publication day of an article, matching the rollup's day key"""
+    published = article["published_date"]
+    if published.tzinfo is not None:
+        published = published.astimezone(timezone.utc)
+    return published.strftime("%Y-%m-%d")
+
+
+def window_start(period_days: int) -> str:
+    """Get the first UTC day of a window ending today"""
+    return (datetime.now(timezone.utc) - timedelta(days=period_days)).strftime("%Y-%m-%d")
+
+
+def build_daily_sentiment(rows: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Turn rollup rows into per-day sentiment counts"""
+    daily_sentiment = defaultdict(lambda: {"positive": 0, "negative": 0, "neutral": 0, "total": 0, "score_sum": 0.0})
+    for row in rows:
+        day = daily_sentiment[row["day"].strftime("%Y-%m-%d")]
+        day[row["sentiment"]] += row["article_count"]
+        day["total"] += row["article_count"]
+        day["score_sum"] += row["score_sum"]
+    return dict(daily_sentiment)
+
+
+def build_target_daily_sentiment(
+    rows: List[Dict[str, Any]],
+    key: str
+) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Split grouped rollup rows into per-day sentiment counts per country or region"""
+    grouped = defaultdict(list)
+    for row in rows:
+        if row[key]:
+            grouped[row[key]].append(row)
+    return {target: build_daily_sentiment(target_rows) for target, target_rows in grouped.items()}
+
+
+def countries_with_sufficient_data(
+    daily_by_country: Dict[str, Dict[str, Dict[str, Any]]],
+    min_articles: int = 50
+) -> List[str]:
+    """Get countries with enough articles for temporal analysis, busiest first"""
+    totals = {
+        country: sum(data["total"] for data in daily.values())
+        for country, daily in daily_by_country.items()
+    }
+    return [
+        country for country, total in sorted(totals.items(), key=lambda item: item[1], reverse=True)
+        if total >= min_articles
+    ]
+
+
+def shift_day(day: str, days: int) -> str:
+    """Move a YYYY-MM-DD day by a number of days"""
+    return (datetime.strptime(day, "%Y-%m-%d") + timedelta(days=days)).strftime("%Y-%m-%d")
+
+
+class ArticleEvidence:
+    """Article-level details temporal analysis needs, gathered in one streamed pass
+    
+    Keeps topic counters and a few example articles per trend change instead
+    of the articles themselves, so memory does not grow with history.
+    """
+    
+    def __init__(
+        self,
+        periods: List[int],
+        detail_period: int,
+        change_dates: List[str],
+        max_examples: int = 10
+    ):
+        self.period_cutoffs = {period: window_start(period) for period in periods}
+        self.detail_cutoff = window_start(detail_period)
+        self.max_examples = max_examples
+        
+        self.period_topics = {period: defaultdict(int) for period in periods}
+        self.day_topics: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self.change_windows = {date: (shift_day(date, -2), shift_day(date, 2)) for date in change_dates}
+        self.change_examples: Dict[str, List[Dict[str, Any]]] = {date: [] for date in change_dates}
+        self.change_counts = {date: 0 for date in change_dates}
+    
+    def add(self, article: Dict[str, Any]) -> None:
+        """Fold one article into the counters"""
+        day = article_day(article)
+        topics = article.get("topics") or []
+        
+        for period, cutoff in self.period_cutoffs.items():
+            if day >= cutoff:
+                for topic in topics:
+                    self.period_topics[period][topic] += 1
+        
+        if day < self.detail_cutoff:
+            return
+        
+        for topic in topics:
+            self.day_topics[day][topic] += 1
+        
+        # Articles within two days of a change are its evidence
+        for date, (start, end) in self.change_windows.items():
+            if start <= day <= end:
+                self.change_counts[date] += 1
+                if len(self.change_examples[date]) < self.max_examples:
+                    self.change_examples[date].append(article)
 
 
 class TemporalAnalyticsAgent:
     """Agent for analyzing sentiment changes over time"""
     
     def __init__(self):
-        import os
-        self.model = ChatGoogleGenerativeAI(
-            model="gemini-2.0-flash",
-            temperature=0.3,
-            google_api_key=os.getenv("GEMINI_API_KEY")
-        )
+        self.model = get_chat_model("gemini-2.0-flash", temperature=0.3)
     
     async def analyze_temporal_changes(
         self,
@@ -37,27 +140,144 @@ class TemporalAnalyticsAgent:
     ) -> Dict[str, Any]:
         """Analyze sentiment changes over time periods"""
         
-        # Get historical data
-        historical_data = await get_historical_articles(
+        # Sentiment counts come from the daily rollup
+        daily_sentiment = build_daily_sentiment(await get_daily_sentiment(
+            country=country,
+            region=region,
+            days_back=max(comparison_periods)
+        ))
+        
+        if not daily_sentiment:
+            return self._insufficient_data(country, region)
+        
+        target = await self._start_target(daily_sentiment, time_period_days, comparison_periods)
+        
+        # One streamed pass over the articles gathers topics and examples of each change
+        async for article in iter_historical_articles(
             country=country,
             region=region,
             days_back=max(comparison_periods)
+        ):
+            target["evidence"].add(article)
+        
+        return await self._finish_target(target, country, region, comparison_periods)
+    
+    async def analyze_targets(
+        self,
+        rollup_rows: List[Dict[str, Any]],
+        countries: List[str],
+        regions: List[str],
+        time_period_days: int = 30,
+        comparison_periods: List[int] = [7, 30, 90]
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Analyze many countries and regions from one rollup read and one article pass
+        
+        Rollup rows come from get_daily_sentiment_by_target and are split per
+        target in memory; every streamed article is routed to its country's and
+        its region's evidence. Returns analyses by country and by region.
+        """
+        by_country = build_target_daily_sentiment(rollup_rows, "source_country")
+        by_region = build_target_daily_sentiment(rollup_rows, "region")
+        
+        # A failure is isolated to its own target, as with separate analyses
+        targets = {}
+        errors = {}
+        for kind, names, daily_by_target in (
+            ("source_country", countries, by_country),
+            ("region", regions, by_region)
+        ):
+            for name in names:
+                if not daily_by_target.get(name):
+                    continue
+                try:
+                    targets[(kind, name)] = await self._start_target(
+                        daily_by_target[name], time_period_days, comparison_periods
+                    )
+                except Exception as e:
+                    print(f"Error analyzing temporal trends for {name}: {e}")
+                    errors[(kind, name)] = {"error": str(e)}
+        
+        if targets:
+            try:
+                async for article in iter_historical_articles(days_back=max(comparison_periods)):
+                    for kind in ("source_country", "region"):
+                        target = targets.get((kind, article[kind]))
+                        if target:
+                            target["evidence"].add(article)
+            except Exception as e:
+                # Without the article pass no target has evidence to analyze
+                print(f"Error reading historical articles for temporal analysis: {e}")
+                targets = {}
+        
+        async def finish(kind: str, name: str) -> Dict[str, Any]:
+            country, region = (name, None) if kind == "source_country" else (None, name)
+            if (kind, name) in errors:
+                return errors[(kind, name)]
+            if (kind, name) not in targets:
+                return self._insufficient_data(country, region)
+            try:
+                return await self._finish_target(targets[(kind, name)], country, region, comparison_periods)
+            except Exception as e:
+                print(f"Error analyzing temporal trends for {name}: {e}")
+                return {"error": str(e)}
+        
+        results = await asyncio.gather(
+            *(finish("source_country", country) for country in countries),
+            *(finish("region", region) for region in regions)
         )
+        return (
+            dict(zip(countries, results[:len(countries)])),
+            dict(zip(regions, results[len(countries):]))
+        )
+    
+    def _insufficient_data(self, country: Optional[str], region: Optional[str]) -> Dict[str, Any]:
+        return {
+            "country": country,
+            "region": region,
+            "error": "Insufficient data for temporal analysis",
+            "trends": {},
+            "predictions": None
+        }
+    
+    async def _start_target(
+        self,
+        daily_sentiment: Dict[str, Dict[str, Any]],
+        time_period_days: int,
+        comparison_periods: List[int]
+    ) -> Dict[str, Any]:
+        """Locate trend changes from daily counts and set up evidence collection for them"""
         
-        if not historical_data:
-            return {
-                "country": country,
-                "region": region,
-                "error": "Insufficient data for temporal analysis",
-                "trends": {},
-                "predictions": None
-            }
+        # Day-by-day counts of the main period locate trend changes before any article is read
+        detail_cutoff = window_start(time_period_days)
+        detail_daily = {day: data for day, data in daily_sentiment.items() if day >= detail_cutoff}
+        trend_changes = await self._identify_trend_changes(detail_daily)
+        
+        return {
+            "daily_sentiment": daily_sentiment,
+            "detail_daily": detail_daily,
+            "trend_changes": trend_changes,
+            "evidence": ArticleEvidence(
+                comparison_periods,
+                time_period_days,
+                [change["date"] for change in trend_changes[:5]]
+            )
+        }
+    
+    async def _finish_target(
+        self,
+        target: Dict[str, Any],
+        country: Optional[str],
+        region: Optional[str],
+        comparison_periods: List[int]
+    ) -> Dict[str, Any]:
+        """Build the analysis of a target once its evidence is collected"""
         
         # Analyze trends for each period
         trends = {}
         for period in comparison_periods:
             trends[f"{period}_days"] = await self._analyze_period(
-                historical_data,
+                target["daily_sentiment"],
+                target["evidence"].period_topics[period],
                 period,
                 country,
                 region
@@ -65,8 +285,9 @@ class TemporalAnalyticsAgent:
         
         # Detailed analysis of the main period
         detailed_analysis = await self._detailed_temporal_analysis(
-            historical_data,
-            time_period_days
+            target["detail_daily"],
+            target["trend_changes"],
+            target["evidence"]
         )
         
         # Predict future trends
@@ -83,42 +304,35 @@ class TemporalAnalyticsAgent:
     
     async def _analyze_period(
         self,
-        articles: List[Dict],
+        daily_sentiment: Dict[str, Dict[str, Any]],
+        topics_count: Dict[str, int],
         period_days: int,
         country: Optional[str],
         region: Optional[str]
     ) -> Dict[str, Any]:
         """Analyze a specific time period"""
         
-        cutoff_date = datetime.now() - timedelta(days=period_days)
-        period_articles = [
-            a for a in articles 
-            if a["published_date"] >= cutoff_date
-        ]
+        cutoff_day = window_start(period_days)
+        period_days_data = [data for day, data in daily_sentiment.items() if day >= cutoff_day]
         
-        if not period_articles:
+        # Calculate metrics
+        total = sum(data["total"] for data in period_days_data)
+        if not total:
             return {
                 "period_days": period_days,
                 "total_articles": 0,
                 "trend": "insufficient_data"
             }
         
-        # Calculate metrics
-        total = len(period_articles)
-        positive = len([a for a in period_articles if a["sentiment"] == "positive"])
-        negative = len([a for a in period_articles if a["sentiment"] == "negative"])
-        neutral = len([a for a in period_articles if a["sentiment"] == "neutral"])
+        positive = sum(data["positive"] for data in period_days_data)
+        negative = sum(data["negative"] for data in period_days_data)
+        neutral = sum(data["neutral"] for data in period_days_data)
+        average_score = sum(data["score_sum"] for data in period_days_data) / total
         
         # Calculate percentages
         positive_pct = (positive / total * 100) if total > 0 else 0
         negative_pct = (negative / total * 100) if total > 0 else 0
         
-        # Group by topics
-        topics_count = defaultdict(int)
-        for article in period_articles:
-            for topic in article.get("topics", []):
-                topics_count[topic] += 1
-        
         # Get top topics
         top_topics = sorted(
             topics_count.items(),
@@ -147,6 +361,7 @@ class TemporalAnalyticsAgent:
                 "negative_percentage": negative_pct,
                 "neutral_percentage": 100 - positive_pct - negative_pct
             },
+            "average_score": average_score,
             "top_topics": top_topics,
             "daily_average": total / period_days if period_days > 0 else 0,
             "trend": trend
@@ -154,35 +369,18 @@ class TemporalAnalyticsAgent:
     
     async def _detailed_temporal_analysis(
         self,
-        articles: List[Dict],
-        period_days: int
+        daily_sentiment: Dict[str, Dict[str, Any]],
+        trend_changes: List[Dict[str, Any]],
+        evidence: ArticleEvidence
     ) -> Dict[str, Any]:
         """Perform detailed day-by-day analysis"""
         
-        cutoff_date = datetime.now() - timedelta(days=period_days)
-        period_articles = [
-            a for a in articles 
-            if a["published_date"] >= cutoff_date
-        ]
-        
-        # Group by day
-        daily_sentiment = defaultdict(lambda: {"positive": 0, "negative": 0, "neutral": 0, "total": 0})
-        
-        for article in period_articles:
-            day_key = article["published_date"].strftime("%Y-%m-%d")
-            sentiment = article["sentiment"]
-            daily_sentiment[day_key][sentiment] += 1
-            daily_sentiment[day_key]["total"] += 1
-        
-        # Identify trend changes
-        trend_changes = await self._identify_trend_changes(daily_sentiment)
-        
         # Analyze reasons for changes
         change_reasons = []
         if trend_changes:
             change_reasons = await self._analyze_change_reasons(
-                period_articles,
-                trend_changes
+                trend_changes,
+                evidence
             )
         
         # Calculate volatility
@@ -190,12 +388,12 @@ class TemporalAnalyticsAgent:
         
         # Find significant events
         significant_events = await self._find_significant_events(
-            period_articles,
-            daily_sentiment
+            daily_sentiment,
+            evidence
         )
         
         return {
-            "daily_sentiment": dict(daily_sentiment),
+            "daily_sentiment": daily_sentiment,
             "trend_changes": trend_changes,
             "change_reasons": change_reasons,
             "volatility_score": volatility_score,
@@ -249,26 +447,21 @@ class TemporalAnalyticsAgent:
     
     async def _analyze_change_reasons(
         self,
-        articles: List[Dict],
-        trend_changes: List[Dict]
+        trend_changes: List[Dict],
+        evidence: ArticleEvidence
     ) -> List[Dict[str, Any]]:
         """Analyze reasons for trend changes"""
         
         reasons = []
         
         for change in trend_changes[:5]:  # Analyze top 5 changes
-            change_date = datetime.strptime(change["date"], "%Y-%m-%d")
-            
-            # Find articles around the change date
-            relevant_articles = [
-                a for a in articles
-                if abs((a["published_date"] - change_date).days) <= 2
-            ]
+            # Articles around the change date, collected while streaming
+            relevant_articles = evidence.change_examples[change["date"]]
             
             if relevant_articles:
                 # Prepare summary for analysis
                 articles_summary = "\n".join([
-                    f"- [{a['source_language']}] {a['title']} ({a['sentiment']}): {a['summary'][:100]}..."
+                    f"- [{a['source_language']}] {a['title']} ({a['sentiment']}): {(a['summary'] or '')[:100]}..."
                     for a in relevant_articles[:10]
                 ])
                 
@@ -279,13 +472,14 @@ class TemporalAnalyticsAgent:
                     articles_summary=articles_summary
                 )
                 
-                response = await self.model.ainvoke(prompt)
+                async with gemini_governor.slot():
+                    response = await self.model.ainvoke(prompt)
                 
                 reasons.append({
                     "date": change["date"],
                     "change": change,
                     "likely_reasons": response.content,
-                    "supporting_articles": len(relevant_articles),
+                    "supporting_articles": evidence.change_counts[change["date"]],
                     "key_articles": [
                         {
                             "title": a["title"],
@@ -325,8 +519,8 @@ class TemporalAnalyticsAgent:
     
     async def _find_significant_events(
         self,
-        articles: List[Dict],
-        daily_sentiment: Dict[str, Dict[str, int]]
+        daily_sentiment: Dict[str, Dict[str, int]],
+        evidence: ArticleEvidence
     ) -> List[Dict[str, Any]]:
         """Find days with significant events"""
         
@@ -341,17 +535,8 @@ class TemporalAnalyticsAgent:
             for date, data in daily_sentiment.items():
                 # Significant if > 2 standard deviations from mean
                 if std_count > 0 and data["total"] > avg_count + 2 * std_count:
-                    # Find articles from that day
-                    day_articles = [
-                        a for a in articles
-                        if a["published_date"].strftime("%Y-%m-%d") == date
-                    ]
-                    
                     # Get most common topics
-                    topics = defaultdict(int)
-                    for article in day_articles:
-                        for topic in article.get("topics", []):
-                            topics[topic] += 1
+                    topics = evidence.day_topics.get(date, {})
                     
                     top_topics = sorted(topics.items(), key=lambda x: x[1], reverse=True)[:3]
                     
@@ -472,45 +657,32 @@ async def temporal_analysis_node(state: OrchestratorState) -> Dict[str, Any]:
     
     agent = TemporalAnalyticsAgent()
     
-    # Get countries with sufficient data
-    countries_to_analyze = await get_countries_with_sufficient_data(
-        min_articles=50,
-        days_back=90
-    )
-    
-    # Limit to top countries to avoid overload
-    countries_to_analyze = countries_to_analyze[:10]
+    # Write out this run's queued articles so the rollup and history include them
+    await db_manager.writer.flush()
     
-    # Perform temporal analysis for each country
-    temporal_analyses = {}
+    # One rollup read covers every country and region; without it every
+    # target reports insufficient data
+    try:
+        rollup_rows = await get_daily_sentiment_by_target(days_back=90)
+    except Exception as e:
+        print(f"Error reading daily sentiment for temporal analysis: {e}")
+        rollup_rows = []
     
-    for country in countries_to_analyze:
-        try:
-            analysis = await agent.analyze_temporal_changes(
-                country=country,
-                time_period_days=30,
-                comparison_periods=[7, 30, 90]
-            )
-            temporal_analyses[country] = analysis
-        except Exception as e:
-            print(f"Error analyzing temporal trends for {country}: {e}")
-            temporal_analyses[country] = {"error": str(e)}
-    
-    # Also perform regional analysis
-    regional_analyses = {}
+    # Get countries with sufficient data, limited to the top ones to avoid overload
+    countries_to_analyze = countries_with_sufficient_data(
+        build_target_daily_sentiment(rollup_rows, "source_country"),
+        min_articles=50
+    )[:10]
     regions = ["Asia", "Europe", "Middle East", "Africa", "Americas"]
     
-    for region in regions:
-        try:
-            analysis = await agent.analyze_temporal_changes(
-                region=region,
-                time_period_days=30,
-                comparison_periods=[7, 30, 90]
-            )
-            regional_analyses[region] = analysis
-        except Exception as e:
-            print(f"Error analyzing temporal trends for {region}: {e}")
-            regional_analyses[region] = {"error": str(e)}
+    # Perform temporal analysis for each country and region over one shared article pass
+    temporal_analyses, regional_analyses = await agent.analyze_targets(
+        rollup_rows,
+        countries_to_analyze,
+        regions,
+        time_period_days=30,
+        comparison_periods=[7, 30, 90]
+    )
     
     # Update state
     messages = state["messages"] + [
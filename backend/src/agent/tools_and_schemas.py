@@ -61,6 +61,42 @@ class SentimentAnalysis(BaseModel):
     )
 
 
+class BatchSentimentItem(BaseModel):
+    """Sentiment for one article of a batch, validated against SentimentAnalysis afterwards"""
+    index: int = Field(description="Number of the article in the batch")
+    sentiment: str = Field(
+        description="Overall sentiment of the article: positive, negative or neutral"
+    )
+    score: float = Field(
+        description="Confidence score from -1 (negative) to 1 (positive)"
+    )
+    explanation: str = Field(
+        description="Explanation of why this sentiment was assigned"
+    )
+    key_phrases: List[str] = Field(
+        description="Key phrases that determined the sentiment"
+    )
+
+
+class SentimentBatch(BaseModel):
+    """Sentiment results for a batch of articles"""
+    items: List[BatchSentimentItem] = Field(
+        description="One result per article, in any order, identified by its number"
+    )
+
+
+class ContentAnalysis(BaseModel):
+    """Content-level analysis shared by every article built from the same text"""
+    summary: str = Field(description="Brief summary of how the text covers Azerbaijan")
+    mentions: List[str] = Field(
+        description="Short quotes or paraphrases where Azerbaijan is mentioned"
+    )
+    mention_context: Literal["political", "economic", "cultural", "security", "general"] = Field(
+        description="Dominant context of the Azerbaijan mentions"
+    )
+    topics: List[str] = Field(description="Main topics of the text, at most five")
+
+
 class ArticleAnalysis(BaseModel):
     """Full article analysis"""
     title: str
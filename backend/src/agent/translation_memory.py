@@ -0,0 +1,220 @@
+"""Translation memory and batched translation of article content"""
+
+import asyncio
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_google_genai import ChatGoogleGenerativeAI
+from pydantic import BaseModel, Field
+
+from .content_store import content_hash, get_article_content
+from .database import get_translations, save_translations
+from .llm_clients import bind_structured_output
+from .lru import LRUCache
+from .rate_limiter import gemini_governor
+
+
+# Skip translating languages the sentiment model reads natively
+TRANSLATION_SKIP_NATIVE = os.getenv("TRANSLATION_SKIP_NATIVE", "false").lower() in ("1", "true", "yes")
+
+# Languages Gemini handles well enough to score without an English translation
+GEMINI_NATIVE_LANGUAGES = {
+    "ar", "bg", "bn", "cs", "da", "de", "el", "es", "et", "fa", "fi", "fr", "he", "hi",
+    "hr", "hu", "id", "it", "ja", "ko", "lt", "lv", "nl", "no", "pl", "pt", "ro", "ru",
+    "sk", "sl", "sr", "sv", "sw", "th", "tr", "uk", "vi", "zh"
+}
+
+# Content longer than this is not translated; longer texts are cut to the excerpt size
+MAX_TRANSLATION_SOURCE_CHARS = 5000
+TRANSLATION_EXCERPT_CHARS = 3000
+
+# Source characters packed into one batched translation call
+TRANSLATION_BATCH_CHARS = int(os.getenv("TRANSLATION_BATCH_CHARS", "12000"))
+
+
+class TranslationItem(BaseModel):
+    """Translation of one text of a batch"""
+    index: int = Field(description="Number of the text in the batch")
+    translation: str = Field(description="English translation of the text")
+
+
+class TranslationBatch(BaseModel):
+    """Translations for a batch of texts"""
+    items: List[TranslationItem] = Field(description="One translation per text")
+
+
+TranslationKey = Tuple[str, str]  # (source_language, content_hash)
+
+
+class TranslationMemory:
+    """Translations keyed by (source language, content hash)
+
+    An in-process LRU answers repeats within a process; the
+    translation_memory table shares them across runs.
+    """
+
+    def __init__(self, max_entries: int = 5000):
+        self._entries: LRUCache[TranslationKey, str] = LRUCache(max_entries)
+        self.hits = 0
+        self.misses = 0
+
+    async def get_many(self, keys: List[TranslationKey]) -> Dict[TranslationKey, str]:
+        """Get remembered translations, checking memory before one bulk database query"""
+        found = self._entries.get_many(keys)
+        missing = [key for key in keys if key not in found]
+
+        if missing:
+            stored = await get_translations(missing)
+            for key, text in stored.items():
+                self._entries.set(key, text)
+            found.update(stored)
+
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    async def put_many(self, translations: Dict[TranslationKey, str], model: str) -> None:
+        """Remember new translations in both tiers"""
+        for key, text in translations.items():
+            self._entries.set(key, text)
+        await save_translations(translations, model)
+
+
+# Global translation memory instance
+translation_memory = TranslationMemory()
+
+
+def needs_translation(article: Dict[str, Any], skip_native: bool = TRANSLATION_SKIP_NATIVE) -> bool:
+    """Check whether an article should get an English translation"""
+    language = article["source_language"]
+    if language == "en" or article.get("translated_content"):
+        return False
+    if skip_native and language in GEMINI_NATIVE_LANGUAGES:
+        return False
+    return True
+
+
+def plan_translation_batches(
+    texts: List[Tuple[TranslationKey, str, str]],
+    max_chars: int = TRANSLATION_BATCH_CHARS
+) -> List[List[Tuple[TranslationKey, str, str]]]:
+    """Pack (key, language name, text) entries into batches under a character budget"""
+    batches = []
+    current = []
+    used = 0
+    for entry in texts:
+        size = len(entry[2])
+        if current and used + size > max_chars:
+            batches.append(current)
+            current, used = [], 0
+        current.append(entry)
+        used += size
+    if current:
+        batches.append(current)
+    return batches
+
+
+async def translate_text(text: str, language_name: str, model: ChatGoogleGenerativeAI) -> Optional[str]:
+    """Translate a single text to English"""
+    prompt = f"""Translate the following text from {language_name} to English.
+        Preserve the meaning and tone as accurately as possible.
+
+        Text:
+        {text}
+
+        Translation:"""
+    try:
+        async with gemini_governor.slot():
+            response = await model.ainvoke(prompt)
+        return response.content
+    except Exception as e:
+        print(f"Error translating text from {language_name}: {e}")
+        return None
+
+
+async def translate_batch(
+    batch: List[Tuple[TranslationKey, str, str]],
+    model: ChatGoogleGenerativeAI
+) -> Dict[TranslationKey, str]:
+    """Translate several texts in one structured call, retrying missing items one by one"""
+    if len(batch) == 1:
+        key, language_name, text = batch[0]
+        translation = await translate_text(text, language_name, model)
+        return {key: translation} if translation else {}
+
+    sections = "\n\n".join(
+        f"### Text {number} ({language_name})\n{text}"
+        for number, (_, language_name, text) in enumerate(batch, 1)
+    )
+    prompt = f"""Translate each of the following texts to English.
+Preserve the meaning and tone as accurately as possible.
+Return one translation per text, using the text's number as its index.
+
+{sections}"""
+
+    translations: Dict[TranslationKey, str] = {}
+    try:
+        async with gemini_governor.slot():
+            response = await bind_structured_output(model, TranslationBatch).ainvoke(prompt)
+        for item in response.items:
+            if 1 <= item.index <= len(batch) and item.translation.strip():
+                translations[batch[item.index - 1][0]] = item.translation
+    except Exception as e:
+        print(f"Error translating batch of {len(batch)} texts: {e}")
+
+    retries = [entry for entry in batch if entry[0] not in translations]
+    results = await asyncio.gather(*(translate_text(text, name, model) for _, name, text in retries))
+    for (key, _, _), translation in zip(retries, results):
+        if translation:
+            translations[key] = translation
+    return translations
+
+
+async def translate_articles(
+    articles: List[Dict[str, Any]],
+    model: ChatGoogleGenerativeAI,
+    skip_native: bool = TRANSLATION_SKIP_NATIVE
+) -> List[Dict[str, Any]]:
+    """Translate article content to English through the translation memory
+
+    Each unique (language, content) is translated at most once: remembered
+    translations are reused, the rest are translated in batches and the
+    result is copied onto every article sharing that content.
+    """
+    pending: Dict[TranslationKey, List[Dict[str, Any]]] = {}
+    sources: Dict[TranslationKey, Tuple[str, str]] = {}
+
+    for article in articles:
+        if not needs_translation(article, skip_native):
+            continue
+        original_content = get_article_content(article)
+        # Skip translation for very long content
+        if not original_content or len(original_content) > MAX_TRANSLATION_SOURCE_CHARS:
+            continue
+        key = (article["source_language"], article.get("content_hash") or content_hash(original_content))
+        pending.setdefault(key, []).append(article)
+        sources[key] = (article["language_name"], original_content[:TRANSLATION_EXCERPT_CHARS])
+
+    if not pending:
+        return articles
+
+    translations = await translation_memory.get_many(list(pending))
+
+    missing = [(key, *sources[key]) for key in pending if key not in translations]
+    if missing:
+        batches = plan_translation_batches(missing)
+        results = await asyncio.gather(*(translate_batch(batch, model) for batch in batches))
+        new_translations = {key: text for result in results for key, text in result.items()}
+        await translation_memory.put_many(new_translations, getattr(model, "model", None) or "unknown")
+        translations.update(new_translations)
+        print(
+            f"🌐 Translated {len(new_translations)} texts in {len(batches)} calls, "
+            f"reused {len(pending) - len(missing)} from translation memory"
+        )
+
+    for key, key_articles in pending.items():
+        if key in translations:
+            for article in key_articles:
+                article["translated_content"] = translations[key]
+
+    return articles
@@ -0,0 +1,218 @@
+"""Write-behind queue that batches database writes off the request path"""
+
+import asyncio
+import itertools
+import os
+from collections import OrderedDict, deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, List, Optional, Tuple
+
+import asyncpg
+
+
+# Flush when this many writes are pending, or after this many seconds
+DB_WRITE_BATCH_SIZE = int(os.getenv("DB_WRITE_BATCH_SIZE", "500"))
+DB_WRITE_FLUSH_SECONDS = float(os.getenv("DB_WRITE_FLUSH_SECONDS", "1.0"))
+
+# Writers block once this many writes are pending (backpressure)
+DB_WRITE_MAX_PENDING = int(os.getenv("DB_WRITE_MAX_PENDING", "5000"))
+
+# Flush on every enqueue; useful for tests and one-off scripts
+DB_WRITE_SYNC = os.getenv("DB_WRITE_SYNC", "false").lower() in ("1", "true", "yes")
+
+# Writes that failed on their own are kept for inspection, up to this many
+DB_WRITE_DEAD_LETTER_MAX = int(os.getenv("DB_WRITE_DEAD_LETTER_MAX", "1000"))
+
+FlushHandler = Callable[[List[Any]], Awaitable[None]]
+MergeFunction = Callable[[Any, Any], Any]
+
+
+def is_connection_error(error: BaseException) -> bool:
+    """Check whether a failed write means the database was unreachable rather than a row was bad"""
+    return isinstance(error, (
+        OSError,
+        asyncio.TimeoutError,
+        asyncpg.InterfaceError,
+        asyncpg.PostgresConnectionError,
+        asyncpg.CannotConnectNowError,
+        asyncpg.TooManyConnectionsError
+    ))
+
+
+class WriteBehindQueue:
+    """Buffer writes per kind, coalesce them by key and flush them in batches
+
+    Kinds are flushed in registration order, so a kind that depends on rows
+    written by another (digest mappings on articles) is registered after it.
+    A failed flush is retried a few times. If it still fails, the batch is
+    bisected to isolate the bad rows, and only those are dead-lettered. A
+    batch that failed because the database was unreachable is dead-lettered
+    whole, so an outage never blocks graph nodes for longer than
+    backpressure requires.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = DB_WRITE_BATCH_SIZE,
+        flush_interval: float = DB_WRITE_FLUSH_SECONDS,
+        max_pending: int = DB_WRITE_MAX_PENDING,
+        sync: bool = DB_WRITE_SYNC,
+        max_retries: int = 3,
+        max_dead_letters: int = DB_WRITE_DEAD_LETTER_MAX
+    ):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.sync = sync
+        self.max_retries = max_retries
+
+        self._handlers: "OrderedDict[str, FlushHandler]" = OrderedDict()
+        self._merges: Dict[str, Optional[MergeFunction]] = {}
+        self._buffers: Dict[str, "OrderedDict[Hashable, Any]"] = {}
+        self._unkeyed = itertools.count()
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+        # (kind, item, error) of writes that could not be written
+        self.dead_letters: Deque[Tuple[str, Any, str]] = deque(maxlen=max_dead_letters)
+
+        self.flushed = 0
+        self.coalesced = 0
+        self.dropped = 0
+
+    def register(self, kind: str, handler: FlushHandler, merge: Optional[MergeFunction] = None) -> None:
+        """Register the batch writer for a kind of write
+
+        Writes with the same key are coalesced: the newer item replaces the
+        older one, or merge(older, newer) combines them.
+        """
+        self._handlers[kind] = handler
+        self._merges[kind] = merge
+        self._buffers[kind] = OrderedDict()
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered writes"""
+        return sum(len(buffer) for buffer in self._buffers.values())
+
+    def _bind_loop(self) -> None:
+        """Create the asyncio primitives and flusher task for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._flush_lock = asyncio.Lock()
+            self._wake = asyncio.Event()
+            self._task = None
+        if not self.sync and (self._task is None or self._task.done()):
+            self._task = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            if self.pending:
+                await self.flush()
+
+    async def enqueue(self, kind: str, item: Any, key: Optional[Hashable] = None) -> None:
+        """Buffer a write, returning as soon as it is queued"""
+        self._bind_loop()
+
+        # Backpressure: the writer that overflows the queue pays for the flush
+        if self.pending >= self.max_pending:
+            await self.flush()
+
+        buffer = self._buffers[kind]
+        if key is None:
+            key = ("unkeyed", next(self._unkeyed))
+        if key in buffer:
+            merge = self._merges[kind]
+            buffer[key] = merge(buffer[key], item) if merge else item
+            self.coalesced += 1
+        else:
+            buffer[key] = item
+
+        if self.sync:
+            await self.flush()
+        elif self.pending >= self.batch_size:
+            self._wake.set()
+
+    async def flush(self) -> None:
+        """Write every buffered item now"""
+        self._bind_loop()
+        async with self._flush_lock:
+            for kind, handler in self._handlers.items():
+                buffer = self._buffers[kind]
+                if not buffer:
+                    continue
+                items = list(buffer.values())
+                buffer.clear()
+                await self._write(kind, handler, items)
+
+    async def _write(self, kind: str, handler: FlushHandler, items: List[Any]) -> None:
+        error: Optional[Exception] = None
+        for attempt in range(self.max_retries):
+            try:
+                await handler(items)
+                self.flushed += len(items)
+                return
+            except Exception as e:
+                error = e
+                print(f"⚠️ Write-behind flush of {len(items)} {kind} failed (attempt {attempt + 1}): {e}")
+                if not is_connection_error(e):
+                    # Retrying the same rows will not help; find the bad ones
+                    break
+                await asyncio.sleep(0.5 * 2 ** attempt)
+
+        if len(items) > 1 and not is_connection_error(error):
+            await self._bisect(kind, handler, items)
+        else:
+            self._dead_letter(kind, items, error)
+
+    async def _bisect(self, kind: str, handler: FlushHandler, items: List[Any]) -> None:
+        """Write each half of a failed batch, splitting further until the failing rows are isolated"""
+        middle = len(items) // 2
+        for half in (items[:middle], items[middle:]):
+            try:
+                await handler(half)
+                self.flushed += len(half)
+            except Exception as e:
+                if len(half) > 1 and not is_connection_error(e):
+                    await self._bisect(kind, handler, half)
+                else:
+                    self._dead_letter(kind, half, e)
+
+    def _dead_letter(self, kind: str, items: List[Any], error: Optional[Exception]) -> None:
+        self.dropped += len(items)
+        for item in items:
+            self.dead_letters.append((kind, item, str(error)))
+        print(f"❌ Dead-lettered {len(items)} {kind} writes: {error}")
+
+    async def drain(self) -> None:
+        """Flush everything and stop the background flusher"""
+        if self._loop is None or self._loop is not asyncio.get_running_loop():
+            # Nothing was queued on this event loop
+            if not self.pending:
+                return
+        await self.flush()
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get the queue counters"""
+        return {
+            "pending": self.pending,
+            "flushed": self.flushed,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+            "dead_letters": len(self.dead_letters)
+        }
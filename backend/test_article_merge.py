@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""Database tests for the COPY-and-merge article save path
+
+They run against DATABASE_URL with the migrations applied and are skipped
+without it. Each test runs inside a transaction that is rolled back, except
+the concurrency test, which commits and then deletes its own rows.
+"""
+
+import asyncio
+import os
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+
+import asyncpg
+import pytest
+
+from src.agent import database
+from src.agent.database import article_staging_records, merge_article_records, write_articles_to_db
+from src.agent.json_codecs import LazyRow, register_json_codecs
+
+PUBLISHED = datetime(2024, 5, 14, 9, 30, tzinfo=timezone.utc)
+
+
+async def connect():
+    """Open a test connection, skipping when the database or its schema is missing"""
+    try:
+        conn = await asyncpg.connect(os.environ["DATABASE_URL"], timeout=5)
+    except Exception as e:
+        pytest.skip(f"database unavailable: {e}")
+    if not await conn.fetchval("SELECT to_regclass('press_monitor.article_urls')"):
+        await conn.close()
+        pytest.skip("migrations have not been applied")
+    await register_json_codecs(conn)
+    return conn
+
+
+@pytest.fixture
+def db(monkeypatch):
+    """Run a test body on one connection whose transaction is rolled back afterwards"""
+    if not os.getenv("DATABASE_URL"):
+        pytest.skip("DATABASE_URL is not set")
+
+    def run(body):
+        async def wrapper():
+            conn = await connect()
+            try:
+                transaction = conn.transaction()
+                await transaction.start()
+
+                @asynccontextmanager
+                async def acquire():
+                    yield conn
+
+                monkeypatch.setattr(database.db_manager, "acquire", acquire)
+                monkeypatch.setattr(
+                    database.db_manager, "_partitions_month", datetime.now(timezone.utc).strftime("%Y-%m")
+                )
+                try:
+                    await conn.execute(
+                        "SELECT press_monitor.ensure_article_partitions($1::date, $1::date)", PUBLISHED.date()
+                    )
+                    await body(conn)
+                finally:
+                    await transaction.rollback()
+            finally:
+                await conn.close()
+
+        asyncio.run(wrapper())
+
+    return run
+
+
+def make_article(url, **fields):
+    article = {
+        "url": url,
+        "title": "Azerbaijan signs gas deal",
+        "source_name": "news.example.com",
+        "source_country": "Turkey",
+        "source_language": "tr",
+        "language_name": "Turkish",
+        "region": "Europe",
+        "published_date": PUBLISHED,
+        "original_content": "Azerbaycan ve Türkiye doğalgaz anlaşması imzaladı.",
+        "translated_content": None,
+        "summary": "",
+        "sentiment": "positive",
+        "sentiment_score": 0.6,
+        "sentiment_explanation": "",
+        "key_phrases": [],
+        "mentions_context": [],
+        "topics": []
+    }
+    article.update(fields)
+    return article
+
+
+async def save(conn, articles):
+    """Save articles as one write, as the background writer would"""
+    await write_articles_to_db(articles)
+    # The save ran as a savepoint of the test transaction, so ON COMMIT DROP has not fired yet
+    await conn.execute("DROP TABLE article_contents_staging, press_articles_staging")
+
+
+async def fetch_article(conn, url):
+    return LazyRow(await conn.fetchrow("SELECT * FROM press_monitor.press_articles WHERE url = $1", url))
+
+
+def test_resave_refreshes_content_without_erasing_it(db):
+    url = "https://news.example.com/merge-test-1"
+
+    async def body(conn):
+        await save(conn, [make_article(
+            url,
+            summary="Gas deal coverage",
+            topics=["energy"],
+            key_phrases=["gas deal"],
+            translated_content="Azerbaijan and Turkey signed a gas deal."
+        )])
+        first = await fetch_article(conn, url)
+
+        await save(conn, [make_article(
+            url,
+            original_content="Azerbaycan ve Türkiye anlaşmayı genişletti.",
+            sentiment="neutral",
+            sentiment_score=0.0
+        )])
+        second = await fetch_article(conn, url)
+
+        assert second["id"] == first["id"]
+        assert second["sentiment"] == "neutral"
+        # New content replaces the old reference; empty fields keep what was stored
+        assert second["content_hash"] != first["content_hash"]
+        assert second["summary"] == "Gas deal coverage"
+        assert second["topics"] == ["energy"]
+        assert second["key_phrases"] == ["gas deal"]
+        assert second["translated_content"] == "Azerbaijan and Turkey signed a gas deal."
+        assert await conn.fetchval(
+            "SELECT content FROM press_monitor.article_contents WHERE content_hash = $1",
+            second["content_hash"]
+        ) == "Azerbaycan ve Türkiye anlaşmayı genişletti."
+
+    db(body)
+
+
+def test_last_copy_in_a_batch_wins(db):
+    url = "https://news.example.com/merge-test-2"
+
+    async def body(conn):
+        await save(conn, [
+            make_article(url, sentiment="negative", sentiment_score=-0.5),
+            make_article(url, summary="Latest", sentiment="positive", sentiment_score=0.4)
+        ])
+
+        rows = await conn.fetch("SELECT * FROM press_monitor.press_articles WHERE url = $1", url)
+        assert len(rows) == 1
+        assert (rows[0]["sentiment"], rows[0]["summary"]) == ("positive", "Latest")
+
+    db(body)
+
+
+def test_undated_resave_keeps_the_stored_date(db):
+    url = "https://news.example.com/merge-test-3"
+
+    async def body(conn):
+        await save(conn, [make_article(url)])
+        await save(conn, [make_article(url, published_date=None, sentiment="negative")])
+
+        rows = await conn.fetch("SELECT * FROM press_monitor.press_articles WHERE url = $1", url)
+        assert [(row["published_date"], row["sentiment"]) for row in rows] == [(PUBLISHED, "negative")]
+
+    db(body)
+
+
+def test_urls_are_unique_across_dates(db):
+    url = "https://news.example.com/merge-test-4"
+
+    async def body(conn):
+        await save(conn, [make_article(url)])
+        await save(conn, [make_article(url, published_date=datetime(2024, 6, 2, tzinfo=timezone.utc))])
+
+        rows = await conn.fetch("SELECT published_date FROM press_monitor.press_articles WHERE url = $1", url)
+        assert [row["published_date"] for row in rows] == [PUBLISHED]
+
+        # Writers that bypass the merge cannot store the URL under a second date either
+        with pytest.raises(asyncpg.ForeignKeyViolationError):
+            await conn.execute(
+                """
+                INSERT INTO press_monitor.press_articles (
+                    url, title, source_name, source_language, language_name, published_date
+                ) VALUES ($1, 'Copy', 'news.example.com', 'tr', 'Turkish', $2)
+                """,
+                url, datetime(2024, 5, 20, tzinfo=timezone.utc)
+            )
+
+    db(body)
+
+
+def test_concurrent_saves_of_a_new_url_count_once():
+    if not os.getenv("DATABASE_URL"):
+        pytest.skip("DATABASE_URL is not set")
+
+    tag = uuid.uuid4().hex
+    country = f"Testland {tag}"
+    url = f"https://news.example.com/{tag}"
+    first = make_article(url, source_country=country, original_content=f"Gas deal {tag}")
+    second = dict(first, sentiment="negative", sentiment_score=-0.5)
+
+    async def run():
+        conn_a = await connect()
+        conn_b = await connect()
+        try:
+            await conn_a.execute(
+                "SELECT press_monitor.ensure_article_partitions($1::date, $1::date)", PUBLISHED.date()
+            )
+            transaction_a = conn_a.transaction()
+            await transaction_a.start()
+            await merge_article_records(conn_a, *article_staging_records([first]))
+
+            transaction_b = conn_b.transaction()
+            await transaction_b.start()
+            saving = asyncio.ensure_future(merge_article_records(conn_b, *article_staging_records([second])))
+            await asyncio.sleep(0.3)
+            assert not saving.done()  # Waits for the first save of the URL
+
+            await transaction_a.commit()
+            await saving
+            await transaction_b.commit()
+
+            rollup = await conn_a.fetch(
+                "SELECT sentiment, article_count FROM press_monitor.daily_sentiment_rollup "
+                "WHERE source_country = $1",
+                country
+            )
+            assert [tuple(row) for row in rollup] == [("negative", 1)]
+            assert await conn_a.fetchval(
+                "SELECT COUNT(*) FROM press_monitor.press_articles WHERE url = $1", url
+            ) == 1
+        finally:
+            # Cascades to the press_articles row
+            await conn_a.execute("DELETE FROM press_monitor.article_urls WHERE url = $1", url)
+            await conn_a.execute(
+                "DELETE FROM press_monitor.daily_sentiment_rollup WHERE source_country = $1", country
+            )
+            await conn_a.execute(
+                "DELETE FROM press_monitor.article_contents WHERE content_hash = $1", first["content_hash"]
+            )
+            await conn_a.close()
+            await conn_b.close()
+
+    asyncio.run(run())
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Unit tests for article search cursors and argument checks"""
+
+import asyncio
+import base64
+from datetime import datetime, timezone
+
+import pytest
+
+from src.agent.database import decode_search_cursor, encode_search_cursor, search_articles
+from test_article_merge import db, make_article, save  # noqa: F401 - db is a fixture
+
+ROW = {
+    "published_date": datetime(2024, 5, 14, 9, 30, tzinfo=timezone.utc),
+    "url": "https://news.example.com/a?b=1&c=ü",
+    "rank": 0.4375
+}
+
+
+def test_listing_cursor_round_trip():
+    cursor = encode_search_cursor(ROW, ranked=False)
+
+    assert decode_search_cursor(cursor, ranked=False) == [ROW["published_date"], ROW["url"]]
+    # Cursors are safe to pass in a query string
+    assert set(cursor) <= set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_=")
+
+
+def test_ranked_cursor_round_trip():
+    cursor = encode_search_cursor(ROW, ranked=True)
+
+    assert decode_search_cursor(cursor, ranked=True) == [ROW["rank"], ROW["published_date"], ROW["url"]]
+
+
+def test_cursor_must_match_the_query_kind():
+    with pytest.raises(ValueError):
+        decode_search_cursor(encode_search_cursor(ROW, ranked=True), ranked=False)
+    with pytest.raises(ValueError):
+        decode_search_cursor(encode_search_cursor(ROW, ranked=False), ranked=True)
+
+
+@pytest.mark.parametrize("cursor", [
+    "not base64!",
+    base64.urlsafe_b64encode(b"not json").decode(),
+    base64.urlsafe_b64encode(b'["yesterday", "https://a.example.com"]').decode()
+])
+def test_malformed_cursors_are_rejected(cursor):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_search_cursor(cursor, ranked=False)
+
+
+def test_bad_arguments_fail_before_querying():
+    with pytest.raises(ValueError, match="Unknown sentiment"):
+        asyncio.run(search_articles(sentiment="angry"))
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        asyncio.run(search_articles(query="gas", cursor=encode_search_cursor(ROW, ranked=False)))
+
+
+def collect_pages(**filters):
+    """Follow next_cursor through every page, returning the URLs in order"""
+    async def run():
+        urls, cursor = [], None
+        while True:
+            page = await search_articles(cursor=cursor, limit=2, **filters)
+            urls.extend(article["url"] for article in page["articles"])
+            cursor = page["next_cursor"]
+            if not cursor:
+                return urls
+    return run()
+
+
+def test_pages_cover_every_match_once(db):
+    country = "Pagingland"
+    articles = [
+        make_article(
+            f"https://news.example.com/paging-{n}",
+            source_country=country,
+            # Two articles share a date, so the URL breaks the tie
+            published_date=datetime(2024, 5, 10 + min(n, 3), tzinfo=timezone.utc),
+            summary="Gas pipeline agreement" if n % 2 else "Border talks",
+            original_content=f"Paging article {n}"
+        )
+        for n in range(5)
+    ]
+
+    async def body(conn):
+        await save(conn, articles)
+
+        listed = await collect_pages(country=country)
+        assert listed == [a["url"] for a in sorted(
+            articles, key=lambda a: (a["published_date"], a["url"]), reverse=True
+        )]
+
+        ranked = await collect_pages(query="pipeline", country=country)
+        assert sorted(ranked) == sorted(a["url"] for a in articles if "pipeline" in a["summary"])
+
+    db(body)
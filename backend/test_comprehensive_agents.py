@@ -244,10 +244,10 @@ class TestSentimentAnalysis(TestMultiAgentSystem):
 class TestTemporalAnalytics(TestMultiAgentSystem):
     """Test temporal analytics functionality"""
     
-    @patch('src.agent.database.get_countries_with_sufficient_data')
-    async def test_temporal_analysis(self, mock_get_countries):
+    @patch('src.agent.temporal_analytics.get_daily_sentiment_by_target', new_callable=AsyncMock)
+    async def test_temporal_analysis(self, mock_get_rollup):
         """Test temporal trend analysis"""
-        mock_get_countries.return_value = ["TR", "RU"]
+        mock_get_rollup.return_value = []
         
         agent = TemporalAnalyticsAgent()
         
@@ -359,6 +359,8 @@ class TestDatabaseOperations(TestMultiAgentSystem):
         
         # Save article
         await save_articles_to_db([sample_article])
+        # Saves are queued; write them out before reading back
+        await db_manager.writer.flush()
         
         # Retrieve articles
         articles = await get_articles_from_db(days_back=1)
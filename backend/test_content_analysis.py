@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Unit tests for content-level analysis shared across articles"""
+
+import asyncio
+
+import pytest
+
+from src.agent import content_analysis as content_analysis_module
+from src.agent import llm_clients
+from src.agent.content_analysis import analyze_content_groups, group_by_content
+from src.agent.lru import LRUCache
+from src.agent.tools_and_schemas import ContentAnalysis
+
+
+class FakeStructuredModel:
+    def __init__(self, owner):
+        self.owner = owner
+
+    async def ainvoke(self, prompt):
+        self.owner.prompts.append(prompt)
+        if self.owner.fail:
+            raise RuntimeError("model unavailable")
+        return ContentAnalysis(
+            summary="Gas deal coverage",
+            mentions=["Azerbaijan signed"],
+            mention_context="economic",
+            topics=["energy", "trade"]
+        )
+
+
+class FakeModel:
+    """Stand-in for the chat model that counts content analysis calls"""
+
+    model = "fake-model"
+    temperature = 0.0
+    max_retries = 0
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.prompts = []
+
+    def with_structured_output(self, schema):
+        return FakeStructuredModel(self)
+
+
+@pytest.fixture(autouse=True)
+def fresh_memo(monkeypatch):
+    monkeypatch.setattr(content_analysis_module, "content_analysis_memo", LRUCache(max_entries=10))
+    monkeypatch.setattr(llm_clients, "_structured_models", {})
+
+
+def make_article(number, content="Azerbaijan signed a gas deal in Baku.", content_hash=None):
+    article = {
+        "url": f"https://news.example.com/{number}",
+        "title": f"Headline {number}",
+        "language_name": "English",
+        "original_content": content
+    }
+    if content_hash:
+        article["content_hash"] = content_hash
+    return article
+
+
+def test_articles_group_by_content():
+    shared = [make_article(1), make_article(2)]
+    hashed = make_article(3, content_hash="abc")
+    empty = make_article(4, content="")
+
+    groups = group_by_content(shared + [hashed, empty])
+
+    assert sorted(len(members) for members in groups.values()) == [1, 2]
+    assert groups["abc"] == [hashed]
+
+
+def test_one_call_per_unique_content():
+    model = FakeModel()
+    articles = [make_article(1), make_article(2), make_article(3, "Other text about Baku.")]
+
+    asyncio.run(analyze_content_groups(articles, model))
+
+    assert len(model.prompts) == 2
+    assert all(article["summary"] == "Gas deal coverage" for article in articles)
+    assert articles[0]["mentions_context"] == [{"text": "Azerbaijan signed", "context": "economic"}]
+    # Each article gets its own copy of the shared lists
+    articles[0]["topics"].append("local edit")
+    assert articles[1]["topics"] == ["energy", "trade"]
+
+
+def test_memo_and_existing_summaries_skip_the_call():
+    model = FakeModel()
+    asyncio.run(analyze_content_groups([make_article(1)], model))
+
+    later = make_article(2)
+    summarized = {**make_article(3, "Other text"), "summary": "Already done"}
+    asyncio.run(analyze_content_groups([later, summarized], model))
+
+    assert len(model.prompts) == 1
+    assert later["summary"] == "Gas deal coverage"
+    assert summarized["summary"] == "Already done"
+
+
+def test_failed_analysis_is_not_memoized():
+    articles = [make_article(1)]
+    asyncio.run(analyze_content_groups(articles, FakeModel(fail=True)))
+
+    assert "summary" not in articles[0]
+    assert len(content_analysis_module.content_analysis_memo) == 0
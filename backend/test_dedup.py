@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Unit tests for cross-language duplicate detection"""
+
+from src.agent.dedup import (
+    ArticleIndex,
+    check_title_order,
+    deduplicate_articles,
+    hamming_distance,
+    normalize_title,
+    simhash
+)
+
+
+def make_article(url, title, language="en", query="azerbaijan"):
+    return {
+        "url": url,
+        "title": title,
+        "source_language": language,
+        "search_query": query
+    }
+
+
+def distance(title, other):
+    return hamming_distance(simhash(normalize_title(title)), simhash(normalize_title(other)))
+
+
+def test_same_url_is_merged():
+    first = make_article("https://news.example.com/a?utm_source=x", "Azerbaijan signs gas deal", "en", "q1")
+    second = make_article("https://news.example.com/a", "Azerbaijan signs gas deal", "tr", "q2")
+
+    unique = deduplicate_articles([first, second])
+
+    assert unique == [first]
+    assert first["found_in_languages"] == ["en", "tr"]
+    assert first["search_queries"] == ["q1", "q2"]
+
+
+def test_syndicated_headline_is_merged():
+    first = make_article(
+        "https://a.example.com/1", "Azerbaijan and Turkey sign new gas pipeline agreement in Baku"
+    )
+    second = make_article(
+        "https://b.example.org/2", "Azerbaijan, Turkey sign new gas pipeline agreement in Baku"
+    )
+
+    unique = deduplicate_articles([first, second])
+
+    assert unique == [first]
+    assert first["duplicate_urls"] == ["https://b.example.org/2"]
+
+
+def test_swapped_subject_and_object_are_kept_apart():
+    pairs = [
+        (
+            "Armenia accuses Azerbaijan of ceasefire violation on border",
+            "Azerbaijan accuses Armenia of ceasefire violation on border"
+        ),
+        (
+            "Armenia accuses Azerbaijan of ceasefire violation on the northern border near Tavush, defence ministry says",
+            "Azerbaijan accuses Armenia of ceasefire violation on the northern border near Tavush, defence ministry says"
+        )
+    ]
+    for title, swapped in pairs:
+        articles = [
+            make_article("https://a.example.com/1", title),
+            make_article("https://b.example.org/2", swapped)
+        ]
+        assert len(deduplicate_articles(articles)) == 2
+
+    # The long pair is close enough that only the word-order check separates it
+    assert distance(*pairs[1]) <= ArticleIndex().max_distance
+
+
+def test_title_order_check():
+    assert check_title_order(
+        "Azerbaijan and Turkey sign new gas pipeline agreement",
+        "Azerbaijan, Turkey sign new gas pipeline agreement"
+    )
+    assert not check_title_order(
+        "Armenia accuses Azerbaijan of ceasefire violation",
+        "Azerbaijan accuses Armenia of ceasefire violation"
+    )
+
+
+def test_unsegmented_titles_match_only_within_a_source():
+    title = "阿塞拜疆与土耳其在巴库签署新的天然气管道协议"
+    copy = "阿塞拜疆与土耳其在巴库签署新的天然气管道协议！"
+    assert distance(title, copy) <= ArticleIndex().max_distance
+
+    same_source = [
+        make_article("https://news.example.cn/1", title, "zh"),
+        make_article("https://www.news.example.cn/2", copy, "zh")
+    ]
+    other_source = [
+        make_article("https://news.example.cn/1", title, "zh"),
+        make_article("https://other.example.cn/2", copy, "zh")
+    ]
+
+    assert len(deduplicate_articles(same_source)) == 1
+    assert len(deduplicate_articles(other_source)) == 2
+
+
+def test_unrelated_and_placeholder_titles_are_kept():
+    articles = [
+        make_article("https://a.example.com/1", "Aliyev meets Putin in Moscow to discuss trade"),
+        make_article("https://b.example.com/2", "Aliyev meets Erdogan in Ankara to discuss trade"),
+        make_article("https://c.example.com/3", "No title"),
+        make_article("https://d.example.com/4", "No title"),
+        make_article("https://e.example.com/5", "example.com"),
+        make_article("https://f.example.com/6", "example.com")
+    ]
+
+    assert len(deduplicate_articles(articles)) == len(articles)
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Unit tests for batched headline filtering"""
+
+import asyncio
+
+from src.agent.language_agents import (
+    HEADLINE_FILTER_PROMPT_TOKENS,
+    HeadlineFilterBatcher,
+    ai_filter_headlines_batched,
+    build_headline_filter_prompt,
+    plan_headline_batches
+)
+
+
+class FakeModel:
+    """Stand-in for the chat model that records prompts and keeps every headline"""
+
+    def __init__(self, reply: str = None):
+        self.reply = reply
+        self.prompts = []
+
+    async def ainvoke(self, prompt):
+        self.prompts.append(prompt)
+        if self.reply is not None:
+            content = self.reply
+        else:
+            count = sum(1 for line in prompt.splitlines() if line[:1].isdigit())
+            content = ",".join(str(n) for n in range(1, count + 1))
+        return type("Response", (), {"content": content})()
+
+
+class FailingModel:
+    """Stand-in for a chat model whose calls all fail"""
+
+    async def ainvoke(self, prompt):
+        raise RuntimeError("model unavailable")
+
+
+def make_articles(language_code, count):
+    return [
+        {"url": f"https://{language_code}.example.com/{i}", "title": f"{language_code} headline {i}",
+         "source_name": f"{language_code}.example.com"}
+        for i in range(count)
+    ]
+
+
+def test_languages_in_the_same_wave_share_one_prompt():
+    model = FakeModel()
+    batcher = HeadlineFilterBatcher(model, active_languages=3, linger_seconds=60)
+
+    async def run():
+        return await asyncio.gather(*(
+            batcher.filter(make_articles(language_code, 2), language_code)
+            for language_code in ["en", "tr", "ru"]
+        ))
+
+    results = asyncio.run(asyncio.wait_for(run(), timeout=5))
+
+    # All three languages submitted, so the pool flushed without waiting out the linger
+    assert len(model.prompts) == 1
+    assert [len(kept) for kept in results] == [2, 2, 2]
+    assert results[1][0]["url"] == "https://tr.example.com/0"
+
+
+def test_linger_flushes_without_the_slow_languages():
+    model = FakeModel()
+    batcher = HeadlineFilterBatcher(model, active_languages=2, linger_seconds=0.01)
+
+    kept = asyncio.run(asyncio.wait_for(batcher.filter(make_articles("en", 2), "en"), timeout=5))
+
+    assert len(kept) == 2
+    assert batcher.flushes == 1
+
+
+def test_finished_languages_no_longer_hold_the_pool():
+    model = FakeModel()
+    batcher = HeadlineFilterBatcher(model, active_languages=2, linger_seconds=60)
+
+    async def run():
+        waiting = asyncio.ensure_future(batcher.filter(make_articles("en", 1), "en"))
+        await asyncio.sleep(0)
+        batcher.finish("tr")
+        return await waiting
+
+    assert len(asyncio.run(asyncio.wait_for(run(), timeout=5))) == 1
+    assert len(model.prompts) == 1
+
+
+def test_zero_linger_filters_each_language_alone():
+    model = FakeModel("NONE")
+    batcher = HeadlineFilterBatcher(model, active_languages=2, linger_seconds=0)
+
+    async def run():
+        return await asyncio.gather(
+            batcher.filter(make_articles("en", 1), "en"),
+            batcher.filter(make_articles("tr", 1), "tr")
+        )
+
+    assert asyncio.run(run()) == [[], []]
+    assert len(model.prompts) == 2
+
+
+def test_small_languages_share_a_batch():
+    batches = plan_headline_batches({"en": make_articles("en", 3), "tr": make_articles("tr", 2)})
+
+    assert len(batches) == 1
+    assert [(language_code, len(articles)) for language_code, articles in batches[0]] == [("en", 3), ("tr", 2)]
+
+
+def test_oversized_language_is_split_across_batches():
+    articles = make_articles("en", 40)
+    batches = plan_headline_batches({"en": articles}, token_budget=HEADLINE_FILTER_PROMPT_TOKENS + 200)
+
+    assert len(batches) > 1
+    assert all(language_code == "en" for batch in batches for language_code, _ in batch)
+    # Every headline lands in exactly one batch, in order
+    assert [a for batch in batches for _, chunk in batch for a in chunk] == articles
+
+
+def test_prompt_numbers_headlines_across_sections():
+    prompt = build_headline_filter_prompt([("en", make_articles("en", 2)), ("tr", make_articles("tr", 1))])
+
+    assert "1. [en.example.com] en headline 0" in prompt
+    assert "3. [tr.example.com] tr headline 0" in prompt
+    assert "Country/Region: Turkey" in prompt
+
+
+def test_selected_numbers_map_back_to_languages():
+    model = FakeModel(" 3, 1,x, 1, 99, 0")
+    articles = {"en": make_articles("en", 2), "tr": make_articles("tr", 2)}
+
+    filtered = asyncio.run(ai_filter_headlines_batched(articles, model))
+
+    assert len(model.prompts) == 1
+    # Out-of-range, duplicate and non-numeric entries are ignored
+    assert filtered == {"en": [articles["en"][0]], "tr": [articles["tr"][0]]}
+
+
+def test_none_reply_drops_every_headline():
+    filtered = asyncio.run(ai_filter_headlines_batched({"en": make_articles("en", 2)}, FakeModel("NONE")))
+
+    assert filtered == {"en": []}
+
+
+def test_failed_call_keeps_every_headline():
+    articles = {"en": make_articles("en", 2), "tr": []}
+
+    filtered = asyncio.run(ai_filter_headlines_batched(articles, FailingModel()))
+
+    assert filtered == {"en": articles["en"]}
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""Unit tests for the JSON codecs and lazily decoded rows"""
+
+from src.agent import json_codecs
+from src.agent.json_codecs import LazyRow, RawJSON, dumps, encode_json, loads
+
+
+def test_round_trip():
+    value = {"topics": ["energy", "трубопровод"], "score": 0.5, "nested": {"ok": True}}
+
+    assert loads(dumps(value)) == value
+    assert loads(RawJSON(dumps(value))) == value
+
+
+def test_round_trip_without_orjson(monkeypatch):
+    monkeypatch.setattr(json_codecs, "orjson", None)
+    value = {"key_phrases": ["gas deal"], "count": 3}
+
+    assert loads(dumps(value)) == value
+    assert loads(RawJSON('["a"]')) == ["a"]
+
+
+def test_raw_json_parameters_pass_through():
+    raw = RawJSON('{"a": 1}')
+
+    assert encode_json(raw) is raw
+    assert loads(encode_json({"a": 1})) == {"a": 1}
+
+
+def test_lazy_row_decodes_json_columns_once():
+    row = LazyRow({"url": "https://a.example.com/1", "topics": RawJSON('["energy"]')})
+
+    topics = row["topics"]
+    assert topics == ["energy"]
+    # The decoded value replaces the raw text, so later reads return the same object
+    assert row["topics"] is topics
+    assert row["url"] == "https://a.example.com/1"
+
+
+def test_lazy_row_behaves_like_a_dict():
+    row = LazyRow({"summary": "text", "topics": RawJSON('["energy"]')})
+    row["sentiment"] = "neutral"
+    del row["summary"]
+
+    assert dict(row) == {"topics": ["energy"], "sentiment": "neutral"}
+    assert len(row) == 2
+
+    copy = row.copy()
+    copy["sentiment"] = "positive"
+    assert row["sentiment"] == "neutral"
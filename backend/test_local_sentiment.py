@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Unit tests for the local sentiment pre-classifier and the Gemini escalation split"""
+
+import asyncio
+
+import pytest
+
+from src.agent import sentiment_analyzer
+from src.agent import sentiment_cache as sentiment_cache_module
+from src.agent.local_sentiment import LOCAL_SENTIMENT_MODEL, classify_article_locally
+from src.agent.sentiment_analyzer import analyze_articles, classify_articles_locally
+from src.agent.sentiment_cache import SentimentCache
+
+
+@pytest.fixture(autouse=True)
+def fresh_sentiment_cache(monkeypatch):
+    monkeypatch.setattr(sentiment_analyzer, "sentiment_cache", SentimentCache())
+
+
+def make_article(title, language="en", number=0):
+    return {
+        "url": f"https://news.example.com/{number}",
+        "title": title,
+        "source_language": language,
+        "original_content": title
+    }
+
+
+def classify(title, language="en"):
+    analysis, confidence = classify_article_locally(make_article(title, language))
+    return analysis.sentiment, confidence
+
+
+def test_negated_conflict_reads_positive():
+    sentiment, confidence = classify("Azerbaijan welcomes the end of war")
+
+    assert sentiment == "positive"
+    assert confidence >= 0.8
+
+
+def test_negated_agreement_reads_negative():
+    assert classify("No agreement reached between Baku and Yerevan")[0] == "negative"
+    assert classify("Прекращение войны в регионе", "ru")[0] == "positive"
+
+
+def test_clear_cues_are_confident():
+    assert classify("Armenia accuses Azerbaijan of ceasefire violation") == ("negative", pytest.approx(0.909))
+    assert classify("Азербайджан и Россия подписали соглашение о сотрудничестве", "ru")[0] == "positive"
+
+
+def test_mixed_cues_have_low_confidence():
+    assert classify("Azerbaijan and Armenia agree on talks despite new border clash")[1] < 0.5
+
+
+def test_whole_word_cues_do_not_match_longer_words():
+    sentiment, _ = classify("Baku enjoys a warm spring")
+    assert sentiment == "neutral"
+
+
+def test_uncovered_languages_always_escalate():
+    assert classify("Azerbaijan signs partnership agreement", "sw") == ("neutral", 0.0)
+
+
+def test_only_confident_articles_are_settled_locally():
+    confident = make_article("Azerbaijan welcomes the end of war", number=1)
+    mixed = make_article("Azerbaijan and Armenia agree on talks despite new border clash", number=2)
+    uncovered = make_article("Azerbaijan signs partnership agreement", "sw", number=3)
+
+    escalated = classify_articles_locally([confident, mixed, uncovered], min_confidence=0.8)
+
+    assert escalated == [mixed, uncovered]
+    assert confident["sentiment_model"] == LOCAL_SENTIMENT_MODEL
+    assert "sentiment_model" not in mixed
+
+
+def run_analyze_articles(monkeypatch, local_enabled):
+    """Run analyze_articles with translation and Gemini scoring replaced by recorders"""
+    translated, scored = [], []
+
+    async def no_cached_sentiments(keys, model, prompt_version):
+        return {}
+
+    async def record_translation(articles, model):
+        translated.extend(articles)
+
+    async def record_scoring(articles, model):
+        scored.extend(articles)
+        return articles
+
+    monkeypatch.setattr(sentiment_cache_module, "get_cached_sentiments", no_cached_sentiments)
+    monkeypatch.setattr(sentiment_analyzer, "CONTENT_ANALYSIS_ENABLED", False)
+    monkeypatch.setattr(sentiment_analyzer, "LOCAL_SENTIMENT_ENABLED", local_enabled)
+    monkeypatch.setattr(sentiment_analyzer, "translate_articles", record_translation)
+    monkeypatch.setattr(sentiment_analyzer, "analyze_sentiment_batch", record_scoring)
+
+    articles = [
+        make_article("Azerbaijan welcomes the end of war", number=1),
+        make_article("Azerbaijan and Armenia agree on talks despite new border clash", number=2)
+    ]
+    asyncio.run(analyze_articles(articles, model=None))
+    return articles, translated, scored
+
+
+def test_local_tier_only_skips_the_sentiment_call(monkeypatch):
+    articles, translated, scored = run_analyze_articles(monkeypatch, local_enabled=True)
+
+    # Every unscored article is translated, even those the local tier settles
+    assert translated == articles
+    assert scored == [articles[1]]
+
+
+def test_local_tier_is_skipped_when_disabled(monkeypatch):
+    articles, translated, scored = run_analyze_articles(monkeypatch, local_enabled=False)
+
+    assert translated == articles
+    assert scored == articles
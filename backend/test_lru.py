@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Unit tests for the shared bounded LRU cache"""
+
+from src.agent import lru
+from src.agent.lru import LRUCache
+
+
+class FakeClock:
+    """Stand-in for time.time that only moves when told to"""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = LRUCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now the least recently used
+
+    cache.set("c", 3)
+
+    assert len(cache) == 2
+    assert "b" not in cache
+    assert cache.get_many(["a", "b", "c"]) == {"a": 1, "c": 3}
+
+
+def test_setting_an_existing_key_refreshes_it():
+    cache = LRUCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("a", 10)
+    cache.set("c", 3)
+
+    assert cache.get("a") == 10
+    assert cache.get("b") is None
+
+
+def test_default_ttl_expires_entries(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(lru.time, "time", clock)
+    cache = LRUCache(max_entries=10, ttl_seconds=60)
+    cache.set("a", 1)
+
+    clock.now += 59
+    assert cache.get("a") == 1
+
+    clock.now += 1
+    assert "a" not in cache
+    assert cache.get("a") is None
+    # Expired entries are dropped when read
+    assert len(cache) == 0
+
+
+def test_explicit_expiry_overrides_the_default(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(lru.time, "time", clock)
+    cache = LRUCache(max_entries=10, ttl_seconds=60)
+    cache.set("short", 1, expires_at=clock.now + 5)
+    cache.set("long", 2, expires_at=clock.now + 600)
+
+    clock.now += 120
+
+    assert cache.get_many(["short", "long"]) == {"long": 2}
+
+
+def test_entries_without_ttl_never_expire(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(lru.time, "time", clock)
+    cache = LRUCache(max_entries=10)
+    cache.set("a", 1)
+
+    clock.now += 10 ** 9
+
+    assert cache.get("a") == 1
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Unit tests for per-language search query generation"""
+
+import asyncio
+
+import pytest
+
+from src.agent import language_agents
+from src.agent.language_agents import (
+    DEFAULT_QUERY_YIELD,
+    MAX_QUERIES_PER_LANGUAGE,
+    build_template_queries,
+    create_language_search_queries,
+    expected_query_yield,
+    is_language_search_done,
+    plan_query_wave,
+    record_query_yields
+)
+from src.agent.search_cache import normalize_query
+
+
+class FakeModel:
+    """Stand-in for the chat model that counts prompts"""
+
+    def __init__(self, reply: str):
+        self.reply = reply
+        self.calls = 0
+
+    async def ainvoke(self, prompt):
+        self.calls += 1
+        return type("Response", (), {"content": self.reply})()
+
+
+@pytest.fixture
+def yields():
+    language_agents._query_yields.clear()
+    yield language_agents._query_yields
+    language_agents._query_yields.clear()
+
+
+def test_country_name_is_paired_with_topics():
+    queries = build_template_queries("en")
+
+    assert queries[0] == "Azerbaijan"
+    assert "Azerbaijan relations" in queries
+    assert "Azerbaijan economy" in queries
+    assert len(queries) == MAX_QUERIES_PER_LANGUAGE
+
+
+def test_inflections_of_the_name_are_dropped():
+    assert "Azerbaijani" not in build_template_queries("en")
+    assert "азербайджанский" not in build_template_queries("ru")
+    assert "Баку" in build_template_queries("ru")
+
+
+def test_queries_are_distinct():
+    for language_code in language_agents.AZERBAIJAN_TRANSLATIONS:
+        queries = build_template_queries(language_code)
+        normalized = [normalize_query(query) for query in queries]
+        assert len(normalized) == len(set(normalized)), language_code
+        assert 0 < len(queries) <= MAX_QUERIES_PER_LANGUAGE
+
+
+def test_languages_without_topics_use_the_bare_terms():
+    assert build_template_queries("id") == ["Azerbaijan", "Baku"]
+
+
+def test_generated_queries_are_memoized(monkeypatch):
+    monkeypatch.setattr(language_agents, "build_template_queries", lambda language_code: [])
+    language_agents._generated_queries.clear()
+    model = FakeModel("Azerbaijan news\nBaku economy\n")
+
+    async def run():
+        first = await create_language_search_queries("xx", "Test", model, "last week")
+        second = await create_language_search_queries("xx", "Test", model, "last week")
+        return first, second
+
+    first, second = asyncio.run(run())
+    language_agents._generated_queries.clear()
+
+    assert first == second == ["Azerbaijan news", "Baku economy"]
+    assert model.calls == 1
+
+
+def test_failed_generation_is_not_memoized(monkeypatch):
+    monkeypatch.setattr(language_agents, "build_template_queries", lambda language_code: [])
+    language_agents._generated_queries.clear()
+    model = FakeModel("")
+
+    assert asyncio.run(create_language_search_queries("xx", "Test", model)) == ["Azerbaijan"]
+    assert ("xx", None) not in language_agents._generated_queries
+
+
+def test_unseen_queries_use_the_default_yield(yields):
+    assert expected_query_yield("en", "Azerbaijan") == DEFAULT_QUERY_YIELD
+
+
+def test_yields_are_credited_per_normalized_query(yields):
+    kept = [{"search_query": "Azerbaijan  economy"}, {"search_query": "azerbaijan economy"}]
+    record_query_yields("en", ["Azerbaijan economy", "Baku"], kept)
+    record_query_yields("en", ["Azerbaijan Economy", "Baku"], [])
+
+    assert expected_query_yield("en", "azerbaijan economy") == 1.0
+    assert expected_query_yield("en", "Baku") == 0.0
+    assert expected_query_yield("tr", "Baku") == DEFAULT_QUERY_YIELD
+
+
+def test_wave_runs_best_queries_until_the_quota_is_expected(yields):
+    record_query_yields("en", ["high"], [{"search_query": "high"}] * 3)
+    record_query_yields("en", ["low"], [])
+
+    wave, deferred = plan_query_wave("en", ["low", "unseen", "high"], remaining_quota=4)
+
+    # 3 expected from "high" plus the default 2 from "unseen" covers the quota of 4
+    assert wave == ["high", "unseen"]
+    assert deferred == ["low"]
+
+
+def test_without_a_quota_every_query_runs(yields):
+    wave, deferred = plan_query_wave("en", ["a", "b", "c"], remaining_quota=None)
+
+    assert sorted(wave) == ["a", "b", "c"]
+    assert deferred == []
+
+
+def test_language_is_done_at_quota_or_without_queries():
+    assert is_language_search_done({"articles_found": [{}] * 5, "pending_queries": ["q"]}, 5)
+    assert is_language_search_done({"articles_found": [], "pending_queries": []}, 5)
+    assert not is_language_search_done({"articles_found": [{}], "pending_queries": ["q"]}, 5)
+    # Before the first wave the queries have not been planned yet
+    assert not is_language_search_done({"articles_found": []}, None)
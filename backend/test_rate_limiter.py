@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Unit tests for the adaptive Gemini governor"""
+
+import asyncio
+
+import pytest
+
+from src.agent.rate_limiter import GeminiGovernor, is_rate_limit_error
+
+
+class RateLimited(Exception):
+    """Stand-in for a Gemini 429 response"""
+    code = 429
+
+
+async def throttled_call(governor: GeminiGovernor) -> None:
+    with pytest.raises(RateLimited):
+        async with governor.slot():
+            raise RateLimited("RESOURCE_EXHAUSTED")
+
+
+def test_rate_limit_detection():
+    assert is_rate_limit_error(RateLimited())
+    assert is_rate_limit_error(Exception("429 Too Many Requests"))
+    assert not is_rate_limit_error(ValueError("bad request"))
+
+
+def test_throttle_halves_rate_and_concurrency():
+    governor = GeminiGovernor(max_rate=8, max_concurrency=16)
+    assert governor.concurrency_limit == 8
+
+    asyncio.run(throttled_call(governor))
+
+    assert governor.throttled == 1
+    assert governor.rate == 4
+    assert governor.concurrency_limit == 4
+    assert governor.in_flight == 0
+
+
+def test_throttle_respects_floors():
+    governor = GeminiGovernor(max_rate=8, max_concurrency=16, min_rate=0.5, min_concurrency=1)
+    for _ in range(10):
+        governor._on_throttled()
+
+    assert governor.rate == 0.5
+    assert governor.concurrency_limit == 1
+
+
+def test_calls_still_admitted_below_one_request_per_second():
+    governor = GeminiGovernor(max_rate=8, min_rate=0.5)
+
+    async def run():
+        for _ in range(5):
+            await throttled_call(governor)
+        assert governor.rate < 1
+        # Let more than a whole token's worth of time pass at the backed-off rate
+        governor._last_refill -= 10
+        async with governor.slot():
+            pass
+
+    asyncio.run(asyncio.wait_for(run(), timeout=5))
+    assert governor.requests == 6
+
+
+def test_recovers_after_successful_calls():
+    governor = GeminiGovernor(max_rate=8, max_concurrency=16)
+    governor._on_throttled()
+    throttled_rate = governor.rate
+    throttled_limit = governor.concurrency_limit
+
+    for _ in range(100):
+        governor._on_success(0.1)
+
+    assert governor.rate > throttled_rate
+    assert governor.rate <= governor.max_rate
+    assert governor.concurrency_limit > throttled_limit
+    assert governor.concurrency_limit <= governor.max_concurrency
+
+
+def test_latency_spike_shrinks_concurrency():
+    governor = GeminiGovernor(max_rate=8, max_concurrency=16, latency_tolerance=2.0)
+    governor._on_success(0.1)
+    limit = governor.concurrency_limit
+    rate = governor.rate
+
+    governor._on_success(1.0)
+
+    assert governor.concurrency_limit < limit
+    assert governor.rate == rate
+
+
+def test_concurrency_limit_bounds_in_flight_calls():
+    governor = GeminiGovernor(max_rate=1000, max_concurrency=2)
+    governor.concurrency_limit = 2
+    peak = 0
+
+    async def call():
+        nonlocal peak
+        async with governor.slot():
+            peak = max(peak, governor.in_flight)
+            await asyncio.sleep(0.01)
+
+    async def run():
+        await asyncio.gather(*(call() for _ in range(8)))
+
+    asyncio.run(run())
+    assert peak <= 2
+    assert governor.in_flight == 0
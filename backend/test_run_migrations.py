@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Unit tests for splitting migration files into statements"""
+
+from pathlib import Path
+
+from run_migrations import split_statements
+
+
+def statements(sql):
+    return [statement.strip() for statement in split_statements(sql) if statement.strip()]
+
+
+def test_splits_on_semicolons():
+    assert statements("CREATE TABLE a (id INT);\nCREATE INDEX i ON a(id);\n") == [
+        "CREATE TABLE a (id INT)",
+        "CREATE INDEX i ON a(id)"
+    ]
+
+
+def test_dollar_quoted_bodies_stay_whole():
+    sql = """
+CREATE FUNCTION f() RETURNS INTEGER AS $$
+BEGIN
+    PERFORM 1;
+    RETURN 2;
+END
+$$ LANGUAGE plpgsql;
+DO $body$ BEGIN PERFORM 1; END $body$;
+SELECT f();
+"""
+    parts = statements(sql)
+
+    assert len(parts) == 3
+    assert parts[0].endswith("$$ LANGUAGE plpgsql")
+    assert "PERFORM 1;\n    RETURN 2;" in parts[0]
+    assert parts[1] == "DO $body$ BEGIN PERFORM 1; END $body$"
+
+
+def test_other_tags_inside_a_body_do_not_close_it():
+    parts = statements("DO $outer$ BEGIN EXECUTE $$SELECT 1; SELECT 2$$; END $outer$; SELECT 3;")
+
+    assert parts == ["DO $outer$ BEGIN EXECUTE $$SELECT 1; SELECT 2$$; END $outer$", "SELECT 3"]
+
+
+def test_partition_migration_splits_into_whole_statements():
+    sql = (Path(__file__).parent / "migrations" / "009_partition_press_articles.sql").read_text()
+    parts = statements(sql)
+
+    assert parts[0].startswith("-- Monthly range partitions")
+    assert parts[0].rstrip().endswith("LANGUAGE plpgsql")
+    # The conversion block is one statement, with its inner semicolons intact
+    conversion = next(part for part in parts if "RENAME TO press_articles_unpartitioned" in part)
+    assert conversion.endswith("END\n$$")
+    assert all(part.count("$$") % 2 == 0 for part in parts)
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Unit tests for the grounding search result cache"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.agent import search_cache as search_cache_module
+from src.agent.search_cache import SearchResultCache, make_cache_key
+
+RESULT = {"text": "Azerbaijan news", "chunks": [{"uri": "https://a.example.com/1", "title": "A"}]}
+EMPTY_RESULT = {"text": "", "chunks": []}
+
+
+class FakeDatabaseTier:
+    """Stand-in for the Postgres tier of the cache"""
+
+    def __init__(self, fail: bool = False):
+        self.rows = {}
+        self.fail = fail
+
+    async def get(self, key):
+        if self.fail:
+            raise ConnectionRefusedError("database is down")
+        return self.rows.get(key)
+
+    async def save(self, key, language_code, query, date_filter, result, ttl_seconds):
+        if self.fail:
+            raise ConnectionRefusedError("database is down")
+        self.rows[key] = (result, ttl_seconds)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def database(monkeypatch):
+    tier = FakeDatabaseTier()
+    monkeypatch.setattr(search_cache_module, "get_cached_search_result", tier.get)
+    monkeypatch.setattr(search_cache_module, "save_search_result", tier.save)
+    return tier
+
+
+def test_cache_key_ignores_case_and_spacing():
+    assert make_cache_key("en", "Azerbaijan  News", "last week") == make_cache_key(
+        "en", " azerbaijan news", "Last week "
+    )
+    assert make_cache_key("en", "azerbaijan", None) != make_cache_key("tr", "azerbaijan", None)
+
+
+def test_results_expire_after_the_ttl(clock, database):
+    cache = SearchResultCache(ttl_seconds=60, empty_ttl_seconds=10)
+
+    async def run():
+        await cache.set("en", "azerbaijan", None, RESULT)
+        database.rows.clear()  # Only the memory tier can answer now
+        clock[0] += 59
+        assert await cache.get("en", "azerbaijan", None) == RESULT
+        clock[0] += 1
+        assert await cache.get("en", "azerbaijan", None) is None
+
+    asyncio.run(run())
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_empty_results_use_the_shorter_ttl(clock, database):
+    cache = SearchResultCache(ttl_seconds=60, empty_ttl_seconds=10)
+
+    async def run():
+        await cache.set("en", "nothing found", None, EMPTY_RESULT)
+        assert database.rows[make_cache_key("en", "nothing found", None)][1] == 10
+        database.rows.clear()
+        clock[0] += 10
+        assert await cache.get("en", "nothing found", None) is None
+
+    asyncio.run(run())
+
+
+def test_empty_results_are_not_cached_with_zero_ttl(clock, database):
+    cache = SearchResultCache(ttl_seconds=60, empty_ttl_seconds=0)
+
+    async def run():
+        await cache.set("en", "nothing found", None, EMPTY_RESULT)
+        assert await cache.get("en", "nothing found", None) is None
+
+    asyncio.run(run())
+    assert database.rows == {}
+
+
+def test_database_hit_keeps_the_row_expiry(clock, database, monkeypatch):
+    cache = SearchResultCache(ttl_seconds=60)
+    key = make_cache_key("en", "azerbaijan", None)
+    database.rows[key] = (RESULT, clock[0] + 5)
+
+    async def fetch_row(lookup_key):
+        return database.rows.pop(lookup_key, None)
+
+    monkeypatch.setattr(search_cache_module, "get_cached_search_result", fetch_row)
+
+    async def run():
+        assert await cache.get("en", "azerbaijan", None) == RESULT
+        clock[0] += 5
+        # The memory copy expires with the row it was read from, not after the full TTL
+        assert await cache.get("en", "azerbaijan", None) is None
+
+    asyncio.run(run())
+
+
+def test_database_errors_are_misses(clock, monkeypatch):
+    tier = FakeDatabaseTier(fail=True)
+    monkeypatch.setattr(search_cache_module, "get_cached_search_result", tier.get)
+    monkeypatch.setattr(search_cache_module, "save_search_result", tier.save)
+    cache = SearchResultCache(ttl_seconds=60)
+
+    async def run():
+        assert await cache.get("en", "azerbaijan", None) is None
+        await cache.set("en", "azerbaijan", None, RESULT)
+        # The memory tier still works while the database is down
+        assert await cache.get("en", "azerbaijan", None) == RESULT
+
+    asyncio.run(run())
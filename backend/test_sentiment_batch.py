@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Unit tests for batched sentiment scoring"""
+
+import asyncio
+
+import pytest
+
+from src.agent import llm_clients
+from src.agent.sentiment_analyzer import (
+    analyze_sentiment_batch,
+    build_sentiment_batch_prompt,
+    validate_batch_results
+)
+from src.agent.tools_and_schemas import BatchSentimentItem, SentimentAnalysis, SentimentBatch
+
+
+class FakeStructuredModel:
+    """Stand-in for a structured-output binding that answers from a callback"""
+
+    def __init__(self, schema, respond):
+        self.schema = schema
+        self.respond = respond
+
+    async def ainvoke(self, prompt):
+        return self.respond(self.schema, prompt)
+
+
+class FakeModel:
+    """Stand-in for the chat model, recording which schemas were called"""
+
+    model = "fake-model"
+    temperature = 0.0
+    max_retries = 0
+
+    def __init__(self, batch_reply):
+        self.batch_reply = batch_reply
+        self.calls = []
+
+    def with_structured_output(self, schema):
+        return FakeStructuredModel(schema, self.respond)
+
+    def respond(self, schema, prompt):
+        self.calls.append(schema)
+        if schema is SentimentBatch:
+            if isinstance(self.batch_reply, Exception):
+                raise self.batch_reply
+            return self.batch_reply
+        return SentimentAnalysis(sentiment="neutral", score=0.0, explanation="retried", key_phrases=[])
+
+
+@pytest.fixture(autouse=True)
+def fresh_bindings(monkeypatch):
+    monkeypatch.setattr(llm_clients, "_structured_models", {})
+
+
+def make_article(number, content="Azerbaijan and Turkey signed a gas agreement in Baku."):
+    return {
+        "url": f"https://news.example.com/{number}",
+        "title": f"Headline {number}",
+        "source_language": "en",
+        "original_content": content
+    }
+
+
+def item(index, sentiment="positive", score=0.6):
+    return BatchSentimentItem(
+        index=index, sentiment=sentiment, score=score, explanation="", key_phrases=["gas deal"]
+    )
+
+
+def test_shared_excerpt_is_written_once():
+    prompt = build_sentiment_batch_prompt([make_article(1), make_article(2), make_article(3, "Other text")])
+
+    assert prompt.count("Azerbaijan and Turkey signed a gas agreement") == 1
+    assert "Content: same as article 1" in prompt
+    assert "Content: Other text" in prompt
+
+
+def test_invalid_items_are_dropped_individually():
+    response = SentimentBatch(items=[
+        item(1, " Positive "),
+        item(2, "hopeful"),
+        item(3, score=4.0),
+        item(4), item(4, "negative"),
+        item(9)
+    ])
+
+    results = validate_batch_results(response, batch_size=5)
+
+    # Only the first item is valid; the repeated index 4 is ambiguous and 9 is out of range
+    assert list(results) == [0]
+    assert results[0].sentiment == "positive"
+
+
+def test_missing_items_are_retried_one_by_one():
+    model = FakeModel(SentimentBatch(items=[item(1), item(3, "negative", -0.5)]))
+    articles = [make_article(n) for n in range(1, 4)]
+
+    asyncio.run(analyze_sentiment_batch(articles, model))
+
+    assert [a["sentiment"] for a in articles] == ["positive", "neutral", "negative"]
+    assert articles[1]["sentiment_explanation"] == "retried"
+    assert model.calls == [SentimentBatch, SentimentAnalysis]
+
+
+def test_failed_batch_falls_back_to_single_calls():
+    model = FakeModel(RuntimeError("malformed structured output"))
+    articles = [make_article(n) for n in range(1, 4)]
+
+    asyncio.run(analyze_sentiment_batch(articles, model))
+
+    assert all(a["sentiment_explanation"] == "retried" for a in articles)
+    assert model.calls == [SentimentBatch] + [SentimentAnalysis] * 3
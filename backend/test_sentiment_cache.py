@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Unit tests for the two-tier sentiment cache"""
+
+import asyncio
+
+import pytest
+
+from src.agent import sentiment_cache as sentiment_cache_module
+from src.agent.sentiment_cache import SentimentCache, article_content_key
+
+SCORE = {"sentiment": "negative", "sentiment_score": -0.4, "sentiment_explanation": "", "key_phrases": []}
+
+
+class FakeDatabaseTier:
+    """Stand-in for the sentiment_cache table that counts lookups"""
+
+    def __init__(self):
+        self.rows = {}
+        self.lookups = []
+
+    async def get(self, keys, model, prompt_version):
+        self.lookups.append(list(keys))
+        return {key: self.rows[key] for key in keys if key in self.rows}
+
+
+@pytest.fixture
+def database(monkeypatch):
+    tier = FakeDatabaseTier()
+    monkeypatch.setattr(sentiment_cache_module, "get_cached_sentiments", tier.get)
+    return tier
+
+
+def make_article(url, title="Azerbaijan signs gas deal", content_hash="abc"):
+    return {"url": url, "title": title, "content_hash": content_hash}
+
+
+def scored(article, sentiment="positive"):
+    return {**article, "sentiment": sentiment, "sentiment_score": 0.5, "key_phrases": ["gas"]}
+
+
+def test_content_key_covers_title_and_content():
+    key = article_content_key(make_article("https://a.example.com/1"))
+
+    assert key == article_content_key(make_article("https://b.example.com/2"))
+    assert key != article_content_key(make_article("https://a.example.com/1", title="Other"))
+    assert key != article_content_key(make_article("https://a.example.com/1", content_hash="def"))
+    # Without a stored hash the original content is hashed instead
+    assert article_content_key({"title": "t", "original_content": "x"}) != article_content_key(
+        {"title": "t", "original_content": "y"}
+    )
+
+
+def test_memory_hits_skip_the_database(database):
+    cache = SentimentCache()
+    article = make_article("https://a.example.com/1")
+    cache.put(scored(article), "gemini")
+
+    found = asyncio.run(cache.get_many([article], "gemini"))
+
+    assert found[0]["sentiment"] == "positive"
+    assert database.lookups == []
+
+
+def test_misses_share_one_database_lookup(database):
+    cache = SentimentCache()
+    first = make_article("https://a.example.com/1")
+    second = make_article("https://b.example.com/2")
+    database.rows[(first["url"], article_content_key(first))] = SCORE
+
+    found = asyncio.run(cache.get_many([first, second, dict(first)], "gemini"))
+
+    assert found == {0: SCORE, 2: SCORE}
+    assert len(database.lookups) == 1
+    assert len(database.lookups[0]) == 2
+    assert (cache.hits, cache.misses) == (2, 1)
+
+    # The database result is now served from memory
+    asyncio.run(cache.get_many([first], "gemini"))
+    assert len(database.lookups) == 1
+
+
+def test_model_and_prompt_version_are_isolated(database):
+    cache = SentimentCache()
+    article = make_article("https://a.example.com/1")
+    cache.put(scored(article), "gemini", prompt_version="1")
+
+    assert asyncio.run(cache.get_many([article], "gemini", prompt_version="2")) == {}
+    assert asyncio.run(cache.get_many([article], "local", prompt_version="1")) == {}
+    assert 0 in asyncio.run(cache.get_many([article], "gemini", prompt_version="1"))
+
+
+def test_memory_tier_is_bounded(database):
+    cache = SentimentCache(max_entries=2)
+    articles = [make_article(f"https://a.example.com/{n}") for n in range(3)]
+    for article in articles:
+        cache.put(scored(article), "gemini")
+
+    found = asyncio.run(cache.get_many(articles, "gemini"))
+
+    assert sorted(found) == [1, 2]
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Unit tests for the translation memory and batched translation"""
+
+import asyncio
+
+import pytest
+
+from src.agent import llm_clients
+from src.agent import translation_memory as translation_memory_module
+from src.agent.translation_memory import (
+    TranslationBatch,
+    TranslationItem,
+    TranslationMemory,
+    needs_translation,
+    plan_translation_batches,
+    translate_articles
+)
+
+
+class FakeDatabaseTier:
+    """Stand-in for the translation_memory table"""
+
+    def __init__(self):
+        self.rows = {}
+
+    async def get(self, keys):
+        return {key: self.rows[key] for key in keys if key in self.rows}
+
+    async def save(self, translations, model):
+        self.rows.update(translations)
+
+
+class FakeStructuredModel:
+    def __init__(self, owner):
+        self.owner = owner
+
+    async def ainvoke(self, prompt):
+        self.owner.batch_prompts.append(prompt)
+        count = prompt.count("### Text ")
+        # Answer every text except the last, which must then be retried alone
+        return TranslationBatch(items=[
+            TranslationItem(index=number, translation=f"translation {number}") for number in range(1, count)
+        ])
+
+
+class FakeModel:
+    """Stand-in for the chat model that records batched and single translation calls"""
+
+    model = "fake-model"
+    temperature = 0.0
+    max_retries = 0
+
+    def __init__(self):
+        self.batch_prompts = []
+        self.single_prompts = []
+
+    def with_structured_output(self, schema):
+        return FakeStructuredModel(self)
+
+    async def ainvoke(self, prompt):
+        self.single_prompts.append(prompt)
+        return type("Response", (), {"content": "single translation"})()
+
+
+@pytest.fixture
+def database(monkeypatch):
+    tier = FakeDatabaseTier()
+    monkeypatch.setattr(translation_memory_module, "get_translations", tier.get)
+    monkeypatch.setattr(translation_memory_module, "save_translations", tier.save)
+    monkeypatch.setattr(translation_memory_module, "translation_memory", TranslationMemory())
+    monkeypatch.setattr(llm_clients, "_structured_models", {})
+    return tier
+
+
+def make_article(number, content, language="ru"):
+    return {
+        "url": f"https://news.example.ru/{number}",
+        "source_language": language,
+        "language_name": "Russian",
+        "original_content": content
+    }
+
+
+def test_needs_translation():
+    assert not needs_translation(make_article(1, "text", "en"))
+    assert not needs_translation({**make_article(1, "text"), "translated_content": "done"})
+    assert needs_translation(make_article(1, "text", "ru"))
+    assert not needs_translation(make_article(1, "text", "ru"), skip_native=True)
+    assert needs_translation(make_article(1, "text", "az"), skip_native=True)
+
+
+def test_batches_respect_the_character_budget():
+    texts = [(("ru", str(n)), "Russian", "x" * size) for n, size in enumerate([40, 50, 20, 100, 10])]
+
+    batches = plan_translation_batches(texts, max_chars=100)
+
+    assert [[entry[0][1] for entry in batch] for batch in batches] == [["0", "1"], ["2"], ["3"], ["4"]]
+
+
+def test_shared_content_is_translated_once(database):
+    model = FakeModel()
+    articles = [
+        make_article(1, "Текст один"),
+        make_article(2, "Текст один"),
+        make_article(3, "Текст два"),
+        make_article(4, "English text", "en")
+    ]
+
+    asyncio.run(translate_articles(articles, model))
+
+    assert len(model.batch_prompts) == 1
+    assert model.batch_prompts[0].count("### Text ") == 2
+    assert articles[0]["translated_content"] == articles[1]["translated_content"] == "translation 1"
+    # The text the batch left out is retried on its own
+    assert articles[2]["translated_content"] == "single translation"
+    assert len(model.single_prompts) == 1
+    assert "translated_content" not in articles[3]
+    assert len(database.rows) == 2
+
+
+def test_remembered_translations_are_reused(database):
+    model = FakeModel()
+    asyncio.run(translate_articles([make_article(1, "Текст один")], model))
+    database_rows = dict(database.rows)
+
+    later = make_article(2, "Текст один")
+    asyncio.run(translate_articles([later], model))
+
+    assert len(model.single_prompts) == 1
+    assert later["translated_content"] == "single translation"
+    assert database.rows == database_rows
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Unit tests for the write-behind queue"""
+
+import asyncio
+
+from src.agent.write_behind import WriteBehindQueue
+
+
+class BadRow(Exception):
+    """Stand-in for a row the database rejects"""
+
+
+def make_queue():
+    queue = WriteBehindQueue(sync=False, max_retries=3)
+    written = []
+    calls = []
+
+    async def handler(items):
+        calls.append(list(items))
+        if any(item < 0 for item in items):
+            raise BadRow("negative value")
+        written.extend(items)
+
+    queue.register("rows", handler)
+    return queue, written, calls
+
+
+async def enqueue_and_flush(queue, items):
+    for item in items:
+        await queue.enqueue("rows", item)
+    await queue.flush()
+    await queue.drain()
+
+
+def test_batch_written_in_one_call():
+    queue, written, calls = make_queue()
+    asyncio.run(enqueue_and_flush(queue, list(range(10))))
+
+    assert written == list(range(10))
+    assert len(calls) == 1
+    assert queue.dropped == 0
+
+
+def test_bad_rows_are_isolated_and_dead_lettered():
+    queue, written, calls = make_queue()
+    items = list(range(20))
+    items[3] = -3
+    items[17] = -17
+    asyncio.run(enqueue_and_flush(queue, items))
+
+    assert sorted(written) == sorted(item for item in items if item >= 0)
+    assert queue.flushed == 18
+    assert queue.dropped == 2
+    assert sorted(item for _, item, _ in queue.dead_letters) == [-17, -3]
+    # Bisection needs far fewer calls than writing the rows one by one
+    assert len(calls) < len(items)
+
+
+def test_connection_errors_are_retried_before_dead_lettering():
+    queue = WriteBehindQueue(sync=False, max_retries=2)
+    calls = []
+
+    async def handler(items):
+        calls.append(list(items))
+        raise ConnectionRefusedError("database is down")
+
+    queue.register("rows", handler)
+    asyncio.run(enqueue_and_flush(queue, list(range(5))))
+
+    # The whole batch is retried and then dead-lettered without bisecting
+    assert len(calls) == 2
+    assert all(len(call) == 5 for call in calls)
+    assert queue.dropped == 5
+    assert len(queue.dead_letters) == 5